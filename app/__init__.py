@@ -10,6 +10,7 @@ from app.config.settings import get_config
 from app.extensions import init_extensions
 from app.controllers import register_blueprints
 from app.utils.error_handlers import register_error_handlers
+from app.services.text_extractors import configure_extractor_chain
 import logging.config
 import os
 
@@ -35,6 +36,9 @@ def create_app(config_name='development'):
     # Setup logging
     _setup_logging(app)
     
+    # Configure text extraction before any parse worker is started
+    configure_extractor_chain(app.config.get('TEXT_EXTRACTOR_CHAINS'))
+    
     # Initialize extensions
     init_extensions(app)
     
@@ -44,6 +48,10 @@ def create_app(config_name='development'):
     # Register error handlers
     register_error_handlers(app)
     
+    # Map the stored corpus index before the first request
+    if app.config.get('VECTOR_STORE_PRELOAD'):
+        _preload_corpus_index(app)
+    
     # Log application startup
     app.logger.info(f"RSART application created with config: {config_name}")
     
@@ -59,6 +67,8 @@ def _create_required_directories(app):
     directories = [
         app.config.get('UPLOAD_FOLDER'),
         app.config.get('JOB_DESCRIPTIONS_FOLDER'),
+        app.config.get('PARSE_CACHE_FOLDER'),
+        app.config.get('VECTOR_STORE_FOLDER'),
         app.config.get('LOG_FILE').parent if app.config.get('LOG_FILE') else None
     ]
     
@@ -66,6 +76,21 @@ def _create_required_directories(app):
         if directory:
             directory.mkdir(parents=True, exist_ok=True)
 
+def _preload_corpus_index(app):
+    """
+    Memory-map the current vector store snapshot so the first ranking needs no
+    vectorization. Imported here so apps without preloading skip the matching stack.
+    
+    Args:
+        app: Flask application instance
+    """
+    from app.services.matching_service import preload_corpus_index
+    
+    try:
+        preload_corpus_index(app.config)
+    except Exception as e:
+        app.logger.warning(f"Could not preload corpus index: {e}")
+
 def _setup_logging(app):
     """
     Setup application logging configuration.
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from core.text_extractors import DEFAULT_EXTRACTOR_CHAINS
 
 class BaseConfig:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -9,6 +10,8 @@ class BaseConfig:
     JOB_DESCRIPTIONS_FOLDER = Path('data/job_descriptions')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
     ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
+    ARCHIVE_MAX_MEMBERS = int(os.environ.get('ARCHIVE_MAX_MEMBERS', 10000))
+    ARCHIVE_MAX_MEMBER_SIZE = 16 * 1024 * 1024  # 16MB per extracted file
     
     # Database - Default to SQLite for development
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 'sqlite:///rsart.db')
@@ -22,6 +25,7 @@ class BaseConfig:
     CACHE_TYPE = 'redis' if os.environ.get('REDIS_URL') else 'simple'
     CACHE_REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
     CACHE_DEFAULT_TIMEOUT = 3600
+    CACHE_THRESHOLD = int(os.environ.get('CACHE_THRESHOLD', 1000))  # max entries of the simple cache
     
     # Logging
     LOGGING_CONFIG = Path('app/config/logging.conf')
@@ -35,6 +39,59 @@ class BaseConfig:
     # Resume processing
     TOP_CANDIDATES_COUNT = int(os.environ.get('TOP_CANDIDATES_COUNT', 10))
     SIMILARITY_THRESHOLD = float(os.environ.get('SIMILARITY_THRESHOLD', 0.1))
+    
+    # Matching engine: 'tfidf' (fitted vocabulary) or 'hashing' (stateless, shardable)
+    MATCHING_ENGINE = os.environ.get('MATCHING_ENGINE', 'tfidf')
+    HASHING_N_FEATURES = 2 ** 20
+    MATCHING_SHARD_WORKERS = int(os.environ.get('MATCHING_SHARD_WORKERS', 0))
+    MATCHING_SHARD_SIZE = 500
+    
+    # On-disk snapshots of the corpus index, memory-mapped read-only at startup
+    VECTOR_STORE_ENABLED = os.environ.get('VECTOR_STORE_ENABLED', 'true').lower() == 'true'
+    VECTOR_STORE_FOLDER = Path('data/vector_store')
+    VECTOR_STORE_KEEP_VERSIONS = 2
+    # Map the current snapshot in create_app, so the first ranking served by any
+    # WSGI server needs no vectorization; turn off for CLI-only processes
+    VECTOR_STORE_PRELOAD = os.environ.get('VECTOR_STORE_PRELOAD', 'true').lower() == 'true'
+    
+    # Text extraction backends tried in order per extension (see core.text_extractors)
+    TEXT_EXTRACTOR_CHAINS = DEFAULT_EXTRACTOR_CHAINS
+    
+    # Persist parsed candidates to the database (upserted by content hash)
+    PERSIST_CANDIDATES = os.environ.get('PERSIST_CANDIDATES', 'true').lower() == 'true'
+    CANDIDATE_BATCH_SIZE = 500
+    
+    # Parse cache
+    PARSE_CACHE_ENABLED = os.environ.get('PARSE_CACHE_ENABLED', 'true').lower() == 'true'
+    PARSE_CACHE_FOLDER = Path('data/parse_cache')
+    
+    # Parallel parsing (0 parses inline on the request thread)
+    PARSE_WORKERS = int(os.environ.get('PARSE_WORKERS', os.cpu_count() or 1))
+    
+    # Per-file limits for parse workers (0 disables); workers hitting them are killed and replaced
+    PARSE_TIMEOUT = float(os.environ.get('PARSE_TIMEOUT', 60))  # seconds
+    # Address space a worker may add on top of what it inherits from the forked app
+    # process (which already maps spaCy, scikit-learn and numpy). Address space runs
+    # well above resident memory, so size it from a parse of your largest resumes
+    # (e.g. 1024-2048 MB); too small a value fails every parse with MemoryError
+    PARSE_MEMORY_LIMIT = int(os.environ.get('PARSE_MEMORY_LIMIT_MB', 0)) * 1024 * 1024
+    PARSE_WORKER_MAX_TASKS = int(os.environ.get('PARSE_WORKER_MAX_TASKS', 200))
+    
+    # Background ranking jobs
+    RANKING_JOB_WORKERS = int(os.environ.get('RANKING_JOB_WORKERS', 2))
+    RANKING_JOB_MAX_PENDING = int(os.environ.get('RANKING_JOB_MAX_PENDING', 20))
+    RANKING_JOB_RETENTION = 100
+    
+    # Shortlists cached per (job description content, corpus version, matching settings)
+    RANKING_CACHE_ENABLED = os.environ.get('RANKING_CACHE_ENABLED', 'true').lower() == 'true'
+    RANKING_CACHE_TIMEOUT = int(os.environ.get('RANKING_CACHE_TIMEOUT', 600))  # seconds
+    RANKING_CACHE_MAX_ENTRIES = int(os.environ.get('RANKING_CACHE_MAX_ENTRIES', 200))
+    
+    # Paginated ranking results, stored in the cache
+    RANKING_RESULT_TIMEOUT = int(os.environ.get('RANKING_RESULT_TIMEOUT', 3600))  # seconds
+    RANKING_RESULT_CHUNK_SIZE = 500
+    RANKING_PAGE_SIZE = 50
+    RANKING_PAGE_MAX_SIZE = 500
 
 class DevelopmentConfig(BaseConfig):
     DEBUG = True
@@ -71,6 +128,9 @@ class TestingConfig(BaseConfig):
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
     CACHE_TYPE = 'simple'
+    PARSE_WORKERS = 0
+    VECTOR_STORE_ENABLED = False
+    VECTOR_STORE_PRELOAD = False
 
 def get_config(config_name):
     config_map = {
@@ -1,5 +1,6 @@
-from flask import Blueprint, render_template, current_app
+from flask import Blueprint, Response, render_template, current_app
 from app.services.file_service import FileService
+from app.utils.metrics import REGISTRY
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,4 +42,9 @@ def index():
 @main_bp.route('/health')
 def health_check():
     """Simple health check endpoint"""
-    return {'status': 'ok', 'message': 'RSART is running'}
\ No newline at end of file
+    return {'status': 'ok', 'message': 'RSART is running'}
+
+@main_bp.route('/metrics')
+def metrics():
+    """Pipeline timings and cache counters of this process in the Prometheus text format"""
+    return Response(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
\ No newline at end of file
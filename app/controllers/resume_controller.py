@@ -1,11 +1,21 @@
-from flask import Blueprint, request, render_template, redirect, url_for, flash, jsonify, send_file
+from flask import Blueprint, request, render_template, redirect, url_for, flash, jsonify, send_file, current_app
 from pathlib import Path
+from typing import Callable
+from app.extensions import db
+from app.repositories.candidate_repository import CandidateRepository
 from app.services.resume_parser import ResumeParserFactory
 from app.services.matching_service import ResumeMatchingService
 from app.services.file_service import FileService
+from app.services.parse_cache import ParseCache
+from app.services.parse_pool import ParseOutcome, get_parse_pool
+from app.services.job_queue import get_job_queue
+from app.services.ranking_cache import RankingCache, matching_settings
+from app.services.ranking_store import RankingStore
 from app.models.job_description import JobDescription
 from app.utils.decorators import login_required
-from app.utils.exceptions import ResumeParsingError, MatchingServiceError, FileServiceError
+from app.utils.metrics import JOB_DESCRIPTION_PARSE_SECONDS, RANKING_SECONDS, RENDER_SECONDS
+from app.utils.exceptions import (ResumeParsingError, MatchingServiceError, FileServiceError, JobQueueError,
+                                  ValidationError)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,6 +23,7 @@ resume_bp = Blueprint('resume', __name__)
 
 @resume_bp.route('/process', methods=['POST'])
 @login_required
+@RANKING_SECONDS.time(endpoint='process')
 def process_resumes():
     """Process resumes against selected job description"""
     try:
@@ -29,6 +40,18 @@ def process_resumes():
             flash('Selected job description not found', 'error')
             return redirect(url_for('main.index'))
         
+        # Serve the shortlist of an unchanged job description and corpus from the cache
+        matching_service = ResumeMatchingService()
+        ranking_cache, cache_key = _ranking_cache_key(file_service, job_file_path, matching_service)
+        cached_candidates = ranking_cache.get(cache_key) if ranking_cache else None
+        if cached_candidates is not None:
+            logger.info(f"Served {len(cached_candidates)} candidates from the ranking cache")
+            with RENDER_SECONDS.time(template='results.html'):
+                return render_template('results.html',
+                                     candidates=cached_candidates,
+                                     job_description=JobDescription(title=job_file_path.stem,
+                                                                    file_path=job_file_path))
+        
         # Parse job description
         job_description = _parse_job_description(job_file_path)
         
@@ -45,20 +68,187 @@ def process_resumes():
             return redirect(url_for('main.index'))
         
         # Match candidates
-        matching_service = ResumeMatchingService()
         ranked_candidates = matching_service.match_candidates(job_description, candidates)
+        if ranking_cache:
+            ranking_cache.set(cache_key, ranked_candidates)
         
         logger.info(f"Successfully processed {len(ranked_candidates)} candidates")
         
-        return render_template('results.html', 
-                             candidates=ranked_candidates,
-                             job_description=job_description)
+        with RENDER_SECONDS.time(template='results.html'):
+            return render_template('results.html', 
+                                 candidates=ranked_candidates,
+                                 job_description=job_description)
         
     except Exception as e:
         logger.error(f"Error processing resumes: {e}")
         flash('Failed to process resumes. Please try again.', 'error')
         return redirect(url_for('main.index'))
 
+@resume_bp.route('/jobs', methods=['POST'])
+@login_required
+def submit_ranking_job():
+    """Queue a background ranking job and return its id"""
+    try:
+        job_description_file = request.form.get('job_description')
+        if not job_description_file:
+            return jsonify({'error': 'Please select a job description'}), 400
+        
+        file_service = FileService()
+        job_file_path = file_service.job_descriptions_folder / job_description_file
+        if not job_file_path.exists():
+            return jsonify({'error': 'Selected job description not found'}), 404
+        
+        job = get_job_queue().submit(job_file_path.stem, _run_ranking_job, job_file_path)
+        
+        return jsonify({
+            'job_id': job.id,
+            'status_url': url_for('resume.ranking_job_status', job_id=job.id),
+            'result_url': url_for('resume.ranking_job_result', job_id=job.id)
+        }), 202
+        
+    except JobQueueError as e:
+        return jsonify({'error': str(e)}), 503
+    except Exception as e:
+        logger.error(f"Error submitting ranking job: {e}")
+        return jsonify({'error': 'Failed to submit ranking job'}), 500
+
+@resume_bp.route('/jobs/<job_id>')
+@login_required
+def ranking_job_status(job_id):
+    """Report progress of a background ranking job"""
+    job = get_job_queue().get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict())
+
+@resume_bp.route('/jobs/<job_id>/result')
+@login_required
+def ranking_job_result(job_id):
+    """Serve ranked candidates of a finished ranking job"""
+    job = get_job_queue().get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    if job.status == job.FAILED:
+        return jsonify({'error': job.error, 'status': job.status}), 500
+    
+    if job.status != job.COMPLETED:
+        return jsonify(job.to_dict()), 202
+    
+    return jsonify(job.result)
+
+@resume_bp.route('/rankings', methods=['POST'])
+@login_required
+@RANKING_SECONDS.time(endpoint='rankings')
+def create_ranking():
+    """Rank every resume against a job description and return the first page of the ranking"""
+    try:
+        job_description_file = request.form.get('job_description')
+        if not job_description_file:
+            return jsonify({'error': 'Please select a job description'}), 400
+        
+        file_service = FileService()
+        job_file_path = file_service.job_descriptions_folder / job_description_file
+        if not job_file_path.exists():
+            return jsonify({'error': 'Selected job description not found'}), 404
+        
+        limit = _page_limit()
+        job_description = _parse_job_description(job_file_path)
+        
+        resume_files = file_service.get_resume_files()
+        if not resume_files:
+            return jsonify({'error': 'No resume files found. Please upload some resumes first.'}), 400
+        
+        candidates = _parse_resume_files(resume_files)
+        if not candidates:
+            return jsonify({'error': 'No resumes could be parsed successfully'}), 400
+        
+        matching_service = ResumeMatchingService()
+        ranked_candidates = matching_service.match_candidates(job_description, candidates)
+        
+        # Clients page through the whole pool, not just the shortlist
+        ranking_store = RankingStore()
+        ranking_id = ranking_store.save(job_description.display_name, ranked_candidates.full_ranking())
+        
+        return jsonify(_ranking_page(ranking_store, ranking_id, None, limit)), 201
+        
+    except ValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    except MatchingServiceError as e:
+        logger.error(f"Matching error creating ranking: {e}")
+        return jsonify({'error': str(e)}), 500
+    except Exception as e:
+        logger.error(f"Error creating ranking: {e}")
+        return jsonify({'error': 'Failed to rank resumes'}), 500
+
+@resume_bp.route('/rankings/<ranking_id>')
+@login_required
+def ranking_page(ranking_id):
+    """Serve one page of a stored ranking; pass the previous page's next_cursor to continue"""
+    try:
+        page = _ranking_page(RankingStore(), ranking_id, request.args.get('cursor'), _page_limit())
+    except ValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    if page is None:
+        return jsonify({'error': 'Ranking not found or expired'}), 404
+    return jsonify(page)
+
+@resume_bp.route('/process_batch', methods=['POST'])
+@login_required
+@RANKING_SECONDS.time(endpoint='process_batch')
+def process_resumes_batch():
+    """Rank the resume pool against several job descriptions in one pass"""
+    try:
+        file_service = FileService()
+        
+        # Default to every open requisition when none are selected
+        job_description_files = request.form.getlist('job_descriptions')
+        if job_description_files:
+            job_file_paths = [file_service.job_descriptions_folder / name for name in job_description_files]
+        else:
+            job_file_paths = file_service.get_job_description_files()
+        
+        missing = [path.name for path in job_file_paths if not path.exists()]
+        if missing:
+            return jsonify({'error': f"Job descriptions not found: {', '.join(missing)}"}), 404
+        
+        if not job_file_paths:
+            return jsonify({'error': 'No job descriptions found'}), 400
+        
+        job_descriptions = [_parse_job_description(path) for path in job_file_paths]
+        
+        resume_files = file_service.get_resume_files()
+        if not resume_files:
+            return jsonify({'error': 'No resume files found. Please upload some resumes first.'}), 400
+        
+        candidates = _parse_resume_files(resume_files)
+        if not candidates:
+            return jsonify({'error': 'No resumes could be parsed successfully'}), 400
+        
+        matching_service = ResumeMatchingService()
+        shortlists = matching_service.match_candidates_batch(job_descriptions, candidates)
+        
+        logger.info(f"Successfully batch processed {len(candidates)} candidates for {len(job_descriptions)} jobs")
+        
+        return jsonify({
+            'results': [
+                {
+                    'job_description': job_description.display_name,
+                    'file': job_description.file_path.name,
+                    'candidates': [candidate.to_dict() for candidate in shortlists[job_description.id]]
+                }
+                for job_description in job_descriptions
+            ]
+        })
+        
+    except MatchingServiceError as e:
+        logger.error(f"Matching error in batch processing: {e}")
+        return jsonify({'error': str(e)}), 500
+    except Exception as e:
+        logger.error(f"Error batch processing resumes: {e}")
+        return jsonify({'error': 'Failed to process resumes'}), 500
+
 @resume_bp.route('/download/<path:filename>')
 @login_required
 def download_resume(filename):
@@ -71,7 +261,8 @@ def download_resume(filename):
             flash('File not found', 'error')
             return redirect(url_for('main.index'))
         
-        return send_file(file_path, as_attachment=True)
+        return send_file(file_path.resolve(), as_attachment=True,
+                         download_name=file_service.get_display_name(file_path))
         
     except Exception as e:
         logger.error(f"Error downloading file {filename}: {e}")
@@ -95,11 +286,13 @@ def upload_resume():
         if not file_service.is_allowed_file(file.filename):
             return jsonify({'error': 'File type not allowed'}), 400
         
-        file_path = file_service.save_uploaded_file(file)
+        stored_file = file_service.store_stream(file.stream, file.filename)
         
         return jsonify({
-            'message': 'File uploaded successfully',
-            'filename': file_path.name
+            'message': 'File already uploaded' if stored_file.duplicate else 'File uploaded successfully',
+            'filename': stored_file.path.name,
+            'display_name': stored_file.display_name,
+            'duplicate': stored_file.duplicate
         })
         
     except FileServiceError as e:
@@ -109,18 +302,183 @@ def upload_resume():
         logger.error(f"Upload error: {e}")
         return jsonify({'error': 'Upload failed'}), 500
 
+@resume_bp.route('/upload_archive', methods=['POST'])
+@login_required
+def upload_archive():
+    """
+    Upload a zip or tar archive of resumes, parsing each new member as it is
+    stored when the parse cache or candidate database will keep the result
+    """
+    try:
+        if 'file' not in request.files:
+            return jsonify({'error': 'No file provided'}), 400
+        
+        archive = request.files['file']
+        if archive.filename == '':
+            return jsonify({'error': 'No file selected'}), 400
+        
+        file_service = FileService()
+        parse_cache = ParseCache() if current_app.config.get('PARSE_CACHE_ENABLED') else None
+        persist_candidates = current_app.config.get('PERSIST_CANDIDATES')
+        # Parse results are only worth computing when something keeps them
+        parse_pool = get_parse_pool() if parse_cache or persist_candidates else None
+        
+        members = []
+        parse_futures = {}
+        archive_members = file_service.iter_archive_members(
+            archive.stream, max_members=current_app.config.get('ARCHIVE_MAX_MEMBERS')
+        )
+        
+        # One manifest write and corpus version bump for the whole archive
+        with file_service.batch_updates():
+            for member_name, member_file in archive_members:
+                member = {'name': member_name}
+                members.append(member)
+                
+                if not file_service.is_allowed_file(member_name):
+                    member.update(status='skipped', error='File type not allowed')
+                    continue
+                
+                try:
+                    stored_file = file_service.store_stream(
+                        member_file, member_name,
+                        max_size=current_app.config.get('ARCHIVE_MAX_MEMBER_SIZE')
+                    )
+                except FileServiceError as e:
+                    member.update(status='failed', error=str(e))
+                    continue
+                
+                member.update(
+                    status='duplicate' if stored_file.duplicate else 'stored',
+                    filename=stored_file.path.name,
+                    display_name=stored_file.display_name
+                )
+                
+                # Hand new content to the parse workers while extraction continues
+                if parse_pool and stored_file.path not in parse_futures and \
+                        not (parse_cache and parse_cache.contains(stored_file.path)):
+                    parse_futures[stored_file.path] = parse_pool.submit(stored_file.path)
+        
+        outcomes = {}
+        for file_path, future in parse_futures.items():
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = ParseOutcome(file_path=file_path, error=str(e))
+            
+            if outcome.ok and parse_cache:
+                parse_cache.put(file_path, outcome.candidate)
+            outcomes[file_path.name] = outcome
+        
+        if persist_candidates:
+            display_names = {member['filename']: member['display_name'] for member in members if 'filename' in member}
+            parsed = [outcome.candidate for outcome in outcomes.values() if outcome.ok]
+            for candidate in parsed:
+                candidate.source_name = display_names.get(candidate.resume_path.name)
+            _persist_candidates(parsed)
+        
+        for member in members:
+            if member.get('filename') is None or not parse_pool:
+                continue
+            outcome = outcomes.get(member['filename'])
+            member['parsed'] = outcome.ok if outcome else True
+            if outcome and not outcome.ok:
+                member['error'] = outcome.error
+        
+        summary = {}
+        for member in members:
+            summary[member['status']] = summary.get(member['status'], 0) + 1
+        summary['parse_failed'] = sum(1 for member in members if member.get('parsed') is False)
+        
+        logger.info(f"Processed archive {archive.filename}: {summary}")
+        return jsonify({'members': members, 'summary': summary})
+        
+    except FileServiceError as e:
+        logger.error(f"Archive upload error: {e}")
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Archive upload error: {e}")
+        return jsonify({'error': 'Archive upload failed'}), 500
+
+@RANKING_SECONDS.time(endpoint='ranking_job')
+def _run_ranking_job(job, job_file_path: Path) -> dict:
+    """Background ranking pipeline reporting progress on the job"""
+    file_service = FileService()
+    matching_service = ResumeMatchingService()
+    ranking_cache, cache_key = _ranking_cache_key(file_service, job_file_path, matching_service)
+    cached_candidates = ranking_cache.get(cache_key) if ranking_cache else None
+    if cached_candidates is not None:
+        logger.info(f"Ranking job {job.id} served {len(cached_candidates)} candidates from the ranking cache")
+        return {
+            'job_description': job_file_path.stem,
+            'candidates': [candidate.to_dict() for candidate in cached_candidates]
+        }
+    
+    job.update(stage='parsing_job_description')
+    job_description = _parse_job_description(job_file_path)
+    
+    resume_files = file_service.get_resume_files()
+    job.update(stage='parsing_resumes', files_total=len(resume_files))
+    candidates = _parse_resume_files(resume_files, on_parsed=job.record_file)
+    if not candidates:
+        raise ResumeParsingError('No resumes could be parsed successfully')
+    
+    job.update(stage='matching')
+    ranked_candidates = matching_service.match_candidates(job_description, candidates)
+    if ranking_cache:
+        ranking_cache.set(cache_key, ranked_candidates)
+    
+    logger.info(f"Ranking job {job.id} processed {len(ranked_candidates)} candidates")
+    return {
+        'job_description': job_description.display_name,
+        'candidates': [candidate.to_dict() for candidate in ranked_candidates]
+    }
+
+def _ranking_cache_key(file_service: FileService, job_file_path: Path, matching_service):
+    """
+    Return (ranking cache, key) for ranking the current corpus against a job
+    description, or (None, None) when RANKING_CACHE_ENABLED is off. The corpus
+    version is read before parsing, so uploads during a ranking make its result
+    unreachable rather than stale.
+    """
+    if not current_app.config.get('RANKING_CACHE_ENABLED'):
+        return None, None
+    
+    ranking_cache = RankingCache()
+    key = ranking_cache.key(job_file_path, file_service.corpus_version(), matching_settings(matching_service))
+    return ranking_cache, key
+
+def _page_limit() -> int:
+    """Page size from the limit query argument, bounded by RANKING_PAGE_MAX_SIZE"""
+    try:
+        limit = int(request.args.get('limit', current_app.config.get('RANKING_PAGE_SIZE', 50)))
+    except ValueError:
+        raise ValidationError('limit must be an integer')
+    if limit < 1:
+        raise ValidationError('limit must be positive')
+    return min(limit, current_app.config.get('RANKING_PAGE_MAX_SIZE', 500))
+
+def _ranking_page(ranking_store: RankingStore, ranking_id: str, cursor, limit: int):
+    """A page of a stored ranking with a URL for the next one"""
+    page = ranking_store.page(ranking_id, cursor, limit)
+    if page is not None:
+        page['next_url'] = url_for('resume.ranking_page', ranking_id=ranking_id, cursor=page['next_cursor'],
+                                   limit=limit) if page['next_cursor'] else None
+    return page
+
 def _parse_job_description(file_path: Path) -> JobDescription:
     """Parse job description file"""
     try:
-        # Simple text extraction for job description
-        if file_path.suffix.lower() == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        else:
-            # Use resume parser for other formats
-            parser = ResumeParserFactory.get_parser(file_path.suffix)
-            candidate = parser.parse(file_path)
-            content = candidate.resume_text
+        with JOB_DESCRIPTION_PARSE_SECONDS.time(extension=file_path.suffix.lower() or 'none'):
+            # Simple text extraction for job description
+            if file_path.suffix.lower() == '.txt':
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            else:
+                # Use resume parser for other formats
+                parser = ResumeParserFactory.get_parser(file_path.suffix)
+                candidate = parser.parse(file_path)
+                content = candidate.resume_text
         
         return JobDescription(
             title=file_path.stem,
@@ -132,18 +490,60 @@ def _parse_job_description(file_path: Path) -> JobDescription:
         logger.error(f"Error parsing job description {file_path}: {e}")
         raise
 
-def _parse_resume_files(resume_files: list) -> list:
-    """Parse multiple resume files"""
-    candidates = []
+def _parse_resume_files(resume_files: list, on_parsed: Callable[[bool], None] = None) -> list:
+    """
+    Parse multiple resume files, reusing cached results for unchanged files.
+    on_parsed is called once per file with whether it parsed successfully.
+    """
+    parse_cache = ParseCache() if current_app.config.get('PARSE_CACHE_ENABLED') else None
+    candidates = [None] * len(resume_files)
+    pending = []
     
-    for resume_file in resume_files:
-        try:
-            parser = ResumeParserFactory.get_parser(resume_file.suffix)
-            candidate = parser.parse(resume_file)
-            candidates.append(candidate)
-            
-        except Exception as e:
-            logger.warning(f"Failed to parse resume {resume_file}: {e}")
+    for index, resume_file in enumerate(resume_files):
+        candidate = parse_cache.get(resume_file) if parse_cache else None
+        if candidate is not None:
+            candidates[index] = candidate
+            if on_parsed:
+                on_parsed(True)
+        else:
+            pending.append(index)
+    
+    logger.info(f"Parse cache hits: {len(resume_files) - len(pending)}/{len(resume_files)}")
+    
+    # Parse new or changed files in parallel
+    outcomes = get_parse_pool().parse_many(
+        [resume_files[index] for index in pending],
+        on_result=(lambda outcome: on_parsed(outcome.ok)) if on_parsed else None
+    )
+    for index, outcome in zip(pending, outcomes):
+        if not outcome.ok:
+            logger.warning(f"Failed to parse resume {outcome.file_path}: {outcome.error}")
             continue
+        
+        if parse_cache:
+            parse_cache.put(outcome.file_path, outcome.candidate)
+        candidates[index] = outcome.candidate
+    
+    # Stored files are named by content hash; show the original upload name
+    display_names = FileService().get_display_names()
+    for candidate in candidates:
+        if candidate is not None and candidate.resume_path:
+            candidate.source_name = display_names.get(candidate.resume_path.name)
     
-    return candidates
\ No newline at end of file
+    candidates = [candidate for candidate in candidates if candidate is not None]
+    if current_app.config.get('PERSIST_CANDIDATES'):
+        _persist_candidates(candidates)
+    return candidates
+
+def _persist_candidates(candidates: list):
+    """Store candidates not yet in the database; failures never break the request"""
+    # Without a content hash a candidate cannot be matched to its stored row,
+    # and would be inserted again on every request
+    hashed = [candidate for candidate in candidates if candidate.content_hash]
+    try:
+        repository = CandidateRepository()
+        stored = repository.stored_content_hashes(candidate.content_hash for candidate in hashed)
+        repository.upsert(candidate for candidate in hashed if candidate.content_hash not in stored)
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Could not persist parsed candidates: {e}")
\ No newline at end of file
@@ -16,7 +16,9 @@ class Candidate:
     experience: List[str] = field(default_factory=list)
     competencies: Dict[str, List[str]] = field(default_factory=dict)
     resume_path: Optional[Path] = None
+    source_name: Optional[str] = None
     resume_text: Optional[str] = None
+    content_hash: Optional[str] = None
     score: Optional[float] = None
     rank: Optional[int] = None
     
@@ -25,6 +27,8 @@ class Candidate:
         """Return display name or filename if name not extracted"""
         if self.name:
             return self.name
+        if self.source_name:
+            return Path(self.source_name).stem
         if self.resume_path:
             return self.resume_path.stem
         return f"Candidate_{self.id[:8]}"
@@ -46,6 +50,28 @@ class Candidate:
             'experience': self.experience,
             'competencies': self.competencies,
             'resume_path': str(self.resume_path) if self.resume_path else None,
+            'source_name': self.source_name,
+            'content_hash': self.content_hash,
             'score': self.score,
             'rank': self.rank
-        }
\ No newline at end of file
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Candidate':
+        """Create candidate from a dictionary produced by to_dict"""
+        return cls(
+            id=data.get('id') or str(uuid.uuid4()),
+            name=data.get('name'),
+            email=data.get('email'),
+            phone=data.get('phone'),
+            skills=data.get('skills') or [],
+            education=data.get('education') or [],
+            experience=data.get('experience') or [],
+            competencies=data.get('competencies') or {},
+            resume_path=Path(data['resume_path']) if data.get('resume_path') else None,
+            source_name=data.get('source_name'),
+            resume_text=data.get('resume_text'),
+            content_hash=data.get('content_hash'),
+            score=data.get('score'),
+            rank=data.get('rank')
+        )
\ No newline at end of file
@@ -1,5 +1,6 @@
 from app.extensions import db
 from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 import json
 from pathlib import Path
@@ -7,39 +8,53 @@ from pathlib import Path
 class CandidateModel(db.Model):
     __tablename__ = 'candidates'
     
+    # Large columns are deferred: loaded on first access, or up front with
+    # undefer_group('details') / undefer(CandidateModel.resume_text)
     id = Column(String(36), primary_key=True)
     name = Column(String(100))
     email = Column(String(100))
     phone = Column(String(20))
-    skills = Column(Text)  # JSON string
-    education = Column(Text)  # JSON string
-    experience = Column(Text)  # JSON string
-    competencies = Column(Text)  # JSON string
+    skills = deferred(Column(Text), group='details')  # JSON string
+    education = deferred(Column(Text), group='details')  # JSON string
+    experience = deferred(Column(Text), group='details')  # JSON string
+    competencies = deferred(Column(Text), group='details')  # JSON string
     resume_path = Column(String(255))
-    resume_text = Column(Text)
+    source_name = Column(String(255))
+    content_hash = Column(String(64), index=True, unique=True)
+    resume_text = deferred(Column(Text))
     score = Column(Float)
     rank = Column(Integer)
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=func.now(), index=True)
     is_active = Column(Boolean, default=True)
     
-    def to_candidate(self):
-        """Convert database model to Candidate dataclass"""
+    def to_candidate(self, include_details: bool = True):
+        """
+        Convert database model to Candidate dataclass.
+        With include_details=False the deferred columns (resume text and JSON
+        lists) are not touched, so they are never loaded.
+        """
         from app.models.candidate import Candidate
         
-        return Candidate(
+        candidate = Candidate(
             id=self.id,
             name=self.name,
             email=self.email,
             phone=self.phone,
-            skills=json.loads(self.skills) if self.skills else [],
-            education=json.loads(self.education) if self.education else [],
-            experience=json.loads(self.experience) if self.experience else [],
-            competencies=json.loads(self.competencies) if self.competencies else {},
             resume_path=Path(self.resume_path) if self.resume_path else None,
-            resume_text=self.resume_text,
+            source_name=self.source_name,
+            content_hash=self.content_hash,
             score=self.score,
             rank=self.rank
         )
+        
+        if include_details:
+            candidate.skills = json.loads(self.skills) if self.skills else []
+            candidate.education = json.loads(self.education) if self.education else []
+            candidate.experience = json.loads(self.experience) if self.experience else []
+            candidate.competencies = json.loads(self.competencies) if self.competencies else {}
+            candidate.resume_text = self.resume_text
+        
+        return candidate
     
     @classmethod
     def from_candidate(cls, candidate):
@@ -54,6 +69,8 @@ class CandidateModel(db.Model):
             experience=json.dumps(candidate.experience),
             competencies=json.dumps(candidate.competencies),
             resume_path=str(candidate.resume_path) if candidate.resume_path else None,
+            source_name=candidate.source_name,
+            content_hash=candidate.content_hash,
             resume_text=candidate.resume_text,
             score=candidate.score,
             rank=candidate.rank
@@ -0,0 +1,199 @@
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import logging
+from flask import current_app
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only, undefer, undefer_group
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.database import CandidateModel
+
+logger = logging.getLogger(__name__)
+
+class CandidateRepository:
+    """
+    Persistence of parsed candidates through CandidateModel.
+
+    Writes go through bulk INSERT/UPDATE statements in batches, one commit per
+    batch. Reads leave the resume text and JSON list columns unloaded unless
+    details are asked for.
+    """
+
+    # Left to column defaults on insert and kept as stored on update
+    _DEFAULTED = {'created_at', 'is_active'}
+
+    def __init__(self, session=None, batch_size: int = None):
+        self.session = session or db.session
+        self.batch_size = batch_size or current_app.config.get('CANDIDATE_BATCH_SIZE', 500)
+
+    def bulk_insert(self, candidates: Iterable[Candidate]) -> int:
+        """Insert new candidates in batches and return how many were written"""
+        inserted = 0
+        for batch in self._batches(candidates):
+            self.session.bulk_insert_mappings(CandidateModel, [self._to_row(candidate) for candidate in batch])
+            self.session.commit()
+            inserted += len(batch)
+
+        logger.info(f"Inserted {inserted} candidates")
+        return inserted
+
+    def upsert(self, candidates: Iterable[Candidate]) -> Tuple[int, int]:
+        """
+        Insert or update candidates in batches, matching stored rows by content
+        hash (or by id for candidates without one). Returns (inserted, updated).
+
+        A batch that races another writer inserting the same content hash hits
+        the unique constraint; it is rolled back and retried once, when those
+        rows are found and updated instead.
+        """
+        inserted = updated = 0
+        for batch in self._batches(candidates):
+            # Last occurrence wins when the same resume appears twice in a batch
+            by_key: Dict[str, Candidate] = {}
+            for candidate in batch:
+                by_key[self._key(candidate)] = candidate
+
+            try:
+                batch_inserted, batch_updated = self._upsert_batch(by_key)
+            except IntegrityError:
+                self.session.rollback()
+                logger.info("Candidate upsert raced a concurrent insert, retrying batch")
+                batch_inserted, batch_updated = self._upsert_batch(by_key)
+
+            inserted += batch_inserted
+            updated += batch_updated
+
+        logger.info(f"Upserted candidates: {inserted} inserted, {updated} updated")
+        return inserted, updated
+
+    def get(self, candidate_id: str, include_details: bool = True) -> Optional[Candidate]:
+        """Return one candidate, with text and lists loaded by default"""
+        query = self.session.query(CandidateModel).filter(CandidateModel.id == candidate_id)
+        if include_details:
+            query = query.options(undefer_group('details'), undefer(CandidateModel.resume_text))
+        model = query.one_or_none()
+        return model.to_candidate(include_details) if model else None
+
+    def list_candidates(self, limit: int = None, offset: int = 0,
+                        include_details: bool = False) -> List[Candidate]:
+        """Active candidates, newest first; summary columns only unless include_details"""
+        query = self._active_query(include_details).order_by(CandidateModel.created_at.desc(),
+                                                             CandidateModel.id)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return [model.to_candidate(include_details) for model in query]
+
+    def iter_candidates(self, include_details: bool = False) -> Iterator[Candidate]:
+        """Stream all active candidates in batch_size chunks without holding them all"""
+        query = self._active_query(include_details).order_by(CandidateModel.created_at, CandidateModel.id)
+        for model in query.yield_per(self.batch_size):
+            yield model.to_candidate(include_details)
+
+    def find_by_content_hashes(self, content_hashes: Iterable[str],
+                               include_details: bool = False) -> Dict[str, Candidate]:
+        """Stored candidates keyed by content hash"""
+        found = {}
+        content_hashes = list(content_hashes)
+        for start in range(0, len(content_hashes), self.batch_size):
+            chunk = content_hashes[start:start + self.batch_size]
+            query = self._active_query(include_details).filter(CandidateModel.content_hash.in_(chunk))
+            for model in query:
+                found[model.content_hash] = model.to_candidate(include_details)
+        return found
+
+    def stored_content_hashes(self, content_hashes: Iterable[str]) -> set:
+        """Subset of the given content hashes that already have a stored row"""
+        stored = set()
+        content_hashes = list(content_hashes)
+        for start in range(0, len(content_hashes), self.batch_size):
+            chunk = content_hashes[start:start + self.batch_size]
+            rows = self.session.query(CandidateModel.content_hash).filter(CandidateModel.content_hash.in_(chunk))
+            stored.update(content_hash for content_hash, in rows)
+        return stored
+
+    def created_since(self, since: datetime, include_details: bool = False) -> List[Candidate]:
+        """Candidates stored after a point in time, for incremental syncs"""
+        query = self._active_query(include_details).filter(CandidateModel.created_at > since)
+        return [model.to_candidate(include_details) for model in query.order_by(CandidateModel.created_at)]
+
+    def count(self) -> int:
+        return self._active_query(False).count()
+
+    def _active_query(self, include_details: bool):
+        query = self.session.query(CandidateModel).filter(CandidateModel.is_active.is_(True))
+        if include_details:
+            query = query.options(undefer_group('details'), undefer(CandidateModel.resume_text))
+        return query
+
+    def _upsert_batch(self, by_key: Dict[str, Candidate]) -> Tuple[int, int]:
+        existing = self._existing_ids(by_key.values())
+
+        new_rows = []
+        changed_rows = []
+        for key, candidate in by_key.items():
+            row = self._to_row(candidate)
+            stored_id = existing.get(key)
+            if stored_id is None:
+                new_rows.append(row)
+            else:
+                # Keep the stored row's id so references to it stay valid
+                row['id'] = stored_id
+                changed_rows.append(row)
+
+        if new_rows:
+            self.session.bulk_insert_mappings(CandidateModel, new_rows)
+        if changed_rows:
+            self.session.bulk_update_mappings(CandidateModel, changed_rows)
+        self.session.commit()
+        return len(new_rows), len(changed_rows)
+
+    def _existing_ids(self, candidates: Iterable[Candidate]) -> Dict[str, str]:
+        """Map upsert keys of candidates already stored to their row ids"""
+        candidates = list(candidates)
+        hashes = {candidate.content_hash for candidate in candidates if candidate.content_hash}
+        ids = {candidate.id for candidate in candidates if not candidate.content_hash}
+
+        conditions = []
+        if hashes:
+            conditions.append(CandidateModel.content_hash.in_(hashes))
+        if ids:
+            conditions.append(CandidateModel.id.in_(ids))
+
+        rows = (self.session.query(CandidateModel)
+                .options(load_only(CandidateModel.id, CandidateModel.content_hash))
+                .filter(or_(*conditions)))
+
+        existing = {}
+        for row in rows:
+            if row.content_hash in hashes:
+                existing[f"hash:{row.content_hash}"] = row.id
+            if row.id in ids:
+                existing[f"id:{row.id}"] = row.id
+        return existing
+
+    @staticmethod
+    def _key(candidate: Candidate) -> str:
+        return f"hash:{candidate.content_hash}" if candidate.content_hash else f"id:{candidate.id}"
+
+    @staticmethod
+    def _to_row(candidate: Candidate) -> Dict:
+        """Column values for a candidate, built through CandidateModel.from_candidate"""
+        model = CandidateModel.from_candidate(candidate)
+        return {
+            column.key: getattr(model, column.key)
+            for column in CandidateModel.__table__.columns
+            if column.key not in CandidateRepository._DEFAULTED
+        }
+
+    def _batches(self, candidates: Iterable[Candidate]) -> Iterator[List[Candidate]]:
+        batch = []
+        for candidate in candidates:
+            batch.append(candidate)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
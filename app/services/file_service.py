@@ -1,20 +1,60 @@
+import hashlib
+import json
+import os
 import shutil
-from pathlib import Path
-from typing import List, Optional
+import tarfile
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 import logging
 from werkzeug.utils import secure_filename
 from app.utils.exceptions import FileServiceError
 from flask import current_app
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+@dataclass
+class StoredFile:
+    """Result of storing an uploaded file under its content hash"""
+    
+    path: Path
+    content_hash: str
+    display_name: str
+    duplicate: bool
+
+@dataclass
+class _UploadBatch:
+    """Manifest names and corpus changes recorded by store_stream until the batch is written"""
+    
+    manifest: Dict[str, dict]
+    names: Dict[str, List[str]] = field(default_factory=dict)
+    corpus_changed: bool = False
+
 class FileService:
     """Service for handling file operations"""
     
+    CHUNK_SIZE = 64 * 1024
+    MANIFEST_NAME = 'manifest.json'
+    CORPUS_VERSION_NAME = '.corpus_version'
+    
+    _manifest_lock = threading.Lock()
+    
     def __init__(self):
         self.upload_folder = Path(current_app.config['UPLOAD_FOLDER'])
         self.job_descriptions_folder = Path(current_app.config['JOB_DESCRIPTIONS_FOLDER'])
         self.allowed_extensions = current_app.config['ALLOWED_EXTENSIONS']
+        self._batch: Optional[_UploadBatch] = None
         
         # Ensure directories exist
         self.upload_folder.mkdir(parents=True, exist_ok=True)
@@ -22,32 +62,141 @@ class FileService:
     
     def save_uploaded_file(self, file, filename: str = None) -> Path:
         """Save uploaded file and return path"""
+        return self.store_stream(file.stream, filename or file.filename).path
+    
+    def store_stream(self, stream: BinaryIO, filename: str, max_size: int = None) -> StoredFile:
+        """
+        Stream a file to disk while hashing it and store it as <sha256>.<ext>.
+        
+        Byte-identical uploads share one stored file; the original names are
+        kept in the upload manifest for display and download. Files larger
+        than max_size bytes are rejected.
+        """
         try:
-            if not filename:
-                filename = file.filename
-            
             if not self.is_allowed_file(filename):
                 raise FileServiceError(f"File type not allowed: {filename}")
             
             safe_filename = secure_filename(filename)
-            file_path = self.upload_folder / safe_filename
+            extension = safe_filename.rsplit('.', 1)[1].lower()
+            
+            digest = hashlib.sha256()
+            fd, tmp_path = tempfile.mkstemp(dir=self.upload_folder, prefix='.upload-', suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file:
+                    size = 0
+                    for chunk in iter(lambda: stream.read(self.CHUNK_SIZE), b''):
+                        size += len(chunk)
+                        if max_size is not None and size > max_size:
+                            raise FileServiceError(f"File exceeds {max_size} bytes: {filename}")
+                        digest.update(chunk)
+                        tmp_file.write(chunk)
+                
+                content_hash = digest.hexdigest()
+                file_path = self.upload_folder / f"{content_hash}.{extension}"
+                duplicate = not self._publish(Path(tmp_path), file_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
             
-            # Handle duplicate filenames
-            counter = 1
-            while file_path.exists():
-                name, ext = safe_filename.rsplit('.', 1)
-                safe_filename = f"{name}_{counter}.{ext}"
-                file_path = self.upload_folder / safe_filename
-                counter += 1
+            with self.batch_updates():
+                display_name = self._add_manifest_name(file_path.name, safe_filename)
+                if not duplicate:
+                    self._batch.corpus_changed = True
             
-            file.save(file_path)
-            logger.info(f"Saved uploaded file: {file_path}")
-            return file_path
+            if duplicate:
+                logger.info(f"Upload {safe_filename} duplicates stored file {file_path.name}")
+            else:
+                logger.info(f"Saved uploaded file: {file_path}")
             
+            return StoredFile(
+                path=file_path,
+                content_hash=content_hash,
+                display_name=display_name,
+                duplicate=duplicate
+            )
+            
+        except FileServiceError:
+            raise
         except Exception as e:
             logger.error(f"Error saving uploaded file: {e}")
             raise FileServiceError(f"Failed to save file: {e}")
     
+    @contextmanager
+    def batch_updates(self):
+        """
+        Collect the manifest names and corpus version change of files stored
+        inside the block and write them once when it exits, so storing many
+        files (e.g. an archive) rewrites the manifest once rather than per file.
+        """
+        if self._batch is not None:
+            yield
+            return
+        
+        self._batch = _UploadBatch(manifest=self._read_manifest())
+        try:
+            yield
+        finally:
+            # Files stored before an error are on disk and must be recorded
+            batch, self._batch = self._batch, None
+            self._write_batch(batch)
+    
+    def iter_archive_members(self, stream: BinaryIO,
+                             max_members: int = None) -> Iterator[Tuple[str, BinaryIO]]:
+        """
+        Yield (file name, file object) for each regular file in a zip or tar archive.
+        
+        Members are read one at a time straight from the archive stream; tar
+        archives (optionally gzip/bz2/xz compressed) are read in streaming mode
+        and zip members are decompressed lazily from the central directory.
+        """
+        try:
+            is_zip = zipfile.is_zipfile(stream)
+            stream.seek(0)
+            
+            if is_zip:
+                with zipfile.ZipFile(stream) as archive:
+                    members = (
+                        (info.filename, info) for info in archive.infolist() if not info.is_dir()
+                    )
+                    for count, (member_name, info) in enumerate(self._archive_files(members), 1):
+                        self._check_member_count(count, max_members)
+                        with archive.open(info) as member_file:
+                            yield member_name, member_file
+            else:
+                with tarfile.open(fileobj=stream, mode='r|*') as archive:
+                    members = ((info.name, info) for info in archive if info.isfile())
+                    for count, (member_name, info) in enumerate(self._archive_files(members), 1):
+                        self._check_member_count(count, max_members)
+                        yield member_name, archive.extractfile(info)
+        
+        except FileServiceError:
+            raise
+        except (zipfile.BadZipFile, tarfile.TarError) as e:
+            raise FileServiceError(f"Unsupported or corrupt archive: {e}")
+    
+    @staticmethod
+    def _archive_files(members):
+        """Reduce member paths to file names and skip hidden and OS metadata entries"""
+        for member_path, info in members:
+            path = PurePosixPath(member_path.replace('\\', '/'))
+            if '__MACOSX' in path.parts or path.name.startswith('.'):
+                continue
+            yield path.name, info
+    
+    @staticmethod
+    def _check_member_count(count: int, max_members: Optional[int]):
+        if max_members is not None and count > max_members:
+            raise FileServiceError(f"Archive has more than {max_members} files")
+    
+    def get_display_name(self, file_path: Path) -> str:
+        """Return the original upload name of a stored file"""
+        entry = self._read_manifest().get(file_path.name)
+        return entry['names'][0] if entry else file_path.name
+    
+    def get_display_names(self) -> Dict[str, str]:
+        """Return {stored file name: original upload name} for all manifest entries"""
+        return {name: entry['names'][0] for name, entry in self._read_manifest().items()}
+    
     def get_resume_files(self) -> List[Path]:
         """Get all resume files from upload folder"""
         try:
@@ -83,6 +232,8 @@ class FileService:
         try:
             if file_path.exists():
                 file_path.unlink()
+                self._remove_manifest_entry(file_path.name)
+                self._bump_corpus_version()
                 logger.info(f"Deleted file: {file_path}")
                 return True
             return False
@@ -103,3 +254,97 @@ class FileService:
         except Exception as e:
             logger.error(f"Error getting file size for {file_path}: {e}")
             return 0
+    
+    def corpus_version(self) -> str:
+        """Token that changes whenever a resume is stored or deleted through this service"""
+        try:
+            return (self.upload_folder / self.CORPUS_VERSION_NAME).read_text().strip() or '0'
+        except FileNotFoundError:
+            return '0'
+    
+    def _bump_corpus_version(self):
+        fd, tmp_path = tempfile.mkstemp(dir=self.upload_folder, prefix='.corpus_version-', suffix='.part')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(uuid.uuid4().hex)
+            os.replace(tmp_path, self.upload_folder / self.CORPUS_VERSION_NAME)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    
+    def _publish(self, tmp_path: Path, file_path: Path) -> bool:
+        """Move a fully written temp file into place; returns False if the content already exists"""
+        try:
+            # Hard link creation fails atomically when the target exists
+            os.link(tmp_path, file_path)
+            return True
+        except FileExistsError:
+            return False
+        except OSError:
+            # Filesystems without hard links
+            if file_path.exists():
+                return False
+            os.replace(tmp_path, file_path)
+            return True
+    
+    @property
+    def manifest_path(self) -> Path:
+        return self.upload_folder / self.MANIFEST_NAME
+    
+    def _read_manifest(self) -> Dict[str, dict]:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Could not read upload manifest: {e}")
+            return {}
+    
+    def _write_manifest(self, manifest: Dict[str, dict]):
+        fd, tmp_path = tempfile.mkstemp(dir=self.upload_folder, prefix='.manifest-', suffix='.part')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, separators=(',', ':'))
+            os.replace(tmp_path, self.manifest_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    
+    @contextmanager
+    def _locked_manifest(self):
+        """Serialize manifest read-modify-write across threads and processes"""
+        with self._manifest_lock:
+            with open(self.upload_folder / '.manifest.lock', 'a') as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    manifest = self._read_manifest()
+                    yield manifest
+                    self._write_manifest(manifest)
+                finally:
+                    if fcntl:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    def _add_manifest_name(self, stored_name: str, display_name: str) -> str:
+        """Record an upload name for a stored file in the current batch and return its primary display name"""
+        entry = self._batch.manifest.get(stored_name)
+        names = (entry['names'] if entry else []) + self._batch.names.get(stored_name, [])
+        if display_name not in names:
+            self._batch.names.setdefault(stored_name, []).append(display_name)
+            names.append(display_name)
+        return names[0]
+    
+    def _write_batch(self, batch: _UploadBatch):
+        """Merge a batch's names into the manifest and bump the corpus version once"""
+        if batch.names:
+            with self._locked_manifest() as manifest:
+                for stored_name, names in batch.names.items():
+                    entry = manifest.setdefault(stored_name, {'names': [], 'uploaded_at': time.time()})
+                    entry['names'].extend(name for name in names if name not in entry['names'])
+        if batch.corpus_changed:
+            self._bump_corpus_version()
+    
+    def _remove_manifest_entry(self, stored_name: str):
+        with self._locked_manifest() as manifest:
+            manifest.pop(stored_name, None)
\ No newline at end of file
@@ -0,0 +1,286 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import logging
+import numpy as np
+import scipy.sparse as sp
+from app.services.inverted_index import InvertedIndex
+from app.services.tfidf_index import split_rows, stack_rows
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import HashingVectorizer
+
+logger = logging.getLogger(__name__)
+
+class IdfTable:
+    """
+    Document frequencies over a fixed hashed feature space.
+
+    Tables built independently over disjoint shards of a corpus merge by
+    addition, giving the same table as one pass over the whole corpus.
+    """
+
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self.n_docs = 0
+        self.df = np.zeros(n_features, dtype=np.int64)
+
+    @classmethod
+    def from_counts(cls, counts: sp.csr_matrix) -> "IdfTable":
+        """Table for a matrix of term counts, one row per document"""
+        table = cls(counts.shape[1])
+        table.n_docs = counts.shape[0]
+        table.df = np.bincount(counts.indices, minlength=counts.shape[1]).astype(np.int64)
+        return table
+
+    def merge(self, other: "IdfTable") -> "IdfTable":
+        """Add another table's counts into this one"""
+        if other.n_features != self.n_features:
+            raise ValueError("Cannot merge IDF tables over different feature spaces")
+        self.n_docs += other.n_docs
+        self.df += other.df
+        return self
+
+    def remove_document(self, indices: np.ndarray) -> None:
+        self.n_docs -= 1
+        self.df[indices] -= 1
+
+    def idf(self) -> np.ndarray:
+        """Smoothed IDF weights as computed by TfidfTransformer"""
+        return (np.log((1 + self.n_docs) / (1 + self.df)) + 1).astype(np.float32)
+
+def vectorize_shard(vectorizer: 'HashingVectorizer', texts: List[str]) -> Tuple[sp.csr_matrix, IdfTable]:
+    """Term counts and IDF table for one shard of documents; safe to run in a worker process"""
+    counts = vectorizer.transform(texts).tocsr()
+    counts.sort_indices()
+    return counts, IdfTable.from_counts(counts)
+
+# Created on first parallel add_many
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=workers)
+        return _executor
+
+class HashingCorpusIndex:
+    """
+    Feature-hashing alternative to TfidfCorpusIndex.
+
+    Documents are vectorized by a stateless HashingVectorizer into float32 term
+    counts, so shards of the corpus can be vectorized independently (including
+    in worker processes) and their rows stacked without refitting. Document
+    frequencies live in a mergeable IdfTable; IDF weights and the normalized
+    matrix are rebuilt lazily on the next query after a change. There is no
+    max_features selection and distinct terms may collide, so scores are close
+    to, but not identical with, the TF-IDF engine.
+    """
+
+    def __init__(self, stop_words='english', n_features: int = 2 ** 20,
+                 ngram_range: Tuple[int, int] = (1, 2), lowercase: bool = True,
+                 shard_workers: int = 0, shard_size: int = 500):
+        self.n_features = n_features
+        self.shard_workers = shard_workers
+        self.shard_size = shard_size
+        from sklearn.feature_extraction.text import HashingVectorizer
+        self._vectorizer = HashingVectorizer(
+            stop_words=stop_words,
+            ngram_range=ngram_range,
+            lowercase=lowercase,
+            n_features=n_features,
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float32
+        )
+
+        self.idf_table = IdfTable(n_features)
+        self._doc_ids: List[Optional[str]] = []
+        self._doc_positions: Dict[str, int] = {}
+        self._rows: List[Optional[Tuple[np.ndarray, np.ndarray]]] = []
+        self._removed_count = 0
+
+        self._matrix = None
+        self._term_weights = None
+        self._inverted_index = None
+        self._dirty = True
+
+        # Callers hold this lock across sync-and-query sequences
+        self.lock = threading.RLock()
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_positions
+
+    def __len__(self) -> int:
+        return len(self._doc_positions)
+
+    @property
+    def doc_ids(self) -> List[str]:
+        return list(self._doc_positions.keys())
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Add a document, replacing any existing document with the same id"""
+        self.add_many([doc_id], [text])
+
+    def add_many(self, doc_ids: List[str], texts: List[str]) -> None:
+        """
+        Add documents, vectorizing them in shards of `shard_size`. With
+        shard_workers > 0 and more than one shard, shards are vectorized in
+        parallel worker processes and their IDF tables merged.
+        """
+        shards = [(doc_ids[start:start + self.shard_size], texts[start:start + self.shard_size])
+                  for start in range(0, len(doc_ids), self.shard_size)]
+
+        if self.shard_workers > 0 and len(shards) > 1:
+            executor = _get_executor(self.shard_workers)
+            results = executor.map(vectorize_shard, [self._vectorizer] * len(shards),
+                                   [shard_texts for _, shard_texts in shards])
+        else:
+            results = (vectorize_shard(self._vectorizer, shard_texts) for _, shard_texts in shards)
+
+        with self.lock:
+            for (shard_ids, _), (counts, table) in zip(shards, results):
+                self._add_shard(shard_ids, counts, table)
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document; returns False if it was not indexed"""
+        with self.lock:
+            position = self._doc_positions.pop(doc_id, None)
+            if position is None:
+                return False
+
+            indices, _ = self._rows[position]
+            self.idf_table.remove_document(indices)
+
+            self._rows[position] = None
+            self._doc_ids[position] = None
+            self._removed_count += 1
+            self._dirty = True
+            return True
+
+    def positions(self, doc_ids: Iterable[str]) -> np.ndarray:
+        """Return matrix row positions of the given documents"""
+        with self.lock:
+            self._ensure_built()
+            return np.fromiter((self._doc_positions[doc_id] for doc_id in doc_ids), dtype=np.int64)
+
+    @property
+    def matrix(self) -> sp.csr_matrix:
+        """Normalized float32 TF-IDF matrix over hashed features, one row per indexed document"""
+        with self.lock:
+            self._ensure_built()
+            return self._matrix
+
+    @property
+    def inverted_index(self) -> InvertedIndex:
+        """Posting lists over the current matrix, built on first use after a change"""
+        with self.lock:
+            self._ensure_built()
+            if self._inverted_index is None:
+                self._inverted_index = InvertedIndex(self._matrix)
+            return self._inverted_index
+
+    def transform(self, texts: List[str]) -> sp.csr_matrix:
+        """Vectorize query texts with the current IDF weights"""
+        with self.lock:
+            self._ensure_built()
+            counts = self._vectorizer.transform(texts)
+            from sklearn.preprocessing import normalize
+            return normalize(counts.multiply(self._term_weights).tocsr())
+
+    def similarities(self, text: str) -> np.ndarray:
+        """Cosine similarity of a query text against every indexed document"""
+        with self.lock:
+            query_vector = self.transform([text])
+            return (self._matrix @ query_vector.T).toarray().ravel()
+
+    def top_k(self, query_vector: sp.csr_matrix, k: int, threshold: float,
+              tie_break: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (positions, scores) of the k documents most similar to a query
+        vector from transform() and scoring at least threshold
+        """
+        with self.lock:
+            return self.inverted_index.top_k(query_vector, k, threshold, tie_break)
+
+    def snapshot(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Arrays and metadata describing the built index, as persisted by VectorStore"""
+        with self.lock:
+            self._ensure_built()
+            counts_indptr, counts_indices, counts_data = stack_rows(self._rows, np.int32, np.float32)
+            arrays = {
+                'counts_indptr': counts_indptr,
+                'counts_indices': counts_indices,
+                'counts_data': counts_data,
+                'matrix_indptr': self._matrix.indptr,
+                'matrix_indices': self._matrix.indices,
+                'matrix_data': self._matrix.data,
+                'df': self.idf_table.df,
+                'term_weights': self._term_weights,
+            }
+            metadata = {'doc_ids': list(self._doc_ids), 'n_docs': self.idf_table.n_docs}
+            return arrays, metadata
+
+    def restore(self, arrays: Dict[str, np.ndarray], metadata: Dict[str, Any]) -> None:
+        """
+        Replace the index contents with a snapshot. The matrix, term weights and
+        document rows use the given arrays without copying, so memory-mapped
+        arrays stay shared; the first change rebuilds them in memory.
+        """
+        with self.lock:
+            self._doc_ids = list(metadata['doc_ids'])
+            self._doc_positions = {doc_id: position for position, doc_id in enumerate(self._doc_ids)}
+            self._rows = split_rows(arrays['counts_indptr'], arrays['counts_indices'], arrays['counts_data'])
+            self._removed_count = 0
+
+            self.idf_table = IdfTable(self.n_features)
+            self.idf_table.n_docs = metadata['n_docs']
+            self.idf_table.df[:] = arrays['df']
+
+            self._term_weights = arrays['term_weights']
+            self._matrix = sp.csr_matrix(
+                (arrays['matrix_data'], arrays['matrix_indices'], arrays['matrix_indptr']),
+                shape=(len(self._doc_ids), self.n_features), copy=False
+            )
+            self._inverted_index = None
+            self._dirty = False
+
+    def _add_shard(self, doc_ids: List[str], counts: sp.csr_matrix, table: IdfTable) -> None:
+        self.idf_table.merge(table)
+        for row, doc_id in enumerate(doc_ids):
+            start, end = counts.indptr[row], counts.indptr[row + 1]
+            if doc_id in self._doc_positions:
+                # Replaces an indexed document (or an earlier one in this shard)
+                self.remove(doc_id)
+            self._doc_positions[doc_id] = len(self._rows)
+            self._doc_ids.append(doc_id)
+            self._rows.append((counts.indices[start:end], counts.data[start:end]))
+        self._dirty = True
+
+    def _compact(self) -> None:
+        """Drop rows of removed documents and renumber positions"""
+        self._rows = [row for row in self._rows if row is not None]
+        self._doc_ids = [doc_id for doc_id in self._doc_ids if doc_id is not None]
+        self._doc_positions = {doc_id: position for position, doc_id in enumerate(self._doc_ids)}
+        self._removed_count = 0
+
+    def _ensure_built(self) -> None:
+        if not self._dirty:
+            return
+
+        if self._removed_count:
+            self._compact()
+
+        n_docs = len(self._rows)
+        self._term_weights = self.idf_table.idf()
+
+        indptr, indices, counts = stack_rows(self._rows, np.int32, np.float32)
+        counts_matrix = sp.csr_matrix((counts, indices, indptr), shape=(n_docs, self.n_features))
+        from sklearn.preprocessing import normalize
+        self._matrix = normalize(counts_matrix.multiply(self._term_weights).tocsr())
+        self._inverted_index = None
+        self._dirty = False
+
+        logger.info(f"Rebuilt hashing index: {n_docs} documents, {int((self.idf_table.df > 0).sum())} features")
@@ -0,0 +1,128 @@
+from typing import Callable, Optional, Tuple
+import threading
+import numpy as np
+import scipy.sparse as sp
+
+class InvertedIndex:
+    """
+    Posting lists over a row-normalized TF-IDF matrix with MaxScore top-k retrieval.
+
+    Each term's posting list holds the documents containing it and their weights,
+    together with the maximum weight in the list. Queries are evaluated term at a
+    time in decreasing order of score upper bound. Once the summed upper bounds of
+    the remaining terms can no longer lift an unseen document above the current
+    k-th best score (or the similarity threshold), new documents stop being
+    admitted and remaining lists only update the surviving candidates. Scores
+    are exact cosine similarities, so the ranking matches exhaustive scoring.
+    """
+
+    def __init__(self, matrix: sp.csr_matrix):
+        postings = matrix.tocsc()
+        postings.sort_indices()
+
+        self.n_docs, self.n_terms = matrix.shape
+        self._indptr = postings.indptr
+        self._docs = postings.indices
+        self._weights = postings.data
+
+        self._max_weights = np.zeros(self.n_terms)
+        nonempty = np.diff(self._indptr) > 0
+        if nonempty.any():
+            self._max_weights[nonempty] = np.maximum.reduceat(self._weights, self._indptr[:-1][nonempty])
+
+        # Score accumulators reused by every query, so a query costs time in
+        # the posting lists it reads rather than in the number of documents
+        self._scores = np.zeros(self.n_docs)
+        self._admitted = np.zeros(self.n_docs, dtype=bool)
+        self._lock = threading.Lock()
+
+    def posting_list(self, term: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (document positions, weights) for a term"""
+        start, end = self._indptr[term], self._indptr[term + 1]
+        return self._docs[start:end], self._weights[start:end]
+
+    def top_k(self, query: sp.csr_matrix, k: int, threshold: float = 0.0,
+              tie_break: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (document positions, scores) of the k best documents for a single
+        normalized query row, best first. Only documents scoring at least
+        `threshold` (which must be positive) are returned. Equal scores are
+        ordered by the keys `tie_break` returns for an array of document
+        positions (defaults to document position); it is called once, only for
+        documents that can make the result.
+        """
+        query = query.tocsr()
+        terms = query.indices
+        query_weights = query.data
+        upper_bounds = query_weights * self._max_weights[terms]
+
+        useful = upper_bounds > 0
+        order = np.argsort(-upper_bounds[useful], kind='stable')
+        terms = terms[useful][order]
+        query_weights = query_weights[useful][order]
+        upper_bounds = upper_bounds[useful][order]
+
+        # remaining[i] bounds the score an unseen document can still collect after term i
+        remaining = np.concatenate([np.cumsum(upper_bounds[::-1])[::-1][1:], [0.0]])
+
+        with self._lock:
+            # Shared accumulators, all zero between queries; only touched entries are reset
+            scores = self._scores
+            admitted = self._admitted
+            admitted_docs = None
+            touched = []
+            try:
+                top_docs = np.zeros(0, dtype=self._docs.dtype)
+                cutoff = threshold
+
+                for i, term in enumerate(terms):
+                    docs, weights = self.posting_list(term)
+
+                    if admitted_docs is not None:
+                        keep = admitted[docs]
+                        docs, weights = docs[keep], weights[keep]
+                    else:
+                        touched.append(docs)
+
+                    scores[docs] += weights * query_weights[i]
+
+                    # Only the previous best k and this list's documents can change the k-th score
+                    contenders = np.union1d(top_docs, docs)
+                    if len(contenders) >= k:
+                        kth_score = np.partition(scores[contenders], len(contenders) - k)[len(contenders) - k]
+                        top_docs = contenders[scores[contenders] >= kth_score]
+                        cutoff = max(threshold, kth_score)
+                    else:
+                        top_docs = contenders
+
+                    if admitted_docs is None and remaining[i] < cutoff:
+                        # No unseen document can reach the cutoff any more
+                        admitted_docs = np.unique(np.concatenate(touched))
+                        admitted_docs = admitted_docs[scores[admitted_docs] + remaining[i] >= cutoff]
+                        admitted[admitted_docs] = True
+
+                if admitted_docs is not None:
+                    candidates = admitted_docs
+                elif touched:
+                    candidates = np.unique(np.concatenate(touched))
+                else:
+                    candidates = np.zeros(0, dtype=np.int64)
+
+                candidate_scores = scores[candidates]
+            finally:
+                for docs in touched:
+                    scores[docs] = 0.0
+                if admitted_docs is not None:
+                    admitted[admitted_docs] = False
+
+        passing = candidate_scores >= threshold
+        candidates, candidate_scores = candidates[passing], candidate_scores[passing]
+
+        if len(candidates) > k:
+            kth_score = np.partition(candidate_scores, len(candidates) - k)[len(candidates) - k]
+            best = candidate_scores >= kth_score
+            candidates, candidate_scores = candidates[best], candidate_scores[best]
+
+        tie_keys = tie_break(candidates) if tie_break else candidates
+        ranking = np.lexsort((tie_keys, -candidate_scores))[:k]
+        return candidates[ranking], candidate_scores[ranking]
@@ -0,0 +1,144 @@
+import atexit
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import logging
+from flask import current_app
+from app.utils.exceptions import JobQueueError
+
+logger = logging.getLogger(__name__)
+
+class Job:
+    """State and progress of a background job"""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    def __init__(self, name: str):
+        self.id = str(uuid.uuid4())
+        self.name = name
+        self.status = self.QUEUED
+        self.stage = self.QUEUED
+        self.files_total = 0
+        self.files_parsed = 0
+        self.files_failed = 0
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.COMPLETED, self.FAILED)
+
+    def update(self, **fields):
+        """Update progress fields such as stage or files_total"""
+        with self._lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+
+    def record_file(self, parsed: bool):
+        """Count one resume as parsed or failed"""
+        with self._lock:
+            if parsed:
+                self.files_parsed += 1
+            else:
+                self.files_failed += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Status snapshot for polling clients (excludes the result)"""
+        with self._lock:
+            return {
+                'id': self.id,
+                'name': self.name,
+                'status': self.status,
+                'stage': self.stage,
+                'files_total': self.files_total,
+                'files_parsed': self.files_parsed,
+                'files_failed': self.files_failed,
+                'created_at': self.created_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'error': self.error
+            }
+
+class JobQueue:
+    """
+    In-process background job runner with bounded concurrency.
+
+    Jobs run on a fixed-size thread pool inside an application context. State is
+    kept in memory, so status must be polled on the process that accepted the job.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, retention: int):
+        self.max_pending = max_pending
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='rsart-job')
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, target: Callable[..., Any], *args, **kwargs) -> Job:
+        """Queue target(job, *args, **kwargs); its return value becomes the job result"""
+        app = current_app._get_current_object()
+        job = Job(name)
+
+        with self._lock:
+            pending = sum(1 for queued in self._jobs.values() if not queued.is_finished)
+            if pending >= self.max_pending:
+                raise JobQueueError("Too many jobs in progress, please retry later")
+
+            self._jobs[job.id] = job
+            self._evict_finished()
+
+        self._executor.submit(self._run, app, job, target, args, kwargs)
+        logger.info(f"Queued job {job.id} ({name})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, app, job: Job, target, args, kwargs):
+        with app.app_context():
+            job.update(status=Job.RUNNING, started_at=time.time())
+            try:
+                result = target(job, *args, **kwargs)
+                job.update(status=Job.COMPLETED, stage='done', result=result, finished_at=time.time())
+                logger.info(f"Job {job.id} completed in {job.finished_at - job.started_at:.2f}s")
+            except Exception as e:
+                logger.error(f"Job {job.id} failed: {e}")
+                job.update(status=Job.FAILED, error=str(e), finished_at=time.time())
+
+    def _evict_finished(self):
+        """Drop the oldest finished jobs beyond the retention limit"""
+        excess = len(self._jobs) - self.retention
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.is_finished][:excess]:
+            del self._jobs[job_id]
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue, sized from RANKING_JOB_* settings"""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue(
+                max_workers=current_app.config.get('RANKING_JOB_WORKERS', 2),
+                max_pending=current_app.config.get('RANKING_JOB_MAX_PENDING', 20),
+                retention=current_app.config.get('RANKING_JOB_RETENTION', 100)
+            )
+            atexit.register(_job_queue.shutdown)
+        return _job_queue
@@ -1,29 +1,202 @@
-from typing import List, Tuple
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import logging
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.neighbors import NearestNeighbors
+import threading
 import numpy as np
+from flask import current_app, has_app_context
 from app.models.candidate import Candidate
 from app.models.job_description import JobDescription
-from app.utils.text_processor import TextProcessor
+from app.services.hashing_index import HashingCorpusIndex
+from app.services.resume_parser import parser_fingerprint
+from app.services.tfidf_index import TfidfCorpusIndex
+from app.services.vector_store import VectorStore
+from app.utils.text_processor import PREPROCESSOR_VERSION, TextProcessor
 from app.utils.exceptions import MatchingServiceError
+from app.utils.metrics import PREPROCESS_SECONDS, SIMILARITY_SECONDS, VECTORIZE_SECONDS
 
 logger = logging.getLogger(__name__)
 
+CorpusIndex = Union[TfidfCorpusIndex, HashingCorpusIndex]
+
+# Corpus indexes live for the whole process so unchanged candidates are
+# vectorized once, keyed by engine, vectorizer settings and the versions of
+# the parsing and preprocessing that produced the indexed text
+_corpus_indexes: Dict[tuple, CorpusIndex] = {}
+_corpus_indexes_lock = threading.Lock()
+
+# Per corpus index: (document keys, positions, order, sorted positions) of the
+# last candidate pool, so pruned retrieval maps the k rows it returns back to
+# candidates by binary search instead of scanning the pool. Guarded by the
+# index lock.
+_candidate_lookups: Dict[tuple, tuple] = {}
+
+MATCHING_ENGINES = ('tfidf', 'hashing')
+
+def corpus_index_settings(stop_words='english', max_features: int = 5000,
+                          ngram_range: Tuple[int, int] = (1, 2), lowercase: bool = True,
+                          engine: str = 'tfidf', n_features: int = 2 ** 20,
+                          parser_version: str = None, preprocessor_version: str = None, **_) -> tuple:
+    """
+    Settings identifying a corpus index (and its vector store snapshots).
+    Documents are indexed by content hash, so the parser and preprocessor
+    versions are part of the settings: a change to either must not reuse
+    vectors built from the old text.
+    """
+    versions = (parser_version or parser_fingerprint(), preprocessor_version or PREPROCESSOR_VERSION)
+    if engine == 'hashing':
+        return (engine, stop_words, n_features, tuple(ngram_range), lowercase) + versions
+    return (engine, stop_words, max_features, tuple(ngram_range), lowercase) + versions
+
+def corpus_index_options(config) -> Dict:
+    """get_corpus_index keyword arguments for an application config"""
+    return {
+        'stop_words': 'english',
+        'max_features': 5000,
+        'ngram_range': (1, 2),
+        'lowercase': True,
+        'engine': config.get('MATCHING_ENGINE', 'tfidf'),
+        'n_features': config.get('HASHING_N_FEATURES', 2 ** 20),
+        'shard_workers': config.get('MATCHING_SHARD_WORKERS', 0),
+        'shard_size': config.get('MATCHING_SHARD_SIZE', 500),
+        'parser_version': parser_fingerprint(),
+        'preprocessor_version': PREPROCESSOR_VERSION
+    }
+
+def get_vector_store(config) -> Optional[VectorStore]:
+    """Vector store configured by VECTOR_STORE_*, or None when disabled"""
+    if not config.get('VECTOR_STORE_ENABLED'):
+        return None
+    return VectorStore(config['VECTOR_STORE_FOLDER'], config.get('VECTOR_STORE_KEEP_VERSIONS', 2))
+
+def get_corpus_index(stop_words='english', max_features: int = 5000,
+                     ngram_range: Tuple[int, int] = (1, 2), lowercase: bool = True,
+                     engine: str = 'tfidf', n_features: int = 2 ** 20,
+                     shard_workers: int = 0, shard_size: int = 500,
+                     parser_version: str = None, preprocessor_version: str = None,
+                     vector_store: VectorStore = None) -> CorpusIndex:
+    """
+    Return the shared corpus index for the given engine and vectorizer settings.
+    max_features applies to the 'tfidf' engine; n_features and the shard
+    settings to the 'hashing' engine. The parser and preprocessor versions
+    default to the current ones. A new index is restored from the vector
+    store's current snapshot when one exists.
+    """
+    if engine not in MATCHING_ENGINES:
+        raise MatchingServiceError(f"Unknown matching engine: {engine}")
+    
+    key = corpus_index_settings(stop_words, max_features, ngram_range, lowercase, engine, n_features,
+                                parser_version, preprocessor_version)
+    
+    with _corpus_indexes_lock:
+        if key not in _corpus_indexes:
+            if engine == 'hashing':
+                index = HashingCorpusIndex(
+                    stop_words=stop_words,
+                    n_features=n_features,
+                    ngram_range=ngram_range,
+                    lowercase=lowercase,
+                    shard_workers=shard_workers,
+                    shard_size=shard_size
+                )
+            else:
+                index = TfidfCorpusIndex(
+                    stop_words=stop_words,
+                    max_features=max_features,
+                    ngram_range=ngram_range,
+                    lowercase=lowercase
+                )
+            if vector_store:
+                vector_store.load(key, index)
+            _corpus_indexes[key] = index
+        return _corpus_indexes[key]
+
+def preload_corpus_index(config) -> bool:
+    """
+    Memory-map the current vector store snapshot so the first ranking needs no
+    vectorization. Returns False, without building an index, when there is none.
+    """
+    vector_store = get_vector_store(config)
+    if not vector_store:
+        return False
+    options = corpus_index_options(config)
+    if vector_store.current_version(corpus_index_settings(**options)) is None:
+        return False
+    get_corpus_index(vector_store=vector_store, **options)
+    return True
+
+def _top_k_indices(scores: np.ndarray, k: int, threshold: float) -> np.ndarray:
+    """
+    Indices of the k highest scores at or above threshold, best first.
+    Equal scores keep index order, as with a stable descending sort. Selection
+    is a partition over the scores passing the threshold, so only those tied
+    with or above the k-th score are sorted.
+    """
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    
+    eligible = np.flatnonzero(scores >= threshold)
+    eligible_scores = scores[eligible]
+    
+    if len(eligible) > k:
+        # Keep everything tied with the k-th score so the cut is stable
+        kth_score = -np.partition(-eligible_scores, k - 1)[k - 1]
+        best = eligible_scores >= kth_score
+        eligible, eligible_scores = eligible[best], eligible_scores[best]
+    
+    return eligible[np.lexsort((eligible, -eligible_scores))][:k]
+
+class RankedCandidates(list):
+    """
+    Shortlist returned by match_candidates, best candidate first.
+    
+    Only shortlisted candidates carry a score and rank. The ranking of the whole
+    pool is computed on the first call to full_ranking().
+    """
+    
+    def __init__(self, shortlist: List[Candidate], candidates: List[Candidate] = None,
+                 score_all: Callable[[], np.ndarray] = None):
+        super().__init__(shortlist)
+        self._candidates = candidates or []
+        self._score_all = score_all
+        self._full_ranking = None
+    
+    def full_ranking(self) -> List[Candidate]:
+        """Every matched candidate best first, with score and rank assigned"""
+        if self._full_ranking is None:
+            scores = self._score_all() if self._score_all else np.zeros(0)
+            
+            # Stable descending order: equal scores keep input order
+            ranking = []
+            for rank, index in enumerate(np.argsort(-scores, kind='stable'), 1):
+                candidate = self._candidates[index]
+                candidate.score = float(scores[index])
+                candidate.rank = rank
+                ranking.append(candidate)
+            self._full_ranking = ranking
+        
+        return self._full_ranking
+    
+    def __reduce__(self):
+        # The lazy scorer is not picklable; pickled copies are plain shortlists
+        return list, (list(self),)
+
 class ResumeMatchingService:
     """Service for matching resumes against job descriptions"""
     
-    def __init__(self, top_candidates_count: int = 10, similarity_threshold: float = 0.1):
+    def __init__(self, top_candidates_count: int = 10, similarity_threshold: float = 0.1,
+                 engine: str = None):
         self.top_candidates_count = top_candidates_count
         self.similarity_threshold = similarity_threshold
         self.text_processor = TextProcessor()
-        self.vectorizer = TfidfVectorizer(
-            stop_words='english',
-            max_features=5000,
-            ngram_range=(1, 2),
-            lowercase=True
-        )
+        
+        config = current_app.config if has_app_context() else {}
+        index_options = corpus_index_options(config)
+        if engine:
+            index_options['engine'] = engine
+        self.engine = index_options['engine']
+        self.index_settings = corpus_index_settings(**index_options)
+        self.vector_store = get_vector_store(config)
+        self.corpus_index = get_corpus_index(vector_store=self.vector_store, **index_options)
     
     def match_candidates(self, job_description: JobDescription, 
                         candidates: List[Candidate]) -> List[Candidate]:
@@ -37,45 +210,174 @@ class ResumeMatchingService:
                 logger.warning("No candidates provided for matching")
                 return []
             
-            # Prepare texts for vectorization
             job_text = self._prepare_job_text(job_description)
-            candidate_texts = [self._prepare_candidate_text(candidate) for candidate in candidates]
+            document_keys = [self._document_key(candidate) for candidate in candidates]
             
-            # Create corpus including job description
-            corpus = [job_text] + candidate_texts
+            with self.corpus_index.lock:
+                # Only candidates not yet indexed are preprocessed and vectorized
+                self._sync_corpus_index(candidates, document_keys)
+                positions = self.corpus_index.positions(document_keys)
+                
+                if self._use_pruned_retrieval(len(candidates)):
+                    with SIMILARITY_SECONDS.time(engine=self.engine, mode='pruned'):
+                        return self._match_top_k(job_text, candidates, document_keys, positions)
+                
+                with SIMILARITY_SECONDS.time(engine=self.engine, mode='dense'):
+                    similarities = self.corpus_index.similarities(job_text)[positions]
             
-            # Vectorize texts
-            tfidf_matrix = self.vectorizer.fit_transform(corpus)
+            # Threshold mask and partial selection; only the shortlist gets scores and ranks
+            top_indices = _top_k_indices(similarities, self.top_candidates_count, self.similarity_threshold)
             
-            # Calculate similarities
-            job_vector = tfidf_matrix[0:1]  # First row is job description
-            candidate_vectors = tfidf_matrix[1:]  # Rest are candidates
+            ranked_candidates = []
+            for rank, index in enumerate(top_indices, 1):
+                candidate = candidates[index]
+                candidate.score = float(similarities[index])
+                candidate.rank = rank
+                ranked_candidates.append(candidate)
             
-            similarities = cosine_similarity(job_vector, candidate_vectors)[0]
+            logger.info(f"Matched {len(ranked_candidates)} candidates above threshold")
+            return RankedCandidates(ranked_candidates, candidates, lambda: similarities)
             
-            # Assign scores and ranks
-            for i, candidate in enumerate(candidates):
-                candidate.score = float(similarities[i])
+        except Exception as e:
+            logger.error(f"Error in candidate matching: {e}")
+            raise MatchingServiceError(f"Failed to match candidates: {e}")
+    
+    def match_candidates_batch(self, job_descriptions: List[JobDescription],
+                               candidates: List[Candidate]) -> Dict[str, List[Candidate]]:
+        """
+        Match candidates against several job descriptions in one pass.
+        
+        Returns a shortlist per job keyed by job description id. Shortlisted
+        candidates are copies carrying that job's score and rank.
+        """
+        try:
+            logger.info(f"Batch matching {len(candidates)} candidates against {len(job_descriptions)} jobs")
             
-            # Sort by score descending
-            ranked_candidates = sorted(candidates, key=lambda x: x.score, reverse=True)
+            if not candidates or not job_descriptions:
+                logger.warning("No candidates or job descriptions provided for batch matching")
+                return {job_description.id: [] for job_description in job_descriptions}
             
-            # Assign ranks
-            for rank, candidate in enumerate(ranked_candidates, 1):
-                candidate.rank = rank
+            job_texts = [self._prepare_job_text(job_description) for job_description in job_descriptions]
+            document_keys = [self._document_key(candidate) for candidate in candidates]
+            
+            with self.corpus_index.lock:
+                self._sync_corpus_index(candidates, document_keys)
+                positions = self.corpus_index.positions(document_keys)
+                
+                # One N x M sparse product for all jobs
+                with SIMILARITY_SECONDS.time(engine=self.engine, mode='batch'):
+                    job_matrix = self.corpus_index.transform(job_texts)
+                    similarities = (job_matrix @ self.corpus_index.matrix.T).tocsr()
             
-            # Filter by threshold and limit
-            filtered_candidates = [
-                c for c in ranked_candidates 
-                if c.score >= self.similarity_threshold
-            ][:self.top_candidates_count]
+            shortlists = {}
+            for row, job_description in enumerate(job_descriptions):
+                scores = similarities.getrow(row).toarray().ravel()[positions]
+                top_indices = _top_k_indices(scores, self.top_candidates_count, self.similarity_threshold)
+                shortlists[job_description.id] = [
+                    replace(candidates[index], score=float(scores[index]), rank=rank)
+                    for rank, index in enumerate(top_indices, 1)
+                ]
             
-            logger.info(f"Matched {len(filtered_candidates)} candidates above threshold")
-            return filtered_candidates
+            logger.info(f"Batch matched {len(job_descriptions)} jobs")
+            return shortlists
             
         except Exception as e:
-            logger.error(f"Error in candidate matching: {e}")
-            raise MatchingServiceError(f"Failed to match candidates: {e}")
+            logger.error(f"Error in batch candidate matching: {e}")
+            raise MatchingServiceError(f"Failed to batch match candidates: {e}")
+    
+    def _use_pruned_retrieval(self, candidate_count: int) -> bool:
+        """Top-k retrieval only pays off when most of the pool is discarded"""
+        return self.similarity_threshold > 0 and self.top_candidates_count < candidate_count
+    
+    def _match_top_k(self, job_text: str, candidates: List[Candidate], document_keys: List[str],
+                     positions: np.ndarray) -> List[Candidate]:
+        """Retrieve the best candidates from the inverted index without scoring the whole pool"""
+        # One query vector serves retrieval and any later full ranking
+        query_vector = self.corpus_index.transform([job_text])
+        
+        # Candidate indices sorted by row. Several candidates share a row when
+        # the same resume is uploaded twice; a stable sort keeps them in input order.
+        order, sorted_positions = self._candidate_lookup(document_keys, positions)
+        
+        def first_candidate(rows: np.ndarray) -> np.ndarray:
+            # Equal scores keep input order, as with a stable sort over all candidates
+            return order[np.searchsorted(sorted_positions, rows, side='left')]
+        
+        rows, scores = self.corpus_index.top_k(
+            query_vector, self.top_candidates_count, self.similarity_threshold, first_candidate
+        )
+        starts = np.searchsorted(sorted_positions, rows, side='left').tolist()
+        ends = np.searchsorted(sorted_positions, rows, side='right').tolist()
+        
+        # Snapshot for a later full ranking; rebuilds replace the matrix rather than mutate it
+        matrix = self.corpus_index.matrix
+        
+        def score_all() -> np.ndarray:
+            return (matrix[positions] @ query_vector.T).toarray().ravel()
+        
+        matches = [
+            (score, index)
+            for score, start, end in zip(scores.tolist(), starts, ends)
+            for index in order[start:end].tolist()
+        ]
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        
+        ranked_candidates = []
+        for rank, (score, index) in enumerate(matches[:self.top_candidates_count], 1):
+            candidate = candidates[index]
+            candidate.score = score
+            candidate.rank = rank
+            ranked_candidates.append(candidate)
+        
+        logger.info(f"Matched {len(ranked_candidates)} candidates above threshold")
+        return RankedCandidates(ranked_candidates, candidates, score_all)
+    
+    def _candidate_lookup(self, document_keys: List[str],
+                          positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (candidate indices ordered by row, their sorted rows) for a candidate
+        pool, sorted again only when the pool or its index rows change
+        """
+        cached = _candidate_lookups.get(self.index_settings)
+        if cached is None or cached[0] != document_keys or not np.array_equal(cached[1], positions):
+            order = np.argsort(positions, kind='stable')
+            cached = (list(document_keys), positions, order, positions[order])
+            _candidate_lookups[self.index_settings] = cached
+        return cached[2], cached[3]
+    
+    def _sync_corpus_index(self, candidates: List[Candidate], document_keys: List[str]):
+        """Add new candidates to the corpus index and drop ones no longer present"""
+        current_keys = set(document_keys)
+        removed = 0
+        for doc_id in self.corpus_index.doc_ids:
+            if doc_id not in current_keys:
+                removed += self.corpus_index.remove(doc_id)
+        
+        new_candidates = {}
+        for key, candidate in zip(document_keys, candidates):
+            if key not in self.corpus_index and key not in new_candidates:
+                new_candidates[key] = candidate
+        
+        if new_candidates:
+            texts = [self._prepare_candidate_text(candidate) for candidate in new_candidates.values()]
+            with VECTORIZE_SECONDS.time(engine=self.engine):
+                self.corpus_index.add_many(list(new_candidates), texts)
+                # Rebuild now rather than on the first query so it is timed as vectorization
+                self.corpus_index.matrix
+        
+        changed = new_candidates or removed or self.vector_store and \
+            self.vector_store.current_version(self.index_settings) is None
+        if self.vector_store and changed and len(self.corpus_index):
+            # Later processes map this snapshot instead of re-vectorizing the corpus
+            try:
+                self.vector_store.save(self.index_settings, self.corpus_index)
+            except Exception as e:
+                logger.warning(f"Could not save vector store: {e}")
+    
+    @staticmethod
+    def _document_key(candidate: Candidate) -> str:
+        """Corpus index key: content hash when known so re-parsed files keep their entry"""
+        return candidate.content_hash or candidate.id
     
     def _prepare_job_text(self, job_description: JobDescription) -> str:
         """Prepare job description text for vectorization"""
@@ -91,7 +393,8 @@ class ResumeMatchingService:
             text_parts.extend(job_description.skills)
         
         combined_text = " ".join(text_parts)
-        return self.text_processor.preprocess(combined_text)
+        with PREPROCESS_SECONDS.time(document='job_description'):
+            return self.text_processor.preprocess(combined_text)
     
     def _prepare_candidate_text(self, candidate: Candidate) -> str:
         """Prepare candidate text for vectorization"""
@@ -110,4 +413,5 @@ class ResumeMatchingService:
             text_parts.extend(candidate.education)
         
         combined_text = " ".join(text_parts)
-        return self.text_processor.preprocess(combined_text)
\ No newline at end of file
+        with PREPROCESS_SECONDS.time(document='resume'):
+            return self.text_processor.preprocess(combined_text)
\ No newline at end of file
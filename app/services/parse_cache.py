@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+from flask import current_app
+from app.models.candidate import Candidate
+from app.services.resume_parser import parser_fingerprint
+from app.utils.metrics import CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+# (size, mtime_ns, digest) per path so unchanged files are not re-hashed on every request
+_digest_memo: Dict[str, Tuple[int, int, str]] = {}
+_memo_lock = threading.Lock()
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+def file_content_hash(file_path: Path) -> str:
+    """Return SHA-256 hex digest of the file content, memoized per process"""
+    stat = file_path.stat()
+    key = str(file_path.resolve())
+    memo = _digest_memo.get(key)
+    if memo and memo[0] == stat.st_size and memo[1] == stat.st_mtime_ns:
+        return memo[2]
+
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+
+    hex_digest = digest.hexdigest()
+    with _memo_lock:
+        _digest_memo[key] = (stat.st_size, stat.st_mtime_ns, hex_digest)
+    return hex_digest
+
+class ParseCache:
+    """Persistent cache of parsed resumes keyed by file content hash and parser version"""
+
+    def __init__(self, cache_folder: Path = None, parser_version: str = None):
+        if cache_folder is None:
+            cache_folder = current_app.config['PARSE_CACHE_FOLDER']
+        if parser_version is None:
+            parser_version = parser_fingerprint()
+        self.cache_folder = Path(cache_folder) / f"v{parser_version}"
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+
+    def content_hash(self, file_path: Path) -> str:
+        """Return SHA-256 hex digest of the file content"""
+        return file_content_hash(file_path)
+
+    def contains(self, file_path: Path) -> bool:
+        """Return True if the file content has already been parsed"""
+        try:
+            return self._entry_path(self.content_hash(file_path)).exists()
+        except Exception as e:
+            logger.warning(f"Parse cache lookup failed for {file_path}: {e}")
+            return False
+
+    def get(self, file_path: Path) -> Optional[Candidate]:
+        """Return cached candidate for file or None if it has not been parsed yet"""
+        try:
+            content_hash = self.content_hash(file_path)
+            entry_path = self._entry_path(content_hash)
+            if not entry_path.exists():
+                CACHE_REQUESTS.inc(cache='parse', result='miss')
+                return None
+
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                candidate = Candidate.from_dict(json.load(f))
+
+            # Same content may live under a different name than when it was cached
+            candidate.resume_path = file_path
+            candidate.content_hash = content_hash
+            CACHE_REQUESTS.inc(cache='parse', result='hit')
+            return candidate
+
+        except Exception as e:
+            logger.warning(f"Parse cache read failed for {file_path}: {e}")
+            CACHE_REQUESTS.inc(cache='parse', result='miss')
+            return None
+
+    def put(self, file_path: Path, candidate: Candidate) -> None:
+        """Store parsed candidate for file"""
+        try:
+            content_hash = self.content_hash(file_path)
+            candidate.content_hash = content_hash
+
+            data = candidate.to_dict()
+            data['resume_text'] = candidate.resume_text
+            data['score'] = None
+            data['rank'] = None
+
+            entry_path = self._entry_path(content_hash)
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, entry_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+
+        except Exception as e:
+            logger.warning(f"Parse cache write failed for {file_path}: {e}")
+
+    def _entry_path(self, content_hash: str) -> Path:
+        return self.cache_folder / content_hash[:2] / f"{content_hash}.json"
@@ -0,0 +1,350 @@
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Callable, Deque, List, Optional, Tuple
+import logging
+from flask import current_app
+from app.models.candidate import Candidate
+from app.services.parse_cache import file_content_hash
+from app.services.resume_parser import ResumeParserFactory
+from app.utils.metrics import RESUME_PARSE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ParseOutcome:
+    """Result of parsing a single resume file"""
+
+    file_path: Path
+    candidate: Optional[Candidate] = None
+    error: Optional[str] = None
+    extractor: Optional[str] = None
+    duration: float = 0.0
+    # Parsing ran out of memory, so the worker's heap may be unusable
+    out_of_memory: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.candidate is not None
+
+def parse_resume_file(file_path: Path) -> ParseOutcome:
+    """Parse one resume file, capturing any failure in the outcome"""
+    start = time.perf_counter()
+    parser = None
+    try:
+        parser = ResumeParserFactory.get_parser(file_path.suffix)
+        candidate = parser.parse(file_path)
+        # Keys the candidate in the corpus index and the database even when
+        # the parse cache is disabled
+        candidate.content_hash = file_content_hash(file_path)
+        return ParseOutcome(file_path=file_path, candidate=candidate, extractor=parser.extractor,
+                            duration=time.perf_counter() - start)
+    except Exception as e:
+        return ParseOutcome(file_path=file_path, error=str(e), extractor=parser.extractor if parser else None,
+                            duration=time.perf_counter() - start, out_of_memory=_raised_memory_error(e))
+
+def _raised_memory_error(error: BaseException) -> bool:
+    """True if error is a MemoryError or was raised while handling one (parsers wrap their errors)"""
+    while error is not None:
+        if isinstance(error, MemoryError):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+def record_parse_metrics(outcome: ParseOutcome) -> None:
+    RESUME_PARSE_SECONDS.observe(
+        outcome.duration,
+        extension=outcome.file_path.suffix.lower() or 'none',
+        extractor=outcome.extractor or 'none',
+        status='ok' if outcome.ok else 'failed'
+    )
+
+def _address_space_size() -> int:
+    """Current virtual memory size of this process in bytes, 0 if unknown"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[0])
+        return pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+def _limit_memory(memory_limit: int):
+    """
+    Cap the address space of the current process (POSIX only) at memory_limit
+    bytes above its current size, so the mappings inherited from the parent do
+    not count against the limit
+    """
+    try:
+        import resource
+    except ImportError:
+        logger.warning("Parse worker memory limit is not supported on this platform")
+        return
+    memory_limit += _address_space_size()
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        memory_limit = min(memory_limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+
+def _worker_main(conn: Connection, memory_limit: int):
+    """Parse files received on conn and send back outcomes until told to stop"""
+    if memory_limit > 0:
+        _limit_memory(memory_limit)
+
+    while True:
+        try:
+            file_path = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if file_path is None:
+            return
+
+        try:
+            outcome = parse_resume_file(file_path)
+        except MemoryError:
+            outcome = ParseOutcome(file_path=file_path, error="Parsing exceeded the worker memory limit",
+                                   out_of_memory=True)
+        conn.send(outcome)
+
+class _Worker:
+    """A parse worker process and the file it is currently parsing"""
+
+    def __init__(self, context, memory_limit: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, memory_limit),
+                                       name='rsart-parse-worker', daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.file_path = None
+        self.future = None
+        self.deadline = None
+        self.started_at = None
+        self.tasks_done = 0
+
+    @property
+    def busy(self) -> bool:
+        return self.future is not None
+
+    def assign(self, file_path: Path, future: Future, timeout: float):
+        self.file_path = file_path
+        self.future = future
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + timeout if timeout > 0 else None
+        self.conn.send(file_path)
+
+    def finish(self, outcome: ParseOutcome):
+        if not outcome.duration:
+            # Timeouts and crashes: the worker never reported a duration
+            outcome.duration = time.monotonic() - self.started_at
+        record_parse_metrics(outcome)
+        future = self.future
+        self.file_path = self.future = self.deadline = self.started_at = None
+        self.tasks_done += 1
+        if not future.cancelled():
+            future.set_result(outcome)
+
+    def stop(self, kill: bool = False):
+        if not kill:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                kill = True
+        if kill and self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+class ResumeParsePool:
+    """
+    Supervised worker processes that parse resume files in parallel.
+
+    Each worker parses one file at a time, optionally with its address space
+    limited to memory_limit bytes beyond what it inherits at start. A
+    supervisor thread dispatches queued files and watches the workers: a file
+    that exceeds the wall-clock timeout has its worker killed, a worker that
+    dies (crash or memory exhaustion) is replaced, and in both cases only that
+    file is reported as failed. Files that simply fail to parse are reported
+    without touching the worker. Workers are also recycled after a fixed
+    number of files to bound leaks in the parsing libraries.
+    """
+
+    def __init__(self, max_workers: int, timeout: float = 0, memory_limit: int = 0,
+                 max_tasks_per_worker: int = 0):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._context = multiprocessing.get_context()
+        self._pending: Deque[Tuple[Path, Future]] = deque()
+        self._workers: List[_Worker] = []
+        self._lock = threading.RLock()
+        self._wakeup_reader, self._wakeup_writer = self._context.Pipe(duplex=False)
+        self._supervisor = None
+        self._closed = False
+
+    def submit(self, file_path: Path) -> Future:
+        """Schedule a file for parsing and return a future resolving to a ParseOutcome"""
+        future = Future()
+        if self.max_workers <= 0:
+            outcome = parse_resume_file(file_path)
+            record_parse_metrics(outcome)
+            future.set_result(outcome)
+            return future
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Parse pool has been shut down")
+            self._pending.append((file_path, future))
+            if self._supervisor is None:
+                self._supervisor = threading.Thread(target=self._supervise, name='rsart-parse-supervisor',
+                                                    daemon=True)
+                self._supervisor.start()
+            self._wakeup_writer.send_bytes(b'')
+        return future
+
+    def parse_many(self, file_paths: List[Path],
+                   on_result: Callable[[ParseOutcome], None] = None) -> List[ParseOutcome]:
+        """Parse files in parallel and return outcomes in input order"""
+        futures = [self.submit(file_path) for file_path in file_paths]
+        outcomes = []
+
+        for file_path, future in zip(file_paths, futures):
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = ParseOutcome(file_path=file_path, error=str(e))
+
+            if on_result:
+                on_result(outcome)
+            outcomes.append(outcome)
+
+        return outcomes
+
+    def shutdown(self):
+        """Stop worker processes and fail files that were not parsed"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup_writer.send_bytes(b'')
+        if self._supervisor:
+            self._supervisor.join(timeout=5)
+
+    def _supervise(self):
+        while True:
+            with self._lock:
+                closed = self._closed
+                if not closed:
+                    self._dispatch()
+            if closed:
+                self._stop_workers()
+                return
+
+            busy = [worker for worker in self._workers if worker.busy]
+            deadlines = [worker.deadline for worker in busy if worker.deadline is not None]
+            timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+            ready = wait([self._wakeup_reader] + [worker.conn for worker in busy], timeout=timeout)
+
+            if self._wakeup_reader in ready:
+                while self._wakeup_reader.poll():
+                    self._wakeup_reader.recv_bytes()
+
+            for worker in busy:
+                if worker.conn in ready:
+                    self._collect(worker)
+                elif worker.deadline is not None and time.monotonic() >= worker.deadline:
+                    logger.error(f"Parsing {worker.file_path} timed out after {self.timeout:g}s, killing worker")
+                    self._replace(worker, ParseOutcome(
+                        file_path=worker.file_path,
+                        error=f"Parsing timed out after {self.timeout:g} seconds"
+                    ))
+
+    def _dispatch(self):
+        """Hand pending files to idle workers, starting workers as needed (lock held)"""
+        while self._pending:
+            worker = next((worker for worker in self._workers if not worker.busy), None)
+            if worker is None:
+                if len(self._workers) >= self.max_workers:
+                    return
+                worker = _Worker(self._context, self.memory_limit)
+                self._workers.append(worker)
+                if len(self._workers) == self.max_workers:
+                    logger.info(f"Started resume parse pool with {self.max_workers} workers")
+
+            file_path, future = self._pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                worker.assign(file_path, future, self.timeout)
+            except (OSError, ValueError) as e:
+                self._replace(worker, ParseOutcome(file_path=file_path, error=f"Parse worker unavailable: {e}"))
+
+    def _collect(self, worker: _Worker):
+        """Read a finished outcome from a worker, replacing it if it died"""
+        try:
+            outcome = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.process.join(timeout=1)
+            exitcode = worker.process.exitcode
+            logger.error(f"Parse worker crashed while parsing {worker.file_path} (exit code {exitcode})")
+            self._replace(worker, ParseOutcome(
+                file_path=worker.file_path,
+                error=f"Parse worker crashed (exit code {exitcode})"
+            ))
+            return
+
+        worker.finish(outcome)
+        # Ordinary parse failures leave the worker reusable; one that ran out of
+        # memory may have left its heap in a bad state and is replaced
+        if outcome.out_of_memory or (self.max_tasks_per_worker and worker.tasks_done >= self.max_tasks_per_worker):
+            self._retire(worker)
+
+    def _replace(self, worker: _Worker, outcome: ParseOutcome):
+        """Kill a worker, fail its current file and let _dispatch start a new one"""
+        worker.finish(outcome)
+        worker.stop(kill=True)
+        with self._lock:
+            self._workers.remove(worker)
+
+    def _retire(self, worker: _Worker):
+        worker.stop()
+        with self._lock:
+            self._workers.remove(worker)
+
+    def _stop_workers(self):
+        for worker in self._workers:
+            if worker.busy:
+                worker.finish(ParseOutcome(file_path=worker.file_path, error="Parse pool shut down"))
+            worker.stop(kill=True)
+        self._workers = []
+        while self._pending:
+            file_path, future = self._pending.popleft()
+            if future.set_running_or_notify_cancel():
+                future.set_result(ParseOutcome(file_path=file_path, error="Parse pool shut down"))
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def get_parse_pool() -> ResumeParsePool:
+    """Return the process-wide parse pool, configured from the PARSE_* settings"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ResumeParsePool(
+                max_workers=current_app.config.get('PARSE_WORKERS', 0),
+                timeout=current_app.config.get('PARSE_TIMEOUT', 0),
+                memory_limit=current_app.config.get('PARSE_MEMORY_LIMIT', 0),
+                max_tasks_per_worker=current_app.config.get('PARSE_WORKER_MAX_TASKS', 0)
+            )
+            atexit.register(_parse_pool.shutdown)
+        return _parse_pool
@@ -0,0 +1,81 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+from flask import current_app
+from app.extensions import cache
+from app.models.candidate import Candidate
+from app.services.resume_parser import parser_fingerprint
+from app.utils.text_processor import PREPROCESSOR_VERSION
+from app.utils.metrics import CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+class RankingCache:
+    """
+    Shortlists cached in the Flask cache under (job description content hash,
+    corpus version, matching settings).
+
+    Entries expire after a TTL. The cache also keeps an index of its keys and
+    deletes the oldest entries beyond max_entries, which bounds its size on
+    cache types without a threshold of their own (redis). The index is updated
+    without cross-process locking, so concurrent writers may let it miss a key;
+    such entries still expire through their TTL.
+    """
+
+    KEY_PREFIX = 'ranking_result'
+    INDEX_KEY = 'ranking_result:index'
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, timeout: int = None, max_entries: int = None):
+        self.timeout = timeout or current_app.config.get('RANKING_CACHE_TIMEOUT', 600)
+        self.max_entries = max_entries or current_app.config.get('RANKING_CACHE_MAX_ENTRIES', 200)
+
+    def key(self, job_file_path: Path, corpus_version: str, settings: Dict[str, Any]) -> str:
+        """Cache key for ranking the current corpus against a job description file"""
+        digest = hashlib.sha256()
+        with open(job_file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                digest.update(chunk)
+
+        key_parts = json.dumps([digest.hexdigest(), corpus_version, settings], sort_keys=True, default=str)
+        return f"{self.KEY_PREFIX}:{hashlib.sha256(key_parts.encode('utf-8')).hexdigest()}"
+
+    def get(self, key: str) -> Optional[List[Candidate]]:
+        """Cached shortlist, best candidate first, or None on a miss"""
+        try:
+            rows = cache.get(key)
+        except Exception as e:
+            logger.warning(f"Ranking cache read failed: {e}")
+            rows = None
+
+        if rows is None:
+            CACHE_REQUESTS.inc(cache='ranking', result='miss')
+            return None
+        CACHE_REQUESTS.inc(cache='ranking', result='hit')
+        return [Candidate.from_dict(row) for row in rows]
+
+    def set(self, key: str, candidates: List[Candidate]) -> None:
+        """Cache a shortlist; failures are logged and otherwise ignored"""
+        try:
+            cache.set(key, [candidate.to_dict() for candidate in candidates], timeout=self.timeout)
+
+            index = [entry for entry in (cache.get(self.INDEX_KEY) or []) if entry != key]
+            index.append(key)
+            if len(index) > self.max_entries:
+                evicted, index = index[:-self.max_entries], index[-self.max_entries:]
+                cache.delete_many(*evicted)
+            cache.set(self.INDEX_KEY, index, timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"Ranking cache write failed: {e}")
+
+def matching_settings(matching_service) -> Dict[str, Any]:
+    """Settings of a matching service and the parsing pipeline that change its results"""
+    return {
+        'engine': matching_service.engine,
+        'top_candidates_count': matching_service.top_candidates_count,
+        'similarity_threshold': matching_service.similarity_threshold,
+        'parser_version': parser_fingerprint(),
+        'preprocessor_version': PREPROCESSOR_VERSION
+    }
@@ -0,0 +1,111 @@
+import base64
+import binascii
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+import logging
+from flask import current_app
+from app.extensions import cache
+from app.models.candidate import Candidate
+from app.utils.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+class RankingStore:
+    """
+    Ranked result sets kept server-side in the Flask cache for cursor pagination.
+
+    A ranking is stored as a summary entry plus fixed-size chunks of candidate
+    dictionaries (without resume text), so serving a page reads at most the
+    chunks it overlaps instead of the whole ranking. Cursors are opaque tokens
+    bound to one ranking and an offset into it.
+    """
+
+    KEY_PREFIX = 'ranking'
+
+    def __init__(self, timeout: int = None, chunk_size: int = None):
+        self.timeout = timeout or current_app.config.get('RANKING_RESULT_TIMEOUT', 3600)
+        self.chunk_size = chunk_size or current_app.config.get('RANKING_RESULT_CHUNK_SIZE', 500)
+
+    def save(self, job_description: str, ranking: List[Candidate]) -> str:
+        """Store a ranking, best candidate first, and return its id"""
+        ranking_id = uuid.uuid4().hex
+        # to_dict leaves out resume_text, which is the bulk of a candidate
+        rows = [candidate.to_dict() for candidate in ranking]
+
+        for chunk_number, start in enumerate(range(0, len(rows), self.chunk_size)):
+            cache.set(self._chunk_key(ranking_id, chunk_number), rows[start:start + self.chunk_size],
+                      timeout=self.timeout)
+
+        # Written last so a visible summary implies its chunks are stored
+        cache.set(self._key(ranking_id), {
+            'id': ranking_id,
+            'job_description': job_description,
+            'total': len(rows),
+            'chunk_size': self.chunk_size,
+            'created_at': time.time()
+        }, timeout=self.timeout)
+
+        logger.info(f"Stored ranking {ranking_id} ({len(rows)} candidates)")
+        return ranking_id
+
+    def get(self, ranking_id: str) -> Optional[Dict[str, Any]]:
+        """Summary of a stored ranking, or None if unknown or expired"""
+        return cache.get(self._key(ranking_id))
+
+    def page(self, ranking_id: str, cursor: str = None, limit: int = 50) -> Optional[Dict[str, Any]]:
+        """
+        Return up to limit candidates starting at cursor (the first page when
+        cursor is None) with the cursor of the next page, or None if the ranking
+        is unknown or expired. Raises ValidationError for a malformed cursor.
+        """
+        summary = self.get(ranking_id)
+        if summary is None:
+            return None
+
+        offset = self.decode_cursor(ranking_id, cursor) if cursor else 0
+        end = min(offset + limit, summary['total'])
+        chunk_size = summary['chunk_size']
+
+        candidates = []
+        last_chunk = (end - 1) // chunk_size if end > offset else -1
+        for chunk_number in range(offset // chunk_size, last_chunk + 1):
+            chunk = cache.get(self._chunk_key(ranking_id, chunk_number))
+            if chunk is None:
+                # Evicted independently of the summary
+                return None
+            chunk_start = chunk_number * chunk_size
+            candidates.extend(chunk[max(offset - chunk_start, 0):end - chunk_start])
+
+        return {
+            'ranking_id': ranking_id,
+            'job_description': summary['job_description'],
+            'total': summary['total'],
+            'candidates': candidates,
+            'next_cursor': self.encode_cursor(ranking_id, end) if end < summary['total'] else None
+        }
+
+    @staticmethod
+    def encode_cursor(ranking_id: str, offset: int) -> str:
+        token = f"{ranking_id}:{offset}".encode('ascii')
+        return base64.urlsafe_b64encode(token).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(ranking_id: str, cursor: str) -> int:
+        """Offset encoded in a cursor issued for ranking_id"""
+        try:
+            token = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii')
+            cursor_ranking_id, offset = token.rsplit(':', 1)
+            offset = int(offset)
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationError("Invalid cursor")
+
+        if cursor_ranking_id != ranking_id or offset < 0:
+            raise ValidationError("Cursor does not belong to this ranking")
+        return offset
+
+    def _key(self, ranking_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{ranking_id}"
+
+    def _chunk_key(self, ranking_id: str, chunk_number: int) -> str:
+        return f"{self.KEY_PREFIX}:{ranking_id}:{chunk_number}"
@@ -3,15 +3,21 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import logging
 import re
-import docx2txt
-import PyPDF2
-import textract
 from app.models.candidate import Candidate
+from app.services.text_extractors import get_extractor_chain
 from app.utils.text_processor import TextProcessor
 from app.utils.exceptions import ResumeParsingError
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever parsing output changes so cached parses are invalidated
+PARSER_VERSION = '1'
+
+def parser_fingerprint() -> str:
+    """PARSER_VERSION plus the extractor chain fingerprint; changes whenever parsed text can"""
+    # Different extractor chains produce different text for the same file
+    return f"{PARSER_VERSION}-{get_extractor_chain().fingerprint}"
+
 class ResumeParserInterface(ABC):
     """Abstract interface for resume parsers"""
     
@@ -25,6 +31,14 @@ class BaseResumeParser(ResumeParserInterface):
     
     def __init__(self):
         self.text_processor = TextProcessor()
+        # Extraction backend used for the last parsed file
+        self.extractor = None
+    
+    def _extract_text(self, file_path: Path) -> str:
+        """Extract text with the configured extractor chain, recording the backend used"""
+        result = get_extractor_chain().extract(file_path)
+        self.extractor = result.extractor
+        return result.text
     
     def _extract_basic_info(self, text: str) -> Dict[str, Any]:
         """Extract basic information from resume text"""
@@ -136,22 +150,8 @@ class PDFResumeParser(BaseResumeParser):
             raise ResumeParsingError(f"Failed to parse PDF resume: {e}")
     
     def _extract_text_from_pdf(self, file_path: Path) -> str:
-        """Extract text from PDF file"""
-        text = ""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-        except Exception as e:
-            logger.warning(f"PyPDF2 failed for {file_path}, trying textract: {e}")
-            try:
-                text = textract.process(str(file_path)).decode('utf-8')
-            except Exception as e2:
-                logger.error(f"Both PyPDF2 and textract failed for {file_path}: {e2}")
-                raise
-        
-        return text
+        """Extract text from PDF file with the configured extractor chain"""
+        return self._extract_text(file_path)
 
 class DocxResumeParser(BaseResumeParser):
     """Parser for DOCX resume files"""
@@ -160,7 +160,7 @@ class DocxResumeParser(BaseResumeParser):
         try:
             logger.info(f"Parsing DOCX resume: {file_path}")
             
-            text = docx2txt.process(str(file_path))
+            text = self._extract_text(file_path)
             if not text.strip():
                 raise ResumeParsingError(f"No text extracted from DOCX: {file_path}")
             
@@ -191,8 +191,7 @@ class DocResumeParser(BaseResumeParser):
         try:
             logger.info(f"Parsing DOC resume: {file_path}")
             
-            # Use textract for DOC files
-            text = textract.process(str(file_path)).decode('utf-8')
+            text = self._extract_text(file_path)
             if not text.strip():
                 raise ResumeParsingError(f"No text extracted from DOC: {file_path}")
             
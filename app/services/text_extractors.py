@@ -0,0 +1,12 @@
+# The registry and chains live in core so the standalone scripts can use them
+# without importing the app; re-exported here for the app's services
+from core.text_extractors import (DEFAULT_EXTRACTOR_CHAINS, LEGACY_EXTRACTOR_CHAINS, ExtractionResult,
+                                  TextExtractionError, TextExtractor, TextExtractorChain,
+                                  available_extractors, configure_extractor_chain, get_extractor,
+                                  get_extractor_chain, register_extractor)
+
+__all__ = [
+    'DEFAULT_EXTRACTOR_CHAINS', 'LEGACY_EXTRACTOR_CHAINS', 'ExtractionResult', 'TextExtractionError',
+    'TextExtractor', 'TextExtractorChain', 'available_extractors', 'configure_extractor_chain',
+    'get_extractor', 'get_extractor_chain', 'register_extractor',
+]
@@ -0,0 +1,333 @@
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import logging
+import numpy as np
+import scipy.sparse as sp
+from app.services.inverted_index import InvertedIndex
+
+logger = logging.getLogger(__name__)
+
+Row = Tuple[np.ndarray, np.ndarray]
+
+def stack_rows(rows: List[Row], index_dtype, count_dtype) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Concatenate per-document (term indices, counts) rows into CSR (indptr, indices, data)"""
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    if not rows:
+        return indptr, np.zeros(0, dtype=index_dtype), np.zeros(0, dtype=count_dtype)
+    indptr[1:] = np.cumsum([len(indices) for indices, _ in rows])
+    indices = np.concatenate([indices for indices, _ in rows]).astype(index_dtype, copy=False)
+    counts = np.concatenate([counts for _, counts in rows]).astype(count_dtype, copy=False)
+    return indptr, indices, counts
+
+def split_rows(indptr: np.ndarray, indices: np.ndarray, counts: np.ndarray) -> List[Row]:
+    """Inverse of stack_rows; rows are views, so memory-mapped arrays stay on disk"""
+    return [(indices[start:end], counts[start:end]) for start, end in zip(indptr[:-1], indptr[1:])]
+
+class TfidfCorpusIndex:
+    """
+    TF-IDF index over a corpus of candidate documents that supports adding and
+    removing single documents without refitting.
+
+    Raw term counts and document frequencies are maintained incrementally; IDF
+    weights and the normalized candidate matrix are rebuilt lazily the next time
+    the index is queried after a change. Weighting matches TfidfVectorizer with
+    smooth_idf=True, sublinear_tf=False and l2 normalization.
+    """
+
+    def __init__(self, stop_words='english', max_features: Optional[int] = 5000,
+                 ngram_range: Tuple[int, int] = (1, 2), lowercase: bool = True):
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        self.max_features = max_features
+        self._analyzer = CountVectorizer(
+            stop_words=stop_words,
+            ngram_range=ngram_range,
+            lowercase=lowercase
+        ).build_analyzer()
+
+        self.vocabulary: Dict[str, int] = {}
+        self._doc_ids: List[Optional[str]] = []
+        self._doc_positions: Dict[str, int] = {}
+        self._rows: List[Optional[Tuple[np.ndarray, np.ndarray]]] = []
+        self._removed_count = 0
+
+        self._df = np.zeros(1024, dtype=np.int64)
+        self._term_totals = np.zeros(1024, dtype=np.int64)
+
+        self._matrix = None
+        self._term_weights = None
+        self._inverted_index = None
+        self._dirty = True
+
+        # Callers hold this lock across sync-and-query sequences
+        self.lock = threading.RLock()
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_positions
+
+    def __len__(self) -> int:
+        return len(self._doc_positions)
+
+    @property
+    def doc_ids(self) -> List[str]:
+        return list(self._doc_positions.keys())
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Add a document, replacing any existing document with the same id"""
+        with self.lock:
+            if doc_id in self._doc_positions:
+                self.remove(doc_id)
+
+            indices, counts = self._count_terms(text, grow_vocabulary=True)
+            self._df[indices] += 1
+            self._term_totals[indices] += counts
+
+            self._doc_positions[doc_id] = len(self._rows)
+            self._doc_ids.append(doc_id)
+            self._rows.append((indices, counts))
+            self._dirty = True
+
+    def add_many(self, doc_ids: List[str], texts: List[str]) -> None:
+        """Add several documents"""
+        with self.lock:
+            for doc_id, text in zip(doc_ids, texts):
+                self.add(doc_id, text)
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document; returns False if it was not indexed"""
+        with self.lock:
+            position = self._doc_positions.pop(doc_id, None)
+            if position is None:
+                return False
+
+            indices, counts = self._rows[position]
+            self._df[indices] -= 1
+            self._term_totals[indices] -= counts
+
+            self._rows[position] = None
+            self._doc_ids[position] = None
+            self._removed_count += 1
+            self._dirty = True
+            return True
+
+    def positions(self, doc_ids: Iterable[str]) -> np.ndarray:
+        """Return matrix row positions of the given documents"""
+        with self.lock:
+            self._ensure_built()
+            return np.fromiter((self._doc_positions[doc_id] for doc_id in doc_ids), dtype=np.int64)
+
+    @property
+    def matrix(self) -> sp.csr_matrix:
+        """Normalized TF-IDF matrix, one row per indexed document"""
+        with self.lock:
+            self._ensure_built()
+            return self._matrix
+
+    @property
+    def inverted_index(self) -> InvertedIndex:
+        """Posting lists over the current matrix, built on first use after a change"""
+        with self.lock:
+            self._ensure_built()
+            if self._inverted_index is None:
+                self._inverted_index = InvertedIndex(self._matrix)
+            return self._inverted_index
+
+    def transform(self, texts: List[str]) -> sp.csr_matrix:
+        """Vectorize query texts against the fitted vocabulary and IDF weights"""
+        with self.lock:
+            self._ensure_built()
+            indptr = [0]
+            indices = []
+            data = []
+            for text in texts:
+                term_indices, counts = self._count_terms(text, grow_vocabulary=False)
+                indices.append(term_indices)
+                data.append(counts)
+                indptr.append(indptr[-1] + len(term_indices))
+
+            counts_matrix = sp.csr_matrix(
+                (np.concatenate(data).astype(np.float64) if data else np.zeros(0),
+                 np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+                 indptr),
+                shape=(len(texts), self._matrix.shape[1])
+            )
+            from sklearn.preprocessing import normalize
+            return normalize(counts_matrix.multiply(self._term_weights).tocsr())
+
+    def similarities(self, text: str) -> np.ndarray:
+        """Cosine similarity of a query text against every indexed document"""
+        with self.lock:
+            query_vector = self.transform([text])
+            return (self._matrix @ query_vector.T).toarray().ravel()
+
+    def top_k(self, query_vector: sp.csr_matrix, k: int, threshold: float,
+              tie_break: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (positions, scores) of the k documents most similar to a query
+        vector from transform() and scoring at least threshold
+        """
+        with self.lock:
+            return self.inverted_index.top_k(query_vector, k, threshold, tie_break)
+
+    def snapshot(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+        """Arrays and metadata describing the built index, as persisted by VectorStore"""
+        with self.lock:
+            self._ensure_built()
+            n_terms = len(self.vocabulary)
+            counts_indptr, counts_indices, counts_data = stack_rows(self._rows, np.int64, np.int64)
+            arrays = {
+                'counts_indptr': counts_indptr,
+                'counts_indices': counts_indices,
+                'counts_data': counts_data,
+                'matrix_indptr': self._matrix.indptr,
+                'matrix_indices': self._matrix.indices,
+                'matrix_data': self._matrix.data,
+                'df': self._df[:n_terms],
+                'term_totals': self._term_totals[:n_terms],
+                'term_weights': self._term_weights,
+            }
+            metadata = {'doc_ids': list(self._doc_ids), 'vocabulary': self.vocabulary}
+            return arrays, metadata
+
+    def restore(self, arrays: Dict[str, np.ndarray], metadata: Dict[str, Any]) -> None:
+        """
+        Replace the index contents with a snapshot. The matrix, term weights and
+        document rows use the given arrays without copying, so memory-mapped
+        arrays stay shared; the first change rebuilds them in memory.
+        """
+        with self.lock:
+            self.vocabulary = dict(metadata['vocabulary'])
+            self._doc_ids = list(metadata['doc_ids'])
+            self._doc_positions = {doc_id: position for position, doc_id in enumerate(self._doc_ids)}
+            self._rows = split_rows(arrays['counts_indptr'], arrays['counts_indices'], arrays['counts_data'])
+            self._removed_count = 0
+
+            n_terms = len(self.vocabulary)
+            self._df = np.zeros(max(1024, n_terms), dtype=np.int64)
+            self._df[:n_terms] = arrays['df']
+            self._term_totals = np.zeros(max(1024, n_terms), dtype=np.int64)
+            self._term_totals[:n_terms] = arrays['term_totals']
+
+            self._term_weights = arrays['term_weights']
+            self._matrix = sp.csr_matrix(
+                (arrays['matrix_data'], arrays['matrix_indices'], arrays['matrix_indptr']),
+                shape=(len(self._doc_ids), n_terms), copy=False
+            )
+            self._inverted_index = None
+            self._dirty = False
+
+    def _count_terms(self, text: str, grow_vocabulary: bool) -> Tuple[np.ndarray, np.ndarray]:
+        term_counts = Counter(self._analyzer(text))
+        indices = []
+        counts = []
+        for term, count in term_counts.items():
+            index = self.vocabulary.get(term)
+            if index is None:
+                if not grow_vocabulary:
+                    continue
+                index = len(self.vocabulary)
+                self.vocabulary[term] = index
+            indices.append(index)
+            counts.append(count)
+
+        if grow_vocabulary:
+            self._ensure_term_capacity(len(self.vocabulary))
+
+        return np.asarray(indices, dtype=np.int64), np.asarray(counts, dtype=np.int64)
+
+    def _ensure_term_capacity(self, size: int) -> None:
+        capacity = len(self._df)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        self._df = np.concatenate([self._df, np.zeros(capacity - len(self._df), dtype=np.int64)])
+        self._term_totals = np.concatenate(
+            [self._term_totals, np.zeros(capacity - len(self._term_totals), dtype=np.int64)]
+        )
+
+    def _compact(self) -> None:
+        """Drop rows of removed documents and renumber positions"""
+        self._rows = [row for row in self._rows if row is not None]
+        self._doc_ids = [doc_id for doc_id in self._doc_ids if doc_id is not None]
+        self._doc_positions = {doc_id: position for position, doc_id in enumerate(self._doc_ids)}
+        self._removed_count = 0
+
+    def _top_features(self, feature_mask: np.ndarray) -> np.ndarray:
+        """
+        Mask of the max_features terms with the highest total counts, as
+        CountVectorizer selects them. Terms tied at the cut are taken in
+        alphabetical order so the selection does not depend on insertion order
+        or sort stability.
+        """
+        terms = np.flatnonzero(feature_mask)
+        term_totals = self._term_totals[terms]
+        kth_total = -np.partition(-term_totals, self.max_features - 1)[self.max_features - 1]
+
+        top_terms = terms[term_totals > kth_total].tolist()
+        # Vocabulary insertion order is index order (compaction preserves it)
+        term_names = list(self.vocabulary)
+        tied_terms = sorted(terms[term_totals == kth_total].tolist(), key=term_names.__getitem__)
+        top_terms.extend(tied_terms[:self.max_features - len(top_terms)])
+
+        top_mask = np.zeros(len(feature_mask), dtype=bool)
+        top_mask[top_terms] = True
+        return top_mask
+
+    def _compact_vocabulary(self) -> None:
+        """Drop terms no remaining document contains and renumber the rest"""
+        n_terms = len(self.vocabulary)
+        live = self._df[:n_terms] > 0
+        if live.all():
+            return
+
+        new_indices = np.cumsum(live) - 1
+        new_index_list = new_indices.tolist()
+        self.vocabulary = {
+            term: new_index_list[index] for term, index in self.vocabulary.items() if live[index]
+        }
+
+        indptr, indices, counts = stack_rows(self._rows, np.int64, np.int64)
+        self._rows = split_rows(indptr, new_indices[indices], counts)
+
+        n_live = len(self.vocabulary)
+        capacity = max(1024, n_live)
+        self._df = np.concatenate([self._df[:n_terms][live], np.zeros(capacity - n_live, dtype=np.int64)])
+        self._term_totals = np.concatenate(
+            [self._term_totals[:n_terms][live], np.zeros(capacity - n_live, dtype=np.int64)]
+        )
+        logger.info(f"Compacted TF-IDF vocabulary: dropped {n_terms - n_live} terms")
+
+    def _ensure_built(self) -> None:
+        if not self._dirty:
+            return
+
+        if self._removed_count:
+            self._compact()
+            # Only removals leave terms with a document frequency of zero
+            self._compact_vocabulary()
+
+        n_terms = len(self.vocabulary)
+        n_docs = len(self._rows)
+        df = self._df[:n_terms]
+
+        # Smoothed IDF as computed by TfidfTransformer
+        idf = np.log((1 + n_docs) / (1 + df)) + 1
+
+        feature_mask = df > 0
+        if self.max_features and feature_mask.sum() > self.max_features:
+            feature_mask = self._top_features(feature_mask)
+
+        self._term_weights = np.where(feature_mask, idf, 0.0)
+
+        indptr, indices, counts = stack_rows(self._rows, np.int64, np.float64)
+        counts_matrix = sp.csr_matrix((counts, indices, indptr), shape=(n_docs, n_terms))
+        weighted = counts_matrix.multiply(self._term_weights).tocsr()
+        weighted.eliminate_zeros()
+        from sklearn.preprocessing import normalize
+        self._matrix = normalize(weighted)
+        self._inverted_index = None
+        self._dirty = False
+
+        logger.info(f"Rebuilt TF-IDF index: {n_docs} documents, {int(feature_mask.sum())} features")
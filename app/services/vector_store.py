@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class VectorStore:
+    """
+    Versioned on-disk snapshots of corpus indexes.
+
+    Each index configuration (engine, vectorizer settings and the parser and
+    preprocessor versions that produced the indexed text) has its own
+    directory holding immutable version directories of .npy arrays plus a JSON
+    metadata file, and a CURRENT file naming the live version:
+
+        <folder>/<settings digest>/CURRENT
+        <folder>/<settings digest>/<version>/{matrix_data,...}.npy, metadata.json
+
+    Versions are written to a temporary directory and renamed into place before
+    CURRENT is atomically replaced, so readers never see partial snapshots.
+    Loading memory-maps the arrays read-only, so every worker process serving
+    the same snapshot shares its pages through the OS page cache.
+    """
+
+    FORMAT_VERSION = 1
+    CURRENT_NAME = 'CURRENT'
+    METADATA_NAME = 'metadata.json'
+
+    def __init__(self, folder: Path, keep_versions: int = 2):
+        self.folder = Path(folder)
+        self.keep_versions = max(1, keep_versions)
+
+    def save(self, settings: Tuple, index) -> str:
+        """Write a new snapshot of index and make it current; returns the version name"""
+        arrays, metadata = index.snapshot()
+        settings_folder = self._settings_folder(settings)
+        settings_folder.mkdir(parents=True, exist_ok=True)
+
+        # Sortable, unique across processes
+        version = f"{time.time_ns():020d}-{os.getpid()}"
+        tmp_folder = Path(tempfile.mkdtemp(prefix='.tmp-', dir=settings_folder))
+        try:
+            for name, array in arrays.items():
+                np.save(tmp_folder / f"{name}.npy", np.ascontiguousarray(array))
+            metadata = dict(metadata, format_version=self.FORMAT_VERSION, settings=list(settings))
+            with open(tmp_folder / self.METADATA_NAME, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f)
+            os.rename(tmp_folder, settings_folder / version)
+        except Exception:
+            shutil.rmtree(tmp_folder, ignore_errors=True)
+            raise
+
+        self._write_current(settings_folder, version)
+        self._prune(settings_folder, version)
+        logger.info(f"Saved vector store version {version} ({len(metadata['doc_ids'])} documents)")
+        return version
+
+    def load(self, settings: Tuple, index) -> Optional[str]:
+        """Restore index from the current snapshot, memory-mapped; returns the version or None"""
+        settings_folder = self._settings_folder(settings)
+        version = self.current_version(settings)
+        if version is None:
+            return None
+
+        version_folder = settings_folder / version
+        try:
+            with open(version_folder / self.METADATA_NAME, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+            if metadata.get('format_version') != self.FORMAT_VERSION:
+                logger.warning(f"Ignoring vector store version {version} with an old format")
+                return None
+
+            arrays = {
+                path.stem: np.load(path, mmap_mode='r')
+                for path in version_folder.glob('*.npy')
+            }
+            index.restore(arrays, metadata)
+        except Exception as e:
+            logger.warning(f"Could not load vector store version {version}: {e}")
+            return None
+
+        logger.info(f"Loaded vector store version {version} ({len(metadata['doc_ids'])} documents)")
+        return version
+
+    def current_version(self, settings: Tuple) -> Optional[str]:
+        try:
+            version = (self._settings_folder(settings) / self.CURRENT_NAME).read_text().strip()
+        except FileNotFoundError:
+            return None
+        return version or None
+
+    def _settings_folder(self, settings: Tuple) -> Path:
+        digest = hashlib.sha256(json.dumps(list(settings)).encode('utf-8')).hexdigest()[:16]
+        return self.folder / digest
+
+    def _write_current(self, settings_folder: Path, version: str):
+        fd, tmp_path = tempfile.mkstemp(dir=settings_folder, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(version)
+            os.replace(tmp_path, settings_folder / self.CURRENT_NAME)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def _prune(self, settings_folder: Path, current: str):
+        """Delete the oldest versions beyond keep_versions (never the current one)"""
+        versions: List[str] = sorted(
+            path.name for path in settings_folder.iterdir()
+            if path.is_dir() and not path.name.startswith('.')
+        )
+        for version in versions[:-self.keep_versions]:
+            if version != current:
+                # Processes still mapping it keep their pages until they unmap
+                shutil.rmtree(settings_folder / version, ignore_errors=True)
@@ -14,6 +14,10 @@ class FileServiceError(RSARTException):
     """Exception raised when file operations fail"""
     pass
 
+class JobQueueError(RSARTException):
+    """Exception raised when a background job cannot be queued"""
+    pass
+
 class AuthenticationError(RSARTException):
     """Exception raised when authentication fails"""
     pass
@@ -1,15 +1,48 @@
 import re
-import string
-from typing import List
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from nltk.tokenize import word_tokenize
+from functools import lru_cache
+from typing import Iterable, List
+
+# Bump whenever preprocess output changes so stored corpus vectors are rebuilt
+PREPROCESSOR_VERSION = '1'
+
+# Maximum number of distinct tokens whose lemma is memoized (shared by all instances)
+LEMMA_CACHE_SIZE = 100000
+
+# After cleaning, text holds only lowercase ASCII letters separated by whitespace,
+# so word_tokenize reduces to splitting on letter runs plus its contraction rules
+_TOKEN_PATTERN = re.compile(r'[a-zA-Z]+')
+
+# Splits word_tokenize applies to whole letter-only words
+_CONTRACTION_SPLITS = {
+    'cannot': ('can', 'not'),
+    'gimme': ('gim', 'me'),
+    'gonna': ('gon', 'na'),
+    'gotta': ('got', 'ta'),
+    'lemme': ('lem', 'me'),
+    'wanna': ('wan', 'na'),
+}
+
+# Created by the first TextProcessor, so importing this module does not load NLTK
+_lemmatizer = None
+
+def _get_lemmatizer():
+    global _lemmatizer
+    if _lemmatizer is None:
+        from nltk.stem import WordNetLemmatizer
+        _lemmatizer = WordNetLemmatizer()
+    return _lemmatizer
+
+@lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def _lemmatize(token: str) -> str:
+    return _get_lemmatizer().lemmatize(token)
 
 class TextProcessor:
     """Utility class for text processing operations"""
     
     def __init__(self):
+        import nltk
+        from nltk.corpus import stopwords
+        
         # Download required NLTK data if not present
         try:
             nltk.data.find('tokenizers/punkt')
@@ -27,30 +60,33 @@ class TextProcessor:
             nltk.download('wordnet')
         
         self.stop_words = set(stopwords.words('english'))
-        self.lemmatizer = WordNetLemmatizer()
+        self.lemmatizer = _get_lemmatizer()
     
     def preprocess(self, text: str) -> str:
         """Complete text preprocessing pipeline"""
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and digits
-        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Lowercase, then tokenize on letter runs; everything else (special
+        # characters, digits, whitespace) only separates tokens
+        tokens = _TOKEN_PATTERN.findall(text.lower())
         
-        # Tokenize
-        tokens = word_tokenize(text)
+        # Remove stop words and lemmatize (lemmas are memoized across calls)
+        stop_words = self.stop_words
+        processed_tokens = []
+        for token in tokens:
+            split = _CONTRACTION_SPLITS.get(token)
+            for part in split or (token,):
+                if len(part) > 2 and part not in stop_words:
+                    processed_tokens.append(_lemmatize(part))
         
-        # Remove stop words and lemmatize
-        processed_tokens = [
-            self.lemmatizer.lemmatize(token)
-            for token in tokens
-            if token not in self.stop_words and len(token) > 2
-        ]
-        
-        return ' '.join(processed_tokens)
\ No newline at end of file
+        return ' '.join(processed_tokens)
+    
+    def preprocess_batch(self, texts: Iterable[str]) -> List[str]:
+        """Preprocess several documents, sharing the lemma cache between them"""
+        return [self.preprocess(text) for text in texts]
+    
+    @staticmethod
+    def lemma_cache_info():
+        """Hit/miss statistics of the shared lemma cache"""
+        return _lemmatize.cache_info()
@@ -0,0 +1,104 @@
+"""
+Benchmark every registered text extraction backend over a folder of resumes.
+
+Each backend runs in its own process over every file with an extension it
+handles, and reports throughput, median and p95 latency, resident memory growth
+and text yield (share of files with text, average characters per file).
+Usage: python benchmarks/bench_extractors.py <folder> [--backends a,b] [--json out.json]
+"""
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.text_extractors import available_extractors, get_extractor
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def run_backend(name, file_paths, repeat, results):
+    """Run one backend in a fresh process and put its statistics on the results queue"""
+    extractor = get_extractor(name)
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    latencies = []
+    characters = []
+    failures = 0
+    total_bytes = 0
+
+    for file_path in file_paths:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                text = extractor.extract(file_path)
+            except Exception:
+                text = None
+            latencies.append(time.perf_counter() - start)
+        if text is None:
+            failures += 1
+        characters.append(len(text.strip()) if text else 0)
+        total_bytes += file_path.stat().st_size
+
+    elapsed = sum(latencies)
+    results.put({
+        'backend': name,
+        'files': len(file_paths),
+        'failed': failures,
+        'files_per_s': len(latencies) / elapsed if elapsed else 0.0,
+        'mb_per_s': total_bytes * repeat / elapsed / 1e6 if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'rss_growth_mb': (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss) / 1024,
+        'text_yield': sum(1 for count in characters if count) / len(characters) if characters else 0.0,
+        'avg_chars': sum(characters) / len(characters) if characters else 0.0,
+    })
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('folder', type=Path, help='folder of sample resumes (searched recursively)')
+    parser.add_argument('--backends', help='comma-separated backend names (default: all)')
+    parser.add_argument('--repeat', type=int, default=1, help='extractions per file')
+    parser.add_argument('--json', type=Path, help='also write results to this file')
+    args = parser.parse_args()
+
+    files = [path for path in sorted(args.folder.rglob('*')) if path.is_file()]
+    backends = available_extractors()
+    if args.backends:
+        wanted = args.backends.split(',')
+        backends = [backend for backend in backends if backend.name in wanted]
+
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for backend in backends:
+        backend_files = [path for path in files if path.suffix.lower() in backend.extensions]
+        if not backend_files:
+            continue
+        queue = context.Queue()
+        process = context.Process(target=run_backend, args=(backend.name, backend_files, args.repeat, queue))
+        process.start()
+        results.append(queue.get())
+        process.join()
+
+    header = f"{'backend':<12} {'files':>6} {'failed':>6} {'files/s':>9} {'MB/s':>7} {'p50 ms':>8} " \
+             f"{'p95 ms':>8} {'+rss MB':>7} {'yield':>6} {'chars':>8}"
+    print(header)
+    print('-' * len(header))
+    for row in results:
+        print(f"{row['backend']:<12} {row['files']:>6} {row['failed']:>6} {row['files_per_s']:>9.1f} "
+              f"{row['mb_per_s']:>7.2f} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} "
+              f"{row['rss_growth_mb']:>7.1f} {row['text_yield']:>6.0%} {row['avg_chars']:>8.0f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+if __name__ == '__main__':
+    main()
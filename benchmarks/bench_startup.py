@@ -0,0 +1,200 @@
+"""
+Benchmark application startup: import and create_app time, and which heavy modules get loaded.
+
+Scenarios (each run in a fresh interpreter):
+  import      import the app package
+  create_app  import plus create_app()
+  health      create_app() and one GET /health through the test client
+  init_db     load app.py and run its init_db command, as `flask init_db` does
+
+None of these may load the NLP, PDF or vectorization stacks; those are imported
+on first use. A scenario that loads any of FORBIDDEN_MODULES is reported and
+makes the script exit with status 1. Results use the run_benchmarks.py format,
+so two runs can be diffed with compare_benchmarks.py. SECRET_KEY and
+DATABASE_URL default to throwaway values when unset.
+Usage: python benchmarks/bench_startup.py [--config testing] [--repeat 5] [--imports N] [--out startup.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from run_benchmarks import ROOT, git_commit
+
+FORBIDDEN_MODULES = ('nltk', 'spacy', 'sklearn', 'gensim', 'pandas', 'PyPDF2', 'pdfminer', 'textract',
+                     'docx2txt', 'core.functions', 'core.pdf_text')
+
+SCENARIOS = {
+    'import': """
+import app
+""",
+    'create_app': """
+from app import create_app
+create_app(CONFIG)
+""",
+    'health': """
+from app import create_app
+response = create_app(CONFIG).test_client().get('/health')
+assert response.status_code == 200, response.status_code
+""",
+    'init_db': """
+import importlib.util
+spec = importlib.util.spec_from_file_location('manage', ROOT / 'app.py')
+manage = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(manage)
+result = manage.app.test_cli_runner().invoke(manage.init_db)
+assert result.exit_code == 0, result.output
+""",
+}
+
+# Runs in the child; reports elapsed time, memory and loaded modules as JSON on the last stdout line
+CHILD = """
+import json, logging, resource, sys, time
+from pathlib import Path
+ROOT = Path({root!r})
+CONFIG = {config!r}
+sys.path.insert(0, str(ROOT))
+logging.disable(logging.CRITICAL)
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps({{'seconds': elapsed, 'rss_growth_mb': rss_after - rss_before, 'peak_rss_mb': rss_after,
+                   'modules': sorted(sys.modules)}}))
+"""
+
+def run_child(name: str, config: str, workdir: str, importtime: bool = False) -> dict:
+    """Run one scenario in a fresh interpreter; returns its report, plus stderr when importtime is set"""
+    code = CHILD.format(root=str(ROOT), config=config, body=SCENARIOS[name])
+    env = dict(os.environ)
+    env.setdefault('SECRET_KEY', 'startup-benchmark')
+    env.setdefault('DATABASE_URL', 'sqlite://')
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', code]
+    completed = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr.strip()
+                           else f"exit status {completed.returncode}")
+    report = json.loads(completed.stdout.strip().splitlines()[-1])
+    report['stderr'] = completed.stderr
+    return report
+
+def forbidden_loaded(modules) -> list:
+    return sorted(name for name in FORBIDDEN_MODULES
+                  if any(module == name or module.startswith(name + '.') for module in modules))
+
+def slowest_imports(importtime_output: str, count: int) -> list:
+    """Packages with the highest cumulative import time, from -X importtime output"""
+    packages = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        # The outermost import of a package includes all of its submodules
+        package = module.strip().split('.')[0]
+        packages[package] = max(packages.get(package, 0.0), int(cumulative) / 1e6)
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:count]
+    return [{'module': package, 'seconds': seconds} for package, seconds in ranked]
+
+def measure_scenario(name: str, config: str, repeat: int, imports: int, workdir: str) -> dict:
+    times = []
+    rss_growth = []
+    peak_rss = []
+    modules = set()
+    for _ in range(repeat):
+        report = run_child(name, config, workdir)
+        times.append(report['seconds'])
+        rss_growth.append(report['rss_growth_mb'])
+        peak_rss.append(report['peak_rss_mb'])
+        modules.update(report['modules'])
+
+    median = statistics.median(times)
+    result = {
+        'name': f"startup.{name}",
+        'documents': 1,
+        'times_s': times,
+        'min_s': min(times),
+        'median_s': median,
+        'docs_per_s': 1 / median if median else 0.0,
+        'rss_growth_mb': statistics.median(rss_growth),
+        'peak_rss_mb': max(peak_rss),
+        'modules_loaded': len(modules),
+        'forbidden_modules': forbidden_loaded(modules),
+    }
+    if imports:
+        # Separate run: -X importtime slows the interpreter down
+        result['slowest_imports'] = slowest_imports(run_child(name, config, workdir, importtime=True)['stderr'],
+                                                    imports)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--config', default='testing', help='configuration passed to create_app')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='comma-separated scenarios')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--imports', type=int, default=0, metavar='N',
+                        help='also list the N packages slowest to import per scenario')
+    parser.add_argument('--out', type=Path, help='results file (default: print only)')
+    args = parser.parse_args()
+
+    scenarios = args.scenarios.split(',')
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        sys.exit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'corpus': None,
+            'resumes': 0,
+            'jobs': 0,
+            'repeat': args.repeat,
+            'config': args.config,
+        },
+        'results': {},
+    }
+
+    # Data folders and the log file are created relative to the working directory
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in scenarios:
+            try:
+                result = measure_scenario(name, args.config, args.repeat, args.imports, workdir)
+            except Exception as e:
+                result = {'name': f"startup.{name}", 'error': f"{type(e).__name__}: {e}"}
+            report['results'][result['name']] = result
+
+    header = f"{'benchmark':<20} {'median s':>9} {'min s':>8} {'+rss MB':>8} {'modules':>8}  heavy modules loaded"
+    print(header)
+    print('-' * len(header))
+    failed = []
+    for name, row in report['results'].items():
+        if 'error' in row:
+            print(f"{name:<20} error: {row['error']}")
+            failed.append(name)
+            continue
+        print(f"{name:<20} {row['median_s']:>9.3f} {row['min_s']:>8.3f} {row['rss_growth_mb']:>8.1f} "
+              f"{row['modules_loaded']:>8}  {', '.join(row['forbidden_modules']) or '-'}")
+        for entry in row.get('slowest_imports', []):
+            print(f"    {entry['seconds']:>8.3f}  {entry['module']}")
+        if row['forbidden_modules']:
+            failed.append(name)
+
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+
+    if failed:
+        print(f"\n{len(failed)} scenario(s) failed or loaded heavy modules: {', '.join(failed)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
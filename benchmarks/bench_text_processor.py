@@ -0,0 +1,87 @@
+"""
+Compare TextProcessor.preprocess with the original NLTK pipeline.
+
+Checks that both produce identical output on every document, then reports
+timings. Usage: python benchmarks/bench_text_processor.py [resume_dir] [--repeat N]
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from nltk.tokenize import word_tokenize
+from app.utils.text_processor import TextProcessor
+
+VOCABULARY = (
+    "Python Java SQL machine learning data science developed deployed managed team "
+    "projects engineering analysis customers increased revenue 25% cannot gonna wanna "
+    "led built services APIs AWS Docker Kubernetes React e-mail: jane.doe@example.com "
+    "+1 (555) 010-2030 2019-2023 B.Sc. M.Sc. university responsible for running tests"
+).split()
+
+def legacy_preprocess(processor: TextProcessor, text: str) -> str:
+    """The pipeline TextProcessor.preprocess used before the fast path"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    tokens = word_tokenize(text)
+    return ' '.join(
+        processor.lemmatizer.lemmatize(token)
+        for token in tokens
+        if token not in processor.stop_words and len(token) > 2
+    )
+
+def synthetic_documents(count: int, words: int = 600, seed: int = 0):
+    rng = random.Random(seed)
+    return [' '.join(rng.choice(VOCABULARY) for _ in range(words)) for _ in range(count)]
+
+def load_documents(folder: Path):
+    from app.services.parse_pool import parse_resume_file
+    documents = []
+    for path in sorted(folder.iterdir()):
+        outcome = parse_resume_file(path)
+        if outcome.ok:
+            documents.append(outcome.candidate.resume_text)
+    return documents
+
+def timed(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('resume_dir', nargs='?', type=Path, help='folder of resumes (default: synthetic text)')
+    parser.add_argument('--documents', type=int, default=200, help='number of synthetic documents')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    documents = load_documents(args.resume_dir) if args.resume_dir else synthetic_documents(args.documents)
+    processor = TextProcessor()
+
+    legacy = [legacy_preprocess(processor, text) for text in documents]
+    fast = processor.preprocess_batch(documents)
+    mismatches = sum(1 for a, b in zip(legacy, fast) if a != b)
+    if mismatches:
+        print(f"{mismatches} of {len(documents)} documents differ from the legacy pipeline")
+        sys.exit(1)
+
+    legacy_time = timed(lambda: [legacy_preprocess(processor, text) for text in documents], args.repeat)
+    fast_time = timed(lambda: processor.preprocess_batch(documents), args.repeat)
+
+    print(f"documents:  {len(documents)} (outputs identical)")
+    print(f"legacy:     {legacy_time * 1000:.1f} ms")
+    print(f"fast path:  {fast_time * 1000:.1f} ms ({legacy_time / fast_time:.1f}x)")
+    print(f"lemma cache: {TextProcessor.lemma_cache_info()}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Compare benchmark results from run_benchmarks.py against a stored baseline.
+
+Reports the change in median time and resident memory growth per benchmark
+and flags benchmarks slower than the baseline by more than --threshold.
+Benchmarks present in only one file, or that errored, are listed separately.
+Exits with status 1 when any benchmark regressed, so it can gate CI.
+Usage: python benchmarks/compare_benchmarks.py <baseline.json> <results.json> [--threshold 0.10]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+def load(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('baseline', type=Path)
+    parser.add_argument('results', type=Path)
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='relative median slowdown counted as a regression (default 0.10)')
+    args = parser.parse_args()
+
+    baseline, results = load(args.baseline), load(args.results)
+    for label, report in (('baseline', baseline), ('results', results)):
+        meta = report['meta']
+        print(f"{label:<9} commit {str(meta.get('commit'))[:10]}  {meta['resumes']} resumes  "
+              f"python {meta['python']}  {meta['cpus']} cpus  {meta['created_at']}")
+    if baseline['meta'].get('corpus') != results['meta'].get('corpus') \
+            or baseline['meta']['resumes'] != results['meta']['resumes']:
+        print("warning: results were measured on different corpora")
+    print()
+
+    header = f"{'benchmark':<20} {'base s':>9} {'new s':>9} {'change':>8} {'base MB':>8} {'new MB':>8}"
+    print(header)
+    print('-' * len(header))
+
+    regressions = []
+    skipped = []
+    for name in sorted(set(baseline['results']) | set(results['results'])):
+        before = baseline['results'].get(name)
+        after = results['results'].get(name)
+        if before is None or after is None:
+            skipped.append(f"{name}: only in {'results' if before is None else 'baseline'}")
+            continue
+        if 'error' in before or 'error' in after:
+            skipped.append(f"{name}: {after.get('error') or before.get('error')}")
+            continue
+
+        change = after['median_s'] / before['median_s'] - 1 if before['median_s'] else 0.0
+        flag = ''
+        if change > args.threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        elif change < -args.threshold:
+            flag = '  faster'
+        print(f"{name:<20} {before['median_s']:>9.3f} {after['median_s']:>9.3f} {change:>+8.1%} "
+              f"{before['rss_growth_mb']:>8.1f} {after['rss_growth_mb']:>8.1f}{flag}")
+
+    if skipped:
+        print("\nnot compared:")
+        for line in skipped:
+            print(f"  {line}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Compare the 'hashing' matching engine against the 'tfidf' engine.
+
+Ranks the same candidates for several job descriptions with both engines and
+reports shortlist overlap, top-1 agreement and Spearman correlation of the full
+score vectors, plus index build times. Also checks that sharded parallel
+vectorization yields exactly the matrix of a serial build.
+Usage: python benchmarks/compare_matching_engines.py [resume_dir] [--candidates N] [--jobs M]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+from scipy.stats import spearmanr
+from app.models.candidate import Candidate
+from app.models.job_description import JobDescription
+from app.services.hashing_index import HashingCorpusIndex
+from app.services.matching_service import ResumeMatchingService, _corpus_indexes
+
+SKILLS = (
+    "python java javascript typescript sql postgresql react angular vue docker kubernetes aws azure gcp "
+    "terraform linux spark hadoop kafka airflow pandas numpy tensorflow pytorch scikit django flask "
+    "spring node graphql rest microservices ci cd jenkins git agile scrum leadership communication "
+    "mentoring analytics tableau excel statistics nlp vision forecasting security networking"
+).split()
+
+FILLER = (
+    "developed designed implemented managed led built delivered improved maintained team project "
+    "customers platform services pipeline product data system performance reliability features"
+).split()
+
+def synthetic_texts(count: int, rng: random.Random, length: int = 250):
+    # Zipf-like skill popularity so some terms are common and most are rare
+    weights = [1.0 / (rank + 1) for rank in range(len(SKILLS))]
+    texts = []
+    for _ in range(count):
+        skills = rng.choices(SKILLS, weights=weights, k=length // 5)
+        filler = rng.choices(FILLER, k=length - len(skills))
+        words = skills + filler
+        rng.shuffle(words)
+        texts.append(' '.join(words))
+    return texts
+
+def load_texts(folder: Path):
+    from app.services.parse_pool import parse_resume_file
+    outcomes = [parse_resume_file(path) for path in sorted(folder.iterdir())]
+    return [outcome.candidate.resume_text for outcome in outcomes if outcome.ok]
+
+def full_scores(service, job, candidates):
+    ranked = service.match_candidates(job, candidates)
+    scores = np.zeros(len(candidates))
+    positions = {id(candidate): index for index, candidate in enumerate(candidates)}
+    for candidate in ranked.full_ranking():
+        scores[positions[id(candidate)]] = candidate.score
+    return [candidate.id for candidate in ranked], scores
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('resume_dir', nargs='?', type=Path, help='folder of resumes (default: synthetic text)')
+    parser.add_argument('--candidates', type=int, default=2000)
+    parser.add_argument('--jobs', type=int, default=20)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--shard-workers', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    texts = load_texts(args.resume_dir) if args.resume_dir else synthetic_texts(args.candidates, rng)
+    candidates = [Candidate(name=f"candidate-{index}", resume_text=text) for index, text in enumerate(texts)]
+    jobs = [JobDescription(description=text) for text in synthetic_texts(args.jobs, rng, length=60)]
+
+    results = {}
+    for engine in ('tfidf', 'hashing'):
+        _corpus_indexes.clear()
+        service = ResumeMatchingService(top_candidates_count=args.top, similarity_threshold=0.0, engine=engine)
+        start = time.perf_counter()
+        service._sync_corpus_index(candidates, [service._document_key(candidate) for candidate in candidates])
+        service.corpus_index.matrix
+        build_time = time.perf_counter() - start
+        results[engine] = (build_time, [full_scores(service, job, candidates) for job in jobs])
+
+    overlaps, top1, correlations = [], [], []
+    for (tfidf_top, tfidf_scores), (hashing_top, hashing_scores) in zip(results['tfidf'][1], results['hashing'][1]):
+        overlaps.append(len(set(tfidf_top) & set(hashing_top)) / max(len(tfidf_top), 1))
+        top1.append(bool(tfidf_top) and bool(hashing_top) and tfidf_top[0] == hashing_top[0])
+        correlations.append(spearmanr(tfidf_scores, hashing_scores).correlation)
+
+    # Sharded parallel vectorization must stack to the serial matrix
+    processed = [service._prepare_candidate_text(candidate) for candidate in candidates]
+    doc_ids = [candidate.id for candidate in candidates]
+    shard_size = max(1, len(processed) // (args.shard_workers * 2))
+    serial = HashingCorpusIndex(shard_size=shard_size)
+    sharded = HashingCorpusIndex(shard_size=shard_size, shard_workers=args.shard_workers)
+    start = time.perf_counter()
+    serial.add_many(doc_ids, processed)
+    serial_time = time.perf_counter() - start
+    start = time.perf_counter()
+    sharded.add_many(doc_ids, processed)
+    sharded_time = time.perf_counter() - start
+    identical = (serial.matrix != sharded.matrix).nnz == 0
+
+    print(f"candidates: {len(candidates)}, jobs: {len(jobs)}, top-{args.top}")
+    print(f"build (preprocess + vectorize): tfidf {results['tfidf'][0]:.2f}s, hashing {results['hashing'][0]:.2f}s")
+    print(f"vectorize only: serial {serial_time:.2f}s, {args.shard_workers} shard workers {sharded_time:.2f}s "
+          f"(matrices identical: {identical})")
+    print(f"top-{args.top} overlap: mean {np.mean(overlaps):.3f}, min {np.min(overlaps):.3f}")
+    print(f"top-1 agreement: {np.mean(top1):.3f}")
+    print(f"spearman rho over all candidates: mean {np.mean(correlations):.3f}, min {np.min(correlations):.3f}")
+
+if __name__ == '__main__':
+    main()
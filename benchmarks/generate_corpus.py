@@ -0,0 +1,248 @@
+"""
+Generate a synthetic corpus of resumes and job descriptions for benchmarking.
+
+Resumes are written as PDF, DOCX and TXT (round-robin over --formats) with a
+name, contact details and skills, education and experience sections; job
+descriptions are TXT. Every document is derived from (--seed, its index), so
+a corpus is reproducible regardless of --workers. The layout mirrors the app's
+data folder:
+
+    <out>/uploaded_resumes/resume_000001.pdf ...
+    <out>/job_descriptions/job_0001.txt ...
+    <out>/manifest.json
+
+Usage: python benchmarks/generate_corpus.py <out> [--resumes N] [--jobs M] [--formats pdf,docx,txt]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+FIRST_NAMES = (
+    "James Mary Robert Patricia John Jennifer Michael Linda David Elizabeth William Barbara Richard Susan "
+    "Joseph Jessica Thomas Sarah Priya Wei Ahmed Fatima Carlos Sofia Kenji Yuki Olga Ivan Amara Kwame"
+).split()
+
+LAST_NAMES = (
+    "Smith Johnson Williams Brown Jones Garcia Miller Davis Rodriguez Martinez Hernandez Lopez Gonzalez "
+    "Wilson Anderson Thomas Taylor Moore Jackson Martin Lee Patel Chen Kim Nguyen Singh Okafor Novak"
+).split()
+
+SKILLS = (
+    "python java javascript typescript sql postgresql react angular vue docker kubernetes aws azure gcp "
+    "terraform linux spark hadoop kafka airflow pandas numpy tensorflow pytorch scikit django flask "
+    "spring node graphql rest microservices jenkins git agile scrum leadership communication "
+    "mentoring analytics tableau excel statistics nlp forecasting security networking"
+).split()
+
+DEGREES = ("B.Sc. in Computer Science", "B.Tech in Information Technology", "M.Sc. in Data Science",
+           "MBA in Operations", "B.E. in Electronics", "M.S. in Statistics", "Ph.D. in Machine Learning")
+
+UNIVERSITIES = ("State University", "Institute of Technology", "City College", "National University",
+                "Polytechnic University", "University of Applied Sciences")
+
+ROLES = ("Software Engineer", "Data Scientist", "Backend Developer", "DevOps Engineer", "Data Analyst",
+         "Machine Learning Engineer", "Frontend Developer", "Engineering Manager", "QA Engineer")
+
+COMPANIES = ("Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Enterprises",
+             "Hooli", "Vandelay Industries", "Soylent Systems", "Cyberdyne")
+
+VERBS = ("Developed", "Designed", "Implemented", "Managed", "Led", "Built", "Delivered", "Improved",
+         "Maintained", "Automated", "Migrated", "Optimized")
+
+OBJECTS = ("data pipelines", "customer platform", "internal services", "reporting dashboards",
+           "deployment pipeline", "search features", "payment system", "recommendation engine",
+           "monitoring stack", "mobile backend")
+
+FORMATS = ('pdf', 'docx', 'txt')
+
+# Zipf-like skill popularity so some terms are common and most are rare
+SKILL_WEIGHTS = [1.0 / (rank + 1) for rank in range(len(SKILLS))]
+
+def document_rng(seed: int, kind: str, index: int) -> random.Random:
+    return random.Random(f"{seed}:{kind}:{index}")
+
+def resume_lines(rng: random.Random, words: int):
+    """Lines of one resume of roughly `words` words"""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    skills = sorted(set(rng.choices(SKILLS, weights=SKILL_WEIGHTS, k=12)))
+    lines = [
+        name,
+        f"Email: {name.lower().replace(' ', '.')}@example.com",
+        f"Phone: +1 ({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        "",
+        "Skills",
+        ", ".join(skills),
+        "",
+        "Education",
+    ]
+    for _ in range(rng.randint(1, 2)):
+        lines.append(f"{rng.choice(DEGREES)}, {rng.choice(UNIVERSITIES)}, {rng.randint(1995, 2022)}")
+    lines += ["", "Experience"]
+
+    written = sum(len(line.split()) for line in lines)
+    year = 2024
+    while written < words:
+        start = year - rng.randint(1, 5)
+        lines.append(f"{rng.choice(ROLES)} at {rng.choice(COMPANIES)}, {start} - {year}")
+        for _ in range(rng.randint(3, 6)):
+            used = rng.sample(skills, k=min(3, len(skills)))
+            line = f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {', '.join(used)}, " \
+                   f"improving performance by {rng.randint(5, 60)}%"
+            lines.append(line)
+            written += len(line.split())
+        year = start
+    return lines
+
+def job_description_text(rng: random.Random) -> str:
+    role = rng.choice(ROLES)
+    required = sorted(set(rng.choices(SKILLS, weights=SKILL_WEIGHTS, k=8)))
+    preferred = sorted(set(rng.choices(SKILLS, k=4)) - set(required))
+    return "\n".join([
+        role,
+        f"We are hiring a {role} to join our {rng.choice(OBJECTS)} team.",
+        f"Required skills: {', '.join(required)}.",
+        f"Nice to have: {', '.join(preferred) or 'none'}.",
+        f"{rng.choice(VERBS)} and own {rng.choice(OBJECTS)} with {rng.randint(2, 8)}+ years of experience.",
+    ]) + "\n"
+
+def _pdf_escape(line: str) -> bytes:
+    escaped = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return escaped.encode('latin-1', 'replace')
+
+def write_pdf(path: Path, lines, lines_per_page: int = 50):
+    """Write lines as a minimal text PDF (Helvetica, one content stream per page)"""
+    pages = [lines[start:start + lines_per_page] for start in range(0, len(lines), lines_per_page)] or [[]]
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    pages_id = 2 + 2 * len(pages)
+    kids = []
+    for page_lines in pages:
+        stream = b"BT /F1 10 Tf 50 760 Td 14 TL " + b" ".join(
+            b"(" + _pdf_escape(line) + b") '" for line in page_lines
+        ) + b" ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 1 0 R >> >> /Contents %d 0 R >>" % (pages_id, len(objects)))
+        kids.append(len(objects))
+    objects.append(b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)))
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, len(objects), xref)
+    path.write_bytes(bytes(output))
+
+DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+DOCX_RELATIONSHIPS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="word/document.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    '</Relationships>'
+)
+
+def write_docx(path: Path, lines):
+    """Write lines as a minimal DOCX package, one paragraph per line (python-docx is ~100x slower)"""
+    paragraphs = ''.join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>' for line in lines
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{paragraphs}</w:body></w:document>'
+    )
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as package:
+        package.writestr('[Content_Types].xml', DOCX_CONTENT_TYPES)
+        package.writestr('_rels/.rels', DOCX_RELATIONSHIPS)
+        package.writestr('word/document.xml', document)
+
+def write_txt(path: Path, lines):
+    path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+WRITERS = {'pdf': write_pdf, 'docx': write_docx, 'txt': write_txt}
+
+def write_resumes(folder: Path, seed: int, indices, formats, words: int):
+    """Write the resumes with the given indices; runs in worker processes"""
+    for index in indices:
+        extension = formats[index % len(formats)]
+        lines = resume_lines(document_rng(seed, 'resume', index), words)
+        WRITERS[extension](folder / f"resume_{index + 1:06d}.{extension}", lines)
+    return len(indices)
+
+def generate(out: Path, resumes: int, jobs: int, formats, words: int, seed: int, workers: int) -> dict:
+    resume_folder = out / 'uploaded_resumes'
+    job_folder = out / 'job_descriptions'
+    resume_folder.mkdir(parents=True, exist_ok=True)
+    job_folder.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    batches = [range(begin, min(begin + 1000, resumes)) for begin in range(0, resumes, 1000)]
+    if workers > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(write_resumes, resume_folder, seed, batch, formats, words)
+                       for batch in batches]
+            for future in futures:
+                future.result()
+    else:
+        for batch in batches:
+            write_resumes(resume_folder, seed, batch, formats, words)
+
+    for index in range(jobs):
+        text = job_description_text(document_rng(seed, 'job', index))
+        (job_folder / f"job_{index + 1:04d}.txt").write_text(text, encoding='utf-8')
+
+    manifest = {
+        'resumes': resumes,
+        'jobs': jobs,
+        'formats': list(formats),
+        'resume_words': words,
+        'seed': seed,
+        'generated_in_s': round(time.perf_counter() - start, 2),
+    }
+    (out / 'manifest.json').write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('out', type=Path, help='output folder')
+    parser.add_argument('--resumes', type=int, default=100, help='number of resumes (e.g. 100 to 100000)')
+    parser.add_argument('--jobs', type=int, default=10, help='number of job descriptions')
+    parser.add_argument('--formats', default=','.join(FORMATS), help='comma-separated resume formats')
+    parser.add_argument('--resume-words', type=int, default=400, help='approximate words per resume')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=1, help='processes writing resumes')
+    args = parser.parse_args()
+
+    formats = args.formats.split(',')
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        sys.exit(f"Unknown formats: {', '.join(sorted(unknown))}")
+
+    manifest = generate(args.out, args.resumes, args.jobs, formats, args.resume_words, args.seed, args.workers)
+    print(f"Wrote {manifest['resumes']} resumes and {manifest['jobs']} job descriptions to {args.out} "
+          f"in {manifest['generated_in_s']}s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,273 @@
+"""
+Run timing and memory benchmarks of the resume pipeline over a generated corpus.
+
+Suites (each in a fresh process, so memory figures are per suite):
+  parse       ResumeParserFactory parsers, per file type
+  extract     core.functions.extract_text, per file type
+  preprocess  TextProcessor.preprocess over extracted resume texts
+  match       ResumeMatchingService.match_candidates, cold (index built) and warm, with
+              pruned top-k retrieval (default threshold) and dense scoring
+  screen      the legacy screen.res pipeline
+
+Every measurement is repeated --repeat times; results (all timings, median,
+throughput and resident memory growth) are written as JSON for
+compare_benchmarks.py. A suite whose dependencies are missing is recorded with
+its error instead of failing the run.
+Usage: python benchmarks/run_benchmarks.py <corpus> [--suites a,b] [--limit N] [--repeat R] [--out results.json]
+       [--suite-timeout S]
+"""
+import argparse
+import contextlib
+import gc
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import queue
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+def rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def measure(name: str, func, documents: int, repeat: int) -> dict:
+    """Time func repeat times and report throughput and peak memory growth"""
+    baseline = rss_mb()
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    median = statistics.median(times)
+    return {
+        'name': name,
+        'documents': documents,
+        'times_s': times,
+        'min_s': min(times),
+        'median_s': median,
+        'docs_per_s': documents / median if median else 0.0,
+        'rss_growth_mb': rss_mb() - baseline,
+        'peak_rss_mb': rss_mb(),
+    }
+
+def by_extension(files):
+    groups = {}
+    for path in files:
+        groups.setdefault(path.suffix.lower(), []).append(path)
+    return groups
+
+def load_texts(files):
+    """Resume texts: TXT files are read directly, others through the configured extractor chain"""
+    from app.services.text_extractors import get_extractor_chain
+    chain = get_extractor_chain()
+    texts = []
+    for path in files:
+        try:
+            text = path.read_text(encoding='utf-8') if path.suffix == '.txt' else chain.extract(path).text
+        except Exception:
+            continue
+        texts.append(text)
+    return texts
+
+def bench_parse(files, jobs, repeat):
+    from app.services.resume_parser import ResumeParserFactory
+    results = []
+    for extension, paths in sorted(by_extension(files).items()):
+        if extension not in ResumeParserFactory.supported_extensions():
+            continue
+        parser = ResumeParserFactory.get_parser(extension)
+        results.append(measure(f"parse{extension}", lambda: [parser.parse(path) for path in paths],
+                               len(paths), repeat))
+    return results
+
+def bench_extract(files, jobs, repeat):
+    from core.functions import extract_text
+    results = []
+    for extension, paths in sorted(by_extension(files).items()):
+        if extension not in ('.pdf', '.docx', '.doc'):
+            continue
+        results.append(measure(f"extract{extension}", lambda: [extract_text(str(path), extension) for path in paths],
+                               len(paths), repeat))
+    return results
+
+def bench_preprocess(files, jobs, repeat):
+    from app.utils.text_processor import TextProcessor
+    texts = load_texts(files)
+    processor = TextProcessor()
+    # The first repeat runs with a cold lemma cache
+    return [measure('preprocess', lambda: [processor.preprocess(text) for text in texts], len(texts), repeat)]
+
+def bench_match(files, jobs, repeat):
+    from app.models.candidate import Candidate
+    from app.models.job_description import JobDescription
+    from app.services.matching_service import ResumeMatchingService, _corpus_indexes
+
+    candidates = [Candidate(name=path.stem, resume_path=path, resume_text=text)
+                  for path, text in zip(files, load_texts(files))]
+    job_descriptions = [JobDescription(title=path.stem, description=path.read_text(encoding='utf-8'))
+                        for path in jobs]
+
+    # The service's default threshold is the SIMILARITY_THRESHOLD default and
+    # takes the MaxScore-pruned path; a zero threshold scores every candidate
+    modes = (('pruned', {}), ('dense', {'similarity_threshold': 0.0}))
+
+    results = []
+    for mode, options in modes:
+        def cold():
+            _corpus_indexes.clear()
+            ResumeMatchingService(top_candidates_count=10, **options).match_candidates(
+                job_descriptions[0], candidates)
+
+        results.append(measure(f"match.{mode}.cold", cold, len(candidates), repeat))
+
+        # Ranks against the index left by the last cold run
+        service = ResumeMatchingService(top_candidates_count=10, **options)
+
+        def warm():
+            for job_description in job_descriptions:
+                service.match_candidates(job_description, candidates)
+
+        # Candidates scored per second over all job descriptions
+        results.append(measure(f"match.{mode}.warm", warm, len(candidates) * len(job_descriptions), repeat))
+    return results
+
+def bench_screen(files, jobs, repeat):
+    import screen
+    # screen.res works relative to ./data/Uploaded_Resumes and ../job_descriptions
+    with tempfile.TemporaryDirectory() as workdir:
+        resume_folder = Path(workdir, 'data', 'Uploaded_Resumes')
+        job_folder = Path(workdir, 'data', 'job_descriptions')
+        resume_folder.mkdir(parents=True)
+        job_folder.mkdir()
+        for path in files:
+            os.symlink(path.resolve(), resume_folder / path.name)
+        for path in jobs:
+            os.symlink(path.resolve(), job_folder / path.name)
+
+        def run():
+            cwd = os.getcwd()
+            os.chdir(workdir)
+            try:
+                with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                    screen.res(jobs[0].name)
+            finally:
+                os.chdir(cwd)
+
+        return [measure('screen.res', run, len(files), repeat)]
+
+SUITES = {
+    'parse': bench_parse,
+    'extract': bench_extract,
+    'preprocess': bench_preprocess,
+    'match': bench_match,
+    'screen': bench_screen,
+}
+
+def run_suite(suite, files, jobs, repeat, results):
+    """Run one suite in a fresh process and put its measurements on the results queue"""
+    logging.disable(logging.INFO)
+    try:
+        results.put(SUITES[suite](files, jobs, repeat))
+    except BaseException as e:
+        results.put([{'name': suite, 'error': f"{type(e).__name__}: {e}",
+                      'traceback': traceback.format_exc(limit=3)}])
+
+def collect_suite(suite, process, results_queue, timeout):
+    """Measurements of a suite process, or an error entry if it dies or runs past timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return results_queue.get(timeout=1)
+        except queue.Empty:
+            pass
+        if not process.is_alive():
+            # A result put just before exiting may still be in flight
+            try:
+                return results_queue.get(timeout=1)
+            except queue.Empty:
+                return [{'name': suite, 'error': f"suite process exited with code {process.exitcode}"}]
+        if time.monotonic() >= deadline:
+            process.terminate()
+            return [{'name': suite, 'error': f"suite timed out after {timeout:g}s"}]
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except Exception:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('corpus', type=Path, help='folder written by generate_corpus.py')
+    parser.add_argument('--suites', default=','.join(SUITES), help='comma-separated suites')
+    parser.add_argument('--limit', type=int, help='use at most this many resumes')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--out', type=Path, help='results file (default: print only)')
+    parser.add_argument('--suite-timeout', type=float, default=3600, help='seconds before a suite is abandoned')
+    args = parser.parse_args()
+
+    suites = args.suites.split(',')
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        sys.exit(f"Unknown suites: {', '.join(sorted(unknown))}")
+
+    files = sorted(path for path in (args.corpus / 'uploaded_resumes').iterdir() if path.is_file())[:args.limit]
+    jobs = sorted((args.corpus / 'job_descriptions').glob('*.txt'))
+    if not files or not jobs:
+        sys.exit(f"No resumes or job descriptions in {args.corpus}; run generate_corpus.py first")
+
+    manifest_path = args.corpus / 'manifest.json'
+    report = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'corpus': json.loads(manifest_path.read_text()) if manifest_path.exists() else None,
+            'resumes': len(files),
+            'jobs': len(jobs),
+            'repeat': args.repeat,
+        },
+        'results': {},
+    }
+
+    context = multiprocessing.get_context('spawn')
+    for suite in suites:
+        results_queue = context.Queue()
+        process = context.Process(target=run_suite, args=(suite, files, jobs, args.repeat, results_queue))
+        process.start()
+        for result in collect_suite(suite, process, results_queue, args.suite_timeout):
+            report['results'][result['name']] = result
+        process.join()
+
+    header = f"{'benchmark':<20} {'docs':>7} {'median s':>9} {'min s':>8} {'docs/s':>9} {'+rss MB':>8}"
+    print(header)
+    print('-' * len(header))
+    for name, row in report['results'].items():
+        if 'error' in row:
+            print(f"{name:<20} error: {row['error']}")
+            continue
+        print(f"{name:<20} {row['documents']:>7} {row['median_s']:>9.3f} {row['min_s']:>8.3f} "
+              f"{row['docs_per_s']:>9.1f} {row['rss_growth_mb']:>8.1f}")
+
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+from collections import deque
+
+
+def is_word_char(char):
+    '''
+    Helper function matching the regex `\\w` class used by `\\b`
+    :param char: single character
+    :return: True if char is a word character
+    '''
+    return char.isalnum() or char == '_'
+
+
+class PhraseAutomaton(object):
+    '''
+    Aho-Corasick automaton that finds which of a fixed set of phrases occur in a
+    text in a single pass. An occurrence only counts when it is delimited the way
+    `re.search(r"\\b" + re.escape(phrase) + r"\\b", text)` requires, so results
+    match `string_found` for every phrase.
+    :param phrases: iterable of phrases to search for (case-sensitive)
+    '''
+
+    def __init__(self, phrases):
+        self.phrases = list(dict.fromkeys(phrases))
+        self._delta = [{}]
+        self._outputs = [()]
+        self._build()
+
+    def _build(self):
+        # Trie of all phrases
+        outputs = [[]]
+        for phrase_id, phrase in enumerate(self.phrases):
+            state = 0
+            for char in phrase:
+                next_state = self._delta[state].get(char)
+                if next_state is None:
+                    next_state = len(self._delta)
+                    self._delta[state][char] = next_state
+                    self._delta.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(phrase_id)
+
+        # Breadth-first failure links, folded into a full transition table so
+        # scanning never has to walk failure chains
+        fail = [0] * len(self._delta)
+        queue = deque(self._delta[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+            for char, next_state in list(self._delta[state].items()):
+                fail[next_state] = self._delta[fail[state]].get(char, 0)
+                queue.append(next_state)
+            for char, next_state in self._delta[fail[state]].items():
+                self._delta[state].setdefault(char, next_state)
+
+        self._outputs = [tuple(output) for output in outputs]
+
+    def find(self, text):
+        '''
+        Scan text once and return the set of phrases found with word boundaries
+        :param text: text to scan
+        :return: set of matched phrases
+        '''
+        delta = self._delta
+        outputs = self._outputs
+        phrases = self.phrases
+        found = set()
+        text_length = len(text)
+
+        state = 0
+        for end, char in enumerate(text, 1):
+            state = delta[state].get(char, 0)
+            if not outputs[state]:
+                continue
+            for phrase_id in outputs[state]:
+                phrase = phrases[phrase_id]
+                if phrase in found:
+                    continue
+                start = end - len(phrase)
+                before = start > 0 and is_word_char(text[start - 1])
+                after = end < text_length and is_word_char(text[end])
+                if before != is_word_char(phrase[0]) and after != is_word_char(phrase[-1]):
+                    found.add(phrase)
+        return found
@@ -1,5 +1,3 @@
-from nltk.corpus import stopwords
-
 NAME_PATTERN      = [{'POS': 'PROPN'}, {'POS': 'PROPN'}]
 
 # Education (Upper Case)
@@ -18,7 +16,7 @@ MONTHS_LONG       = r'(january)|(february)|(march)|(april)|(may)|(june)|(july)|(
 MONTH             = r'(' + MONTHS_SHORT + r'|' + MONTHS_LONG + r')'
 YEAR              = r'(((20|19)(\d{2})))'
 
-STOPWORDS         = set(stopwords.words('english'))
+# STOPWORDS is loaded from the NLTK corpus on first access, see __getattr__
 
 RESUME_SECTIONS = [
                     'accomplishments',
@@ -424,4 +422,14 @@ MEASURABLE_RESULTS = {
         'create',
         'created'
     ]
-}
\ No newline at end of file
+}
+
+
+def __getattr__(name):
+    # Reading the NLTK stopwords corpus is slow and needs its data installed,
+    # so it is deferred until STOPWORDS is first used and then kept
+    if name == 'STOPWORDS':
+        from nltk.corpus import stopwords
+        globals()['STOPWORDS'] = set(stopwords.words('english'))
+        return globals()['STOPWORDS']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
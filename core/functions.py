@@ -1,44 +1,22 @@
-import io
+import csv
 import os
 import re
-import nltk
-import spacy
-import pandas as pd
-import docx2txt
+import threading
+from pathlib import Path
 import core.constants as cs
-from spacy.matcher import Matcher
-from pdfminer.converter import TextConverter
-from pdfminer.pdfinterp import PDFPageInterpreter
-from pdfminer.pdfinterp import PDFResourceManager
-from pdfminer.layout import LAParams
-from pdfminer.pdfpage import PDFPage
-from nltk.stem import WordNetLemmatizer
-from nltk.corpus import stopwords
+from core.aho_corasick import PhraseAutomaton
 
 
-def extract_text_from_pdf(pdf_path):
+def extract_text_from_pdf(pdf_path, max_pages=0):
     '''
     Helper function to extract the plain text from .pdf files
     :param pdf_path: path to PDF file to be extracted
+    :param max_pages: stop after this many pages, 0 for no limit
     :return: iterator of string of extracted text
     '''
     # https://www.blog.pythonlibrary.org/2018/05/03/exporting-data-from-pdfs-with-python/
-    with open(pdf_path, 'rb') as fh:
-        for page in PDFPage.get_pages(fh,
-                                      caching=True,
-                                      check_extractable=True):
-            resource_manager = PDFResourceManager()
-            fake_file_handle = io.StringIO()
-            converter = TextConverter(resource_manager, fake_file_handle, codec='utf-8', laparams=LAParams())
-            page_interpreter = PDFPageInterpreter(resource_manager, converter)
-            page_interpreter.process_page(page)
-
-            text = fake_file_handle.getvalue()
-            yield text
-
-            # close open handles
-            converter.close()
-            fake_file_handle.close()
+    from core.pdf_text import iter_page_texts
+    return iter_page_texts(pdf_path, max_pages=max_pages)
 
 
 def extract_text_from_doc(doc_path):
@@ -47,26 +25,48 @@ def extract_text_from_doc(doc_path):
     :param doc_path: path to .doc or .docx file to be extracted
     :return: string of extracted text
     '''
+    import docx2txt
     temp = docx2txt.process(doc_path)
     text = [line.replace('\t', ' ') for line in temp.split('\n') if line]
     return ' '.join(text)
 
 
-def extract_text(file_path, extension):
+def extract_text(file_path, extension, max_pages=0, max_chars=0):
     '''
-    Wrapper function to detect the file extension and call text extraction function accordingly
+    Wrapper function to detect the file extension and call text extraction function accordingly.
+    Uses pdfminer for .pdf and docx2txt for .doc/.docx files, falling back to the other
+    registered backends only when those fail or find no text
     :param file_path: path of file of which text is to be extracted
     :param extension: extension of file `file_name`
+    :param max_pages: for .pdf files, extract at most this many pages (0 for no limit)
+    :param max_chars: for .pdf files, stop at this many characters (0 for no limit)
     '''
-    text = ''
-    if extension == '.pdf':
-        for page in extract_text_from_pdf(file_path):
-            text += ' ' + page
-    elif extension == '.docx' or extension == '.doc':
-        text = extract_text_from_doc(file_path)
+    extension = extension.lower()
+    if extension == '.pdf' and (max_pages or max_chars):
+        # Page and character budgets are a pdfminer feature, not a chain option
+        from core.pdf_text import PDFTextExtractor
+        return PDFTextExtractor(max_pages=max_pages, max_chars=max_chars).extract_text(file_path)
+
+    chain = _get_legacy_chain()
+    if extension not in chain.chains:
+        return ''
+    text = chain.extract(Path(file_path)).text
+    if extension == '.docx' or extension == '.doc':
+        text = ' '.join(line.replace('\t', ' ') for line in text.split('\n') if line)
     return text
 
 
+_legacy_chain = None
+
+
+def _get_legacy_chain():
+    global _legacy_chain
+    if _legacy_chain is None:
+        from core.text_extractors import LEGACY_EXTRACTOR_CHAINS, TextExtractorChain
+        _legacy_chain = TextExtractorChain(LEGACY_EXTRACTOR_CHAINS)
+    return _legacy_chain
+
+
 def extract_entity_sections(text):
     '''
     Helper function to extract all the raw text from sections of resume
@@ -116,7 +116,9 @@ def extract_name(nlp_text, matcher):
     '''
     pattern = [cs.NAME_PATTERN]
 
-    matcher.add('NAME', None, *pattern)
+    # The matcher is shared across documents, so register the pattern only once
+    if 'NAME' not in matcher:
+        matcher.add('NAME', None, *pattern)
 
     matches = matcher(nlp_text)
 
@@ -143,6 +145,54 @@ def extract_mobile_number(text):
             return number
 
 
+class SkillMatcher(object):
+    '''
+    Skills dictionary compiled once into a hash set and reloaded only when the CSV changes
+    :param csv_path: path to CSV whose header row lists the known skills
+    '''
+
+    def __init__(self, csv_path):
+        self.csv_path = csv_path
+        self._skills = frozenset()
+        self._signature = None
+        self._lock = threading.Lock()
+
+    @property
+    def skills(self):
+        stat = os.stat(self.csv_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self._signature:
+            with self._lock:
+                if signature != self._signature:
+                    with open(self.csv_path, newline='', encoding='utf-8') as f:
+                        header = next(csv.reader(f), [])
+                    self._skills = frozenset(header)
+                    self._signature = signature
+        return self._skills
+
+    def match(self, nlp_text, noun_chunks):
+        '''
+        Look up one-grams and noun chunks in the skills set
+        :param nlp_text: object of `spacy.tokens.doc.Doc`
+        :param noun_chunks: noun chunks extracted from nlp text
+        :return: list of matched skills
+        '''
+        skills = self.skills
+        skillset = [token.text for token in nlp_text
+                    if not token.is_stop and token.text.lower() in skills]
+
+        # bi-grams and tri-grams come from noun chunks
+        for token in noun_chunks:
+            token = token.text.lower().strip()
+            if token in skills:
+                skillset.append(token)
+        return [i.capitalize() for i in set([i.lower() for i in skillset])]
+
+
+# Shared by every call in the process; forked workers inherit the compiled set
+SKILL_MATCHER = SkillMatcher(os.path.join(os.path.dirname(__file__), 'skills.csv'))
+
+
 def extract_skills(nlp_text, noun_chunks):
     '''
     Helper function to extract skills from spacy nlp text
@@ -150,21 +200,7 @@ def extract_skills(nlp_text, noun_chunks):
     :param noun_chunks: noun chunks extracted from nlp text
     :return: list of skills extracted
     '''
-    tokens = [token.text for token in nlp_text if not token.is_stop]
-    data = pd.read_csv(os.path.join(os.path.dirname(__file__), 'skills.csv'))
-    skills = list(data.columns.values)
-    skillset = []
-    # check for one-grams
-    for token in tokens:
-        if token.lower() in skills:
-            skillset.append(token)
-
-    # check for bi-grams and tri-grams
-    for token in noun_chunks:
-        token = token.text.lower().strip()
-        if token in skills:
-            skillset.append(token)
-    return [i.capitalize() for i in set([i.lower() for i in skillset])]
+    return SKILL_MATCHER.match(nlp_text, noun_chunks)
 
 
 def cleanup(token, lower=True):
@@ -204,6 +240,10 @@ def extract_experience(resume_text):
     :param resume_text: Plain resume text
     :return: list of experience
     '''
+    import nltk
+    from nltk.corpus import stopwords
+    from nltk.stem import WordNetLemmatizer
+
     wordnet_lemmatizer = WordNetLemmatizer()
     stop_words = set(stopwords.words('english'))
 
@@ -239,17 +279,7 @@ def extract_competencies(text, experience_list):
     :return: dictionary of competencies
     '''
     experience_text = ' '.join(experience_list)
-    competency_dict = {}
-
-    for competency in cs.COMPETENCIES.keys():
-        for item in cs.COMPETENCIES[competency]:
-            if string_found(item, experience_text):
-                if competency not in competency_dict.keys():
-                    competency_dict[competency] = [item]
-                else:
-                    competency_dict[competency].append(item)
-
-    return competency_dict
+    return _collect_phrases(cs.COMPETENCIES, COMPETENCIES_AUTOMATON.find(experience_text))
 
 
 def extract_measurable_results(text, experience_list):
@@ -261,17 +291,31 @@ def extract_measurable_results(text, experience_list):
 
     # we scan for measurable results only in first half of each sentence
     experience_text = ' '.join([text[:len(text) // 2 - 1] for text in experience_list])
-    mr_dict = {}
+    return _collect_phrases(cs.MEASURABLE_RESULTS, MEASURABLE_RESULTS_AUTOMATON.find(experience_text))
 
-    for mr in cs.MEASURABLE_RESULTS.keys():
-        for item in cs.MEASURABLE_RESULTS[mr]:
-            if string_found(item, experience_text):
-                if mr not in mr_dict.keys():
-                    mr_dict[mr] = [item]
-                else:
-                    mr_dict[mr].append(item)
 
-    return mr_dict
+def _collect_phrases(categories, found):
+    '''
+    Helper function to group found phrases by category, in constants order
+    :param categories: dictionary of category to phrases
+    :param found: set of phrases found in the text
+    :return: dictionary of category to found phrases
+    '''
+    result = {}
+    for category, items in categories.items():
+        for item in items:
+            if item in found:
+                result.setdefault(category, []).append(item)
+    return result
+
+
+# Built once from the constants; each extraction is a single scan of the text
+COMPETENCIES_AUTOMATON = PhraseAutomaton(
+    item for items in cs.COMPETENCIES.values() for item in items
+)
+MEASURABLE_RESULTS_AUTOMATON = PhraseAutomaton(
+    item for items in cs.MEASURABLE_RESULTS.values() for item in items
+)
 
 
 def string_found(string1, string2):
@@ -0,0 +1,151 @@
+import io
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter
+from pdfminer.pdfinterp import PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+
+# Worker processes used to extract pages of long documents, 0 extracts in-process
+PDF_PAGE_WORKERS = int(os.environ.get('PDF_PAGE_WORKERS', 0))
+
+# Documents with fewer pages than this are always extracted in-process
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get('PDF_PARALLEL_MIN_PAGES', 8))
+
+# Created on first parallel extraction
+_executor = None
+
+
+def _get_executor(workers):
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=workers)
+    return _executor
+
+
+def iter_page_texts(pdf_path, pagenos=None, max_pages=0):
+    '''
+    Extract the text of each page of a .pdf file, reusing a single resource manager,
+    converter and output buffer for the whole document so fonts and other shared
+    resources are only decoded once
+    :param pdf_path: path to PDF file to be extracted
+    :param pagenos: optional set of zero-based page numbers to extract
+    :param max_pages: stop after this many pages, 0 for no limit
+    :return: iterator of string of extracted text, one per page
+    '''
+    resource_manager = PDFResourceManager(caching=True)
+    fake_file_handle = io.StringIO()
+    converter = TextConverter(resource_manager, fake_file_handle, codec='utf-8', laparams=LAParams())
+    page_interpreter = PDFPageInterpreter(resource_manager, converter)
+    try:
+        with open(pdf_path, 'rb') as fh:
+            for page in PDFPage.get_pages(fh,
+                                          pagenos=pagenos,
+                                          maxpages=max_pages,
+                                          caching=True,
+                                          check_extractable=True):
+                page_interpreter.process_page(page)
+                text = fake_file_handle.getvalue()
+                # reset the buffer for the next page
+                fake_file_handle.seek(0)
+                fake_file_handle.truncate(0)
+                yield text
+    finally:
+        # close open handles
+        converter.close()
+        fake_file_handle.close()
+
+
+def count_pages(pdf_path):
+    '''
+    Count the pages of a .pdf file without laying them out
+    :param pdf_path: path to PDF file
+    :return: number of pages
+    '''
+    with open(pdf_path, 'rb') as fh:
+        return sum(1 for _ in PDFPage.get_pages(fh, caching=True, check_extractable=True))
+
+
+def _extract_page_range(pdf_path, start, stop):
+    # Runs in a worker process; each worker keeps its own shared resources per range
+    return list(iter_page_texts(pdf_path, pagenos=set(range(start, stop))))
+
+
+class PDFTextExtractor(object):
+    '''
+    PDF text extraction engine. Pages are extracted with shared pdfminer resources,
+    long documents are optionally split into page ranges handled by worker
+    processes, and a page or character budget stops extraction early.
+    :param max_pages: extract at most this many pages, 0 for no limit
+    :param max_chars: stop once the text reaches this many characters and truncate
+        it to that length, 0 for no limit
+    :param workers: worker processes for long documents, 0 to extract in-process
+    :param parallel_min_pages: minimum page count before pages are fanned out
+    '''
+
+    def __init__(self, max_pages=0, max_chars=0, workers=PDF_PAGE_WORKERS,
+                 parallel_min_pages=PDF_PARALLEL_MIN_PAGES):
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.workers = workers
+        self.parallel_min_pages = parallel_min_pages
+
+    def iter_pages(self, pdf_path):
+        '''
+        Yield page texts in order, in parallel for long documents when workers are enabled
+        :param pdf_path: path to PDF file to be extracted
+        :return: iterator of page texts
+        '''
+        # Daemonic pool workers (e.g. core.resume's pool) cannot start processes of their own
+        if self.workers <= 0 or mp.current_process().daemon:
+            return iter_page_texts(pdf_path, max_pages=self.max_pages)
+
+        page_count = count_pages(pdf_path)
+        if self.max_pages:
+            page_count = min(page_count, self.max_pages)
+        if page_count < max(self.parallel_min_pages, 2):
+            return iter_page_texts(pdf_path, max_pages=self.max_pages)
+        return self._iter_pages_parallel(pdf_path, page_count)
+
+    def _iter_pages_parallel(self, pdf_path, page_count):
+        executor = _get_executor(self.workers)
+        chunk_size = -(-page_count // self.workers)
+        futures = [executor.submit(_extract_page_range, pdf_path, start, min(start + chunk_size, page_count))
+                   for start in range(0, page_count, chunk_size)]
+        try:
+            for future in futures:
+                for text in future.result():
+                    yield text
+        finally:
+            # Ranges not needed any more (budget reached or error) are dropped
+            for future in futures:
+                future.cancel()
+
+    def extract_pages(self, pdf_path):
+        '''
+        Extract page texts within the page and character budget
+        :param pdf_path: path to PDF file to be extracted
+        :return: list of page texts
+        '''
+        pages = []
+        length = 0
+        for text in self.iter_pages(pdf_path):
+            pages.append(text)
+            # each page is joined with a leading space by extract_text
+            length += len(text) + 1
+            if self.max_chars and length >= self.max_chars:
+                break
+        return pages
+
+    def extract_text(self, pdf_path):
+        '''
+        Extract the plain text of a .pdf file, each page preceded by a space
+        :param pdf_path: path to PDF file to be extracted
+        :return: string of extracted text
+        '''
+        text = ''.join([' ' + page for page in self.extract_pages(pdf_path)])
+        if self.max_chars:
+            text = text[:self.max_chars]
+        return text
@@ -1,16 +1,41 @@
 import os
-import app as utils
+import core.functions as utils
 import spacy
 import pprint
 from spacy.matcher import Matcher
 import multiprocessing as mp
 import json
 
+SPACY_MODEL = 'en_core_web_sm'
+
+# The extractors use POS tags (names), noun chunks and sentences (parser), never entities
+DISABLED_PIPES = ['ner']
+
+NLP_BATCH_SIZE = int(os.environ.get('NLP_BATCH_SIZE', 32))
+
+# Loaded once per process by init_worker
+_nlp = None
+_matcher = None
+
+
+def init_worker(model=SPACY_MODEL, disable=DISABLED_PIPES):
+    '''
+    Load the spaCy model once per process, used as the multiprocessing pool initializer
+    :param model: name of the spaCy model to load
+    :param disable: pipeline components to disable
+    :return: loaded spaCy language object
+    '''
+    global _nlp, _matcher
+    if _nlp is None:
+        _nlp = spacy.load(model, disable=disable)
+        _matcher = Matcher(_nlp.vocab)
+    return _nlp
+
 
 class ResumeParser(object):
-    def __init__(self, resume):
-        nlp = spacy.load('en_core_web_sm')
-        self.__matcher = Matcher(nlp.vocab)
+    def __init__(self, resume, nlp_doc=None, text_raw=None):
+        nlp = init_worker()
+        self.__matcher = _matcher
         self.__details = {
             'name': None,
             'email': None,
@@ -22,9 +47,11 @@ class ResumeParser(object):
             'measurable_results': None
         }
         self.__resume = resume
-        self.__text_raw = utils.extract_text(self.__resume, os.path.splitext(self.__resume)[1])
+        if text_raw is None:
+            text_raw = utils.extract_text(self.__resume, os.path.splitext(self.__resume)[1])
+        self.__text_raw = text_raw
         self.__text = ' '.join(self.__text_raw.split())
-        self.__nlp = nlp(self.__text)
+        self.__nlp = nlp_doc if nlp_doc is not None else nlp(self.__text)
         self.__noun_chunks = list(self.__nlp.noun_chunks)
         self.__get_basic_details()
 
@@ -55,13 +82,33 @@ class ResumeParser(object):
         return
 
 
+def parse_resumes(resumes, batch_size=NLP_BATCH_SIZE):
+    '''
+    Parse several resumes, running spaCy over them in batches with nlp.pipe
+    :param resumes: list of resume file paths
+    :param batch_size: number of documents spaCy processes per batch
+    :return: list of extracted details, in input order
+    '''
+    nlp = init_worker()
+
+    def texts():
+        for resume in resumes:
+            text_raw = utils.extract_text(resume, os.path.splitext(resume)[1])
+            yield ' '.join(text_raw.split()), (resume, text_raw)
+
+    results = []
+    for doc, (resume, text_raw) in nlp.pipe(texts(), as_tuples=True, batch_size=batch_size):
+        results.append(ResumeParser(resume, nlp_doc=doc, text_raw=text_raw).get_extracted_data())
+    return results
+
+
 def resume_result_wrapper(resume):
     parser = ResumeParser(resume)
     return parser.get_extracted_data()
 
 
 if __name__ == '__main__':
-    pool = mp.Pool(mp.cpu_count())
+    pool = mp.Pool(mp.cpu_count(), initializer=init_worker)
 
     resumes = []
     data = []
@@ -70,12 +117,12 @@ if __name__ == '__main__':
             file = os.path.join(root, filename)
             resumes.append(file)
 
-    results = [pool.apply_async(resume_result_wrapper, args=(x,)) for x in resumes]
-
-    results = [p.get() for p in results]
+    # Each task is one nlp.pipe batch so the model is reused across its documents
+    batches = [resumes[i:i + NLP_BATCH_SIZE] for i in range(0, len(resumes), NLP_BATCH_SIZE)]
+    results = [details for batch in pool.map(parse_resumes, batches) for details in batch]
 
     pprint.pprint(results[0])
 
     pprint.pprint(json.dumps(data))
     with open('data.json', 'w', encoding='utf-8') as f:
-        json.dump(results[0], f, ensure_ascii=False, indent=4)
\ No newline at end of file
+        json.dump(results[0], f, ensure_ascii=False, indent=4)
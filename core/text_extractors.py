@@ -0,0 +1,163 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# This module is shared by the app and the standalone scripts (screen.py,
+# core.functions), so it must not import the app package or Flask
+
+# Extension -> backend names tried in order; the default for the TEXT_EXTRACTOR_CHAINS setting
+DEFAULT_EXTRACTOR_CHAINS: Dict[str, List[str]] = {
+    '.pdf': ['pypdf2', 'textract'],
+    '.docx': ['docx2txt'],
+    '.doc': ['textract'],
+}
+
+# Chains of core.functions.extract_text: its original backends come first, so
+# its output is unchanged; the others only run where those fail or find no text
+LEGACY_EXTRACTOR_CHAINS: Dict[str, List[str]] = {
+    '.pdf': ['pdfminer', 'pypdf2', 'textract'],
+    '.docx': ['docx2txt', 'textract'],
+    '.doc': ['docx2txt', 'textract'],
+}
+
+class TextExtractionError(Exception):
+    """Raised when no configured backend extracts text from a file"""
+    pass
+
+@dataclass
+class TextExtractor:
+    """A named text extraction backend for one or more file extensions"""
+
+    name: str
+    extensions: List[str]
+    extract: Callable[[Path], str]
+
+_registry: Dict[str, TextExtractor] = {}
+
+def register_extractor(name: str, extensions: List[str]):
+    """Decorator registering a function `(file_path) -> text` as an extraction backend"""
+    def decorator(func: Callable[[Path], str]) -> Callable[[Path], str]:
+        _registry[name] = TextExtractor(name=name, extensions=list(extensions), extract=func)
+        return func
+    return decorator
+
+def get_extractor(name: str) -> TextExtractor:
+    extractor = _registry.get(name)
+    if extractor is None:
+        raise ValueError(f"Unknown text extractor: {name}")
+    return extractor
+
+def available_extractors(extension: str = None) -> List[TextExtractor]:
+    """Registered backends, optionally only those handling an extension"""
+    return [extractor for extractor in _registry.values()
+            if extension is None or extension.lower() in extractor.extensions]
+
+# Backends import their libraries lazily so a missing optional dependency only
+# disables that backend
+
+@register_extractor('pypdf2', ['.pdf'])
+def _extract_pypdf2(file_path: Path) -> str:
+    import PyPDF2
+    text = ""
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page in pdf_reader.pages:
+            text += page.extract_text() + "\n"
+    return text
+
+@register_extractor('pdfminer', ['.pdf'])
+def _extract_pdfminer(file_path: Path) -> str:
+    from core.pdf_text import PDFTextExtractor
+    return PDFTextExtractor().extract_text(file_path)
+
+@register_extractor('textract', ['.pdf', '.doc', '.docx', '.txt'])
+def _extract_textract(file_path: Path) -> str:
+    import textract
+    return textract.process(str(file_path)).decode('utf-8')
+
+@register_extractor('docx2txt', ['.docx'])
+def _extract_docx2txt(file_path: Path) -> str:
+    import docx2txt
+    return docx2txt.process(str(file_path))
+
+@register_extractor('python-docx', ['.docx'])
+def _extract_python_docx(file_path: Path) -> str:
+    import docx
+    return '\n'.join(paragraph.text for paragraph in docx.Document(str(file_path)).paragraphs)
+
+@register_extractor('plaintext', ['.txt'])
+def _extract_plaintext(file_path: Path) -> str:
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+@dataclass
+class ExtractionResult:
+    """Text extracted from a file and the backend that produced it"""
+
+    text: str
+    extractor: str
+
+class TextExtractorChain:
+    """
+    Ordered fallback chain of extraction backends per file extension.
+
+    Backends are tried in order; one that raises or yields only whitespace
+    passes the file on to the next.
+    """
+
+    def __init__(self, chains: Dict[str, List[str]] = None):
+        chains = DEFAULT_EXTRACTOR_CHAINS if chains is None else chains
+        self.chains = {extension.lower(): list(names) for extension, names in chains.items()}
+        for names in self.chains.values():
+            for name in names:
+                get_extractor(name)
+
+    @property
+    def fingerprint(self) -> str:
+        """Short stable digest of the configured chains"""
+        encoded = json.dumps(self.chains, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()[:8]
+
+    def extract(self, file_path: Path) -> ExtractionResult:
+        """Extract text with the first backend that succeeds for the file's extension"""
+        names = self.chains.get(file_path.suffix.lower())
+        if not names:
+            raise TextExtractionError(f"No text extractor configured for {file_path.suffix}")
+
+        errors = []
+        for name in names:
+            try:
+                text = get_extractor(name).extract(file_path)
+            except Exception as e:
+                logger.warning(f"Text extractor {name} failed for {file_path}: {e}")
+                errors.append(f"{name}: {e}")
+                continue
+
+            if text and text.strip():
+                return ExtractionResult(text=text, extractor=name)
+            errors.append(f"{name}: no text extracted")
+
+        raise TextExtractionError(f"No text extracted from {file_path.name} ({'; '.join(errors)})")
+
+_extractor_chain: Optional[TextExtractorChain] = None
+
+def configure_extractor_chain(chains: Dict[str, List[str]] = None) -> TextExtractorChain:
+    """
+    Set the process-wide chain, called by the app factory from TEXT_EXTRACTOR_CHAINS.
+    Parse workers are forked from the configured process and inherit it.
+    """
+    global _extractor_chain
+    _extractor_chain = TextExtractorChain(chains)
+    return _extractor_chain
+
+def get_extractor_chain() -> TextExtractorChain:
+    """Return the process-wide chain, using the default chains if none was configured"""
+    global _extractor_chain
+    if _extractor_chain is None:
+        _extractor_chain = TextExtractorChain()
+    return _extractor_chain
@@ -0,0 +1,61 @@
+"""Baseline schema
+
+Revision ID: 5d4997eb93be
+Revises: 
+Create Date: 2026-10-17 17:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d4997eb93be'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created with db.create_all() already have these tables
+    existing_tables = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'candidates' not in existing_tables:
+        op.create_table(
+            'candidates',
+            sa.Column('id', sa.String(length=36), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=True),
+            sa.Column('email', sa.String(length=100), nullable=True),
+            sa.Column('phone', sa.String(length=20), nullable=True),
+            sa.Column('skills', sa.Text(), nullable=True),
+            sa.Column('education', sa.Text(), nullable=True),
+            sa.Column('experience', sa.Text(), nullable=True),
+            sa.Column('competencies', sa.Text(), nullable=True),
+            sa.Column('resume_path', sa.String(length=255), nullable=True),
+            sa.Column('resume_text', sa.Text(), nullable=True),
+            sa.Column('score', sa.Float(), nullable=True),
+            sa.Column('rank', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('is_active', sa.Boolean(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'job_descriptions' not in existing_tables:
+        op.create_table(
+            'job_descriptions',
+            sa.Column('id', sa.String(length=36), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=True),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('requirements', sa.Text(), nullable=True),
+            sa.Column('skills', sa.Text(), nullable=True),
+            sa.Column('file_path', sa.String(length=255), nullable=True),
+            sa.Column('processed_text', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('is_active', sa.Boolean(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade():
+    op.drop_table('job_descriptions')
+    op.drop_table('candidates')
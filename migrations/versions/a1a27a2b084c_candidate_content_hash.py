@@ -0,0 +1,55 @@
+"""Candidate source name and unique content hash
+
+Revision ID: a1a27a2b084c
+Revises: 5d4997eb93be
+Create Date: 2026-10-17 17:25:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1a27a2b084c'
+down_revision = '5d4997eb93be'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() on the current models may already have added some of this
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('candidates')}
+    indexes = {index['name']: index for index in inspector.get_indexes('candidates')}
+
+    with op.batch_alter_table('candidates') as batch_op:
+        if 'source_name' not in columns:
+            batch_op.add_column(sa.Column('source_name', sa.String(length=255), nullable=True))
+        if 'content_hash' not in columns:
+            batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+    # Concurrent upserts before the constraint existed could store a resume twice;
+    # keep one row per content hash
+    op.execute(
+        "DELETE FROM candidates WHERE content_hash IS NOT NULL AND id NOT IN "
+        "(SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM candidates "
+        "WHERE content_hash IS NOT NULL GROUP BY content_hash) AS kept)"
+    )
+
+    content_hash_index = indexes.get('ix_candidates_content_hash')
+    if content_hash_index and not content_hash_index['unique']:
+        op.drop_index('ix_candidates_content_hash', table_name='candidates')
+        content_hash_index = None
+    if content_hash_index is None:
+        op.create_index('ix_candidates_content_hash', 'candidates', ['content_hash'], unique=True)
+
+    if 'ix_candidates_created_at' not in indexes:
+        op.create_index('ix_candidates_created_at', 'candidates', ['created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_candidates_created_at', table_name='candidates')
+    op.drop_index('ix_candidates_content_hash', table_name='candidates')
+    with op.batch_alter_table('candidates') as batch_op:
+        batch_op.drop_column('content_hash')
+        batch_op.drop_column('source_name')
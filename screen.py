@@ -2,14 +2,13 @@ import glob
 import operator
 import os
 import warnings
-import PyPDF2
-import textract
+from pathlib import Path
 from gensim.summarization import summarize
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.neighbors import NearestNeighbors
-import docx2txt
 
+from core.text_extractors import get_extractor_chain
 from core.functions import *
 
 warnings.filterwarnings(action='ignore', category=UserWarning, module='gensim')
@@ -38,7 +37,6 @@ def res(jobfile):
     LIST_OF_FILES_DOC = []
     LIST_OF_FILES_DOCX = []
     Resumes = []
-    Temp_pdf = []
     os.chdir('./data/Uploaded_Resumes')
     for file in glob.glob('**/*.pdf', recursive=True):
         LIST_OF_FILES_PDF.append(file)
@@ -54,57 +52,16 @@ def res(jobfile):
 
     # print("Total Files to Parse\t" , len(LIST_OF_PDF_FILES))
     print("####### PARSING ########")
+    # Same extractor chains (and fallbacks) as the app, see TEXT_EXTRACTOR_CHAINS
+    extractor_chain = get_extractor_chain()
     for nooo, i in enumerate(LIST_OF_FILES):
         Ordered_list_Resume.append(i)
-        Temp = i.split(".")
-        if Temp[1] == "pdf" or Temp[1] == "Pdf" or Temp[1] == "PDF":
-            try:
-                print("This is PDF", nooo)
-                with open(i, 'rb') as pdf_file:
-                    read_pdf = PyPDF2.PdfFileReader(pdf_file)
-
-                    number_of_pages = read_pdf.getNumPages()
-                    for page_number in range(number_of_pages):
-                        page = read_pdf.getPage(page_number)
-                        page_content = page.extractText()
-                        page_content = page_content.replace('\n', ' ')
-                        Temp_pdf = str(Temp_pdf) + str(page_content)
-
-                    Resumes.extend([Temp_pdf])
-                    Temp_pdf = ''
-
-            except Exception as e:
-                print(e)
-
-        if Temp[1] == "doc" or Temp[1] == "Doc" or Temp[1] == "DOC":
-            print("This is DOC", i)
-            try:
-                a = textract.process(i)
-                a = a.replace(b'\n', b' ')
-                a = a.replace(b'\r', b' ')
-                b = str(a)
-                c = [b]
-                Resumes.extend(c)
-
-            except Exception as e:
-                print(e)
-
-        if Temp[1] == "docx" or Temp[1] == "Docx" or Temp[1] == "DOCX":
-            print("This is DOCX", i)
-            try:
-                a = textract.process(i)
-                a = a.replace(b'\n', b' ')
-                a = a.replace(b'\r', b' ')
-                b = str(a)
-                c = [b]
-                Resumes.extend(c)
-
-            except Exception as e:
-                print(e)
-
-        if Temp[1] == "ex" or Temp[1] == "Exe" or Temp[1] == "EXE":
-            print("This is EXE", i)
-            pass
+        print("Parsing", nooo, i)
+        try:
+            text = extractor_chain.extract(Path(i)).text
+            Resumes.append(text.replace('\n', ' ').replace('\r', ' '))
+        except Exception as e:
+            print(e)
 
     print("Done Parsing.")
 
@@ -0,0 +1,76 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+from app.models.candidate import Candidate
+from app.models.database import CandidateModel
+from app.repositories.candidate_repository import CandidateRepository
+
+@pytest.fixture
+def repository(app):
+    return CandidateRepository(batch_size=3)
+
+def stored_rows():
+    return {model.content_hash: model for model in db.session.query(CandidateModel)}
+
+def test_upsert_inserts_then_updates_by_content_hash(repository):
+    first = Candidate(name='Alice', content_hash='a' * 64, skills=['python'])
+    assert repository.upsert([first, Candidate(name='Bob', content_hash='b' * 64)]) == (2, 0)
+
+    # A re-parse of the same file gets a new id but must update the stored row
+    reparsed = Candidate(name='Alice Smith', content_hash='a' * 64, skills=['python', 'flask'])
+    assert repository.upsert([reparsed]) == (0, 1)
+
+    rows = stored_rows()
+    assert len(rows) == 2
+    assert rows['a' * 64].id == first.id
+    assert rows['a' * 64].name == 'Alice Smith'
+
+def test_upsert_dedupes_within_and_across_batches(repository):
+    candidates = [Candidate(name=f'Copy {number}', content_hash='c' * 64) for number in range(7)]
+
+    inserted, updated = repository.upsert(candidates)
+
+    assert inserted == 1
+    assert inserted + updated == 3
+    rows = stored_rows()
+    assert len(rows) == 1
+    # Last occurrence wins
+    assert rows['c' * 64].name == 'Copy 6'
+
+def test_upsert_without_content_hash_matches_by_id(repository):
+    candidate = Candidate(name='Carol')
+    repository.upsert([candidate])
+    candidate.name = 'Carol Jones'
+
+    assert repository.upsert([candidate]) == (0, 1)
+    assert repository.get(candidate.id).name == 'Carol Jones'
+
+def test_content_hash_is_unique(repository):
+    repository.bulk_insert([Candidate(content_hash='d' * 64)])
+
+    with pytest.raises(IntegrityError):
+        repository.bulk_insert([Candidate(content_hash='d' * 64)])
+    db.session.rollback()
+
+def test_upsert_retries_after_concurrent_insert(repository, monkeypatch):
+    existing_ids = repository._existing_ids
+    lookups = []
+
+    def racing_existing_ids(candidates):
+        candidates = list(candidates)
+        if not lookups:
+            # Another writer stores the same resume between the lookup and the insert
+            other = CandidateRepository(batch_size=3)
+            other.upsert([Candidate(name='Other writer', content_hash=candidates[0].content_hash)])
+            lookups.append(candidates)
+            return {}
+        lookups.append(candidates)
+        return existing_ids(candidates)
+
+    monkeypatch.setattr(repository, '_existing_ids', racing_existing_ids)
+
+    assert repository.upsert([Candidate(name='Eve', content_hash='e' * 64)]) == (0, 1)
+    assert len(lookups) == 2
+    rows = stored_rows()
+    assert len(rows) == 1
+    assert rows['e' * 64].name == 'Eve'
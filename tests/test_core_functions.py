@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import core.constants as cs
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+def run_isolated(code):
+    """Run code in a fresh interpreter without the app's environment settings"""
+    env = {key: value for key, value in os.environ.items() if key not in ('SECRET_KEY', 'DATABASE_URL')}
+    subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, env=env, check=True)
+
+def test_importable_without_nltk_or_the_app():
+    # A None entry makes any `import nltk` raise ImportError
+    run_isolated(
+        "import sys\n"
+        "sys.modules['nltk'] = None\n"
+        "import core.functions\n"
+        "assert core.functions.extract_text('resume.txt', '.txt') == ''\n"
+        "for name in ('app', 'flask', 'sklearn', 'spacy', 'pdfminer'):\n"
+        "    assert name not in sys.modules, name\n"
+    )
+
+class FakeStopwords:
+    def words(self, language):
+        return ['the', 'and']
+
+def test_stopwords_loaded_on_first_use(monkeypatch):
+    import nltk.corpus
+
+    # Recorded so the loaded value is dropped again afterwards
+    monkeypatch.setitem(cs.__dict__, 'STOPWORDS', None)
+    del cs.__dict__['STOPWORDS']
+    monkeypatch.setattr(nltk.corpus, 'stopwords', FakeStopwords())
+
+    assert cs.STOPWORDS == {'the', 'and'}
+    assert cs.__dict__['STOPWORDS'] is cs.STOPWORDS
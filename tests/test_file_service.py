@@ -0,0 +1,89 @@
+import io
+import pytest
+from app.services.file_service import FileService
+from app.utils.exceptions import FileServiceError
+
+@pytest.fixture
+def file_service(app, tmp_path):
+    app.config['UPLOAD_FOLDER'] = tmp_path / 'uploads'
+    app.config['JOB_DESCRIPTIONS_FOLDER'] = tmp_path / 'jobs'
+    return FileService()
+
+def count_calls(monkeypatch, service, name):
+    calls = []
+    method = getattr(service, name)
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return method(*args, **kwargs)
+
+    monkeypatch.setattr(service, name, counted)
+    return calls
+
+def test_duplicate_uploads_share_one_file(file_service):
+    first = file_service.store_stream(io.BytesIO(b'same resume'), 'alice.txt')
+    version = file_service.corpus_version()
+    second = file_service.store_stream(io.BytesIO(b'same resume'), 'alice_copy.txt')
+
+    assert not first.duplicate
+    assert second.duplicate
+    assert second.path == first.path
+    assert file_service.get_resume_files() == [first.path]
+    # The first upload name stays the display name; later names are kept too
+    assert second.display_name == 'alice.txt'
+    assert file_service._read_manifest()[first.path.name]['names'] == ['alice.txt', 'alice_copy.txt']
+    # A duplicate does not change the corpus
+    assert file_service.corpus_version() == version
+
+def test_distinct_uploads_change_corpus_version(file_service):
+    versions = {file_service.corpus_version()}
+    for number in range(3):
+        file_service.store_stream(io.BytesIO(f'resume {number}'.encode()), f'resume{number}.txt')
+        versions.add(file_service.corpus_version())
+
+    assert len(versions) == 4
+    assert len(file_service.get_resume_files()) == 3
+
+def test_batch_writes_manifest_and_version_once(file_service, monkeypatch):
+    manifest_writes = count_calls(monkeypatch, file_service, '_write_manifest')
+    version_bumps = count_calls(monkeypatch, file_service, '_bump_corpus_version')
+
+    with file_service.batch_updates():
+        for number in range(5):
+            file_service.store_stream(io.BytesIO(f'resume {number}'.encode()), f'resume{number}.txt')
+        file_service.store_stream(io.BytesIO(b'resume 0'), 'resume0_again.txt')
+        assert manifest_writes == []
+
+    assert len(manifest_writes) == 1
+    assert len(version_bumps) == 1
+    manifest = file_service._read_manifest()
+    assert len(manifest) == 5
+    assert sorted(name for entry in manifest.values() for name in entry['names']) == sorted(
+        [f'resume{number}.txt' for number in range(5)] + ['resume0_again.txt']
+    )
+
+def test_batch_of_duplicates_keeps_corpus_version(file_service):
+    file_service.store_stream(io.BytesIO(b'resume'), 'resume.txt')
+    version = file_service.corpus_version()
+
+    with file_service.batch_updates():
+        file_service.store_stream(io.BytesIO(b'resume'), 'again.txt')
+
+    assert file_service.corpus_version() == version
+
+def test_batch_records_files_stored_before_an_error(file_service):
+    with pytest.raises(FileServiceError):
+        with file_service.batch_updates():
+            stored = file_service.store_stream(io.BytesIO(b'resume'), 'resume.txt')
+            file_service.store_stream(io.BytesIO(b'too large'), 'large.txt', max_size=4)
+
+    assert file_service.get_display_name(stored.path) == 'resume.txt'
+    assert file_service.corpus_version() != '0'
+
+def test_delete_removes_manifest_entry_and_changes_version(file_service):
+    stored = file_service.store_stream(io.BytesIO(b'resume'), 'resume.txt')
+    version = file_service.corpus_version()
+
+    assert file_service.delete_file(stored.path)
+    assert stored.path.name not in file_service._read_manifest()
+    assert file_service.corpus_version() != version
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+from app.services.inverted_index import InvertedIndex
+
+def dense_top_k(matrix, query, k, threshold):
+    """Exhaustive ranking: score every document, ties by document position"""
+    scores = (matrix @ query.T).toarray().ravel()
+    passing = np.flatnonzero(scores >= threshold)
+    order = np.lexsort((passing, -scores[passing]))[:k]
+    return passing[order], scores[passing][order]
+
+def random_matrix(rng, n_docs, n_terms, density):
+    # Small integer weights keep every score exact, so equal scores are common
+    # and do not depend on summation order
+    return sp.random(n_docs, n_terms, density=density, format='csr', random_state=rng,
+                     data_rvs=lambda size: rng.integers(1, 4, size).astype(np.float64))
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('threshold', [1.0, 4.0, 9.0])
+def test_top_k_matches_exhaustive_scoring(seed, threshold):
+    rng = np.random.default_rng(seed)
+    matrix = random_matrix(rng, 200, 30, 0.1)
+    matrix = sp.vstack([matrix, matrix[:20]]).tocsr()
+    query = random_matrix(rng, 1, 30, 0.3)
+    index = InvertedIndex(matrix)
+
+    for k in (1, 5, 25):
+        docs, scores = index.top_k(query, k, threshold)
+        expected_docs, expected_scores = dense_top_k(matrix, query, k, threshold)
+        np.testing.assert_array_equal(docs, expected_docs)
+        np.testing.assert_array_equal(scores, expected_scores)
+
+def test_tie_break_orders_equal_scores():
+    row = normalize(sp.csr_matrix([[1.0, 1.0, 0.0]]))
+    matrix = sp.vstack([row, row, row, normalize(sp.csr_matrix([[0.0, 1.0, 1.0]]))]).tocsr()
+    index = InvertedIndex(matrix)
+    query = normalize(sp.csr_matrix([[1.0, 0.0, 0.0]]))
+
+    docs, _ = index.top_k(query, 2, 0.1)
+    np.testing.assert_array_equal(docs, [0, 1])
+
+    calls = []
+
+    def reverse_positions(candidates):
+        calls.append(candidates.copy())
+        return -candidates
+
+    docs, _ = index.top_k(query, 2, 0.1, tie_break=reverse_positions)
+    np.testing.assert_array_equal(docs, [2, 1])
+    # Called once, and never for documents that cannot make the result
+    assert len(calls) == 1
+    assert 3 not in calls[0]
+
+def test_queries_do_not_leak_scores():
+    rng = np.random.default_rng(0)
+    matrix = random_matrix(rng, 100, 20, 0.2)
+    query = random_matrix(rng, 1, 20, 0.3)
+    index = InvertedIndex(matrix)
+
+    first = index.top_k(query, 10, 1.0)
+    index.top_k(random_matrix(rng, 1, 20, 0.5), 10, 1.0)
+    second = index.top_k(query, 10, 1.0)
+
+    np.testing.assert_array_equal(first[0], second[0])
+    np.testing.assert_array_equal(first[1], second[1])
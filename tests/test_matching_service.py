@@ -0,0 +1,90 @@
+import hashlib
+import pytest
+from app.models.candidate import Candidate
+from app.models.job_description import JobDescription
+from app.services import matching_service
+from app.services.matching_service import ResumeMatchingService
+
+RESUMES = [
+    'python developer flask sqlalchemy postgres',
+    'java developer spring boot microservices',
+    'python data scientist pandas numpy',
+    'python developer flask sqlalchemy postgres',
+    'frontend developer react typescript',
+    'python flask developer docker kubernetes',
+    'java developer spring boot microservices',
+    'python developer flask sqlalchemy postgres',
+    'devops engineer docker kubernetes terraform',
+    'python flask developer docker kubernetes',
+]
+
+class PlainTextProcessor:
+    """Preprocessing without NLTK data; the ranking logic under test does not depend on it"""
+
+    def preprocess(self, text: str) -> str:
+        return text.lower()
+
+@pytest.fixture
+def matching(app, monkeypatch):
+    monkeypatch.setattr(matching_service, 'TextProcessor', PlainTextProcessor)
+    return ResumeMatchingService(top_candidates_count=4, similarity_threshold=0.1)
+
+def make_candidates():
+    # Identical resumes share a content hash and so one corpus index row
+    return [
+        Candidate(id=f'candidate-{number}', resume_text=text,
+                  content_hash=hashlib.sha256(text.encode('utf-8')).hexdigest())
+        for number, text in enumerate(RESUMES)
+    ]
+
+def ranking(candidates):
+    return [(candidate.id, candidate.rank) for candidate in candidates]
+
+@pytest.mark.parametrize('top_candidates_count', [1, 2, 3, 4, 6])
+def test_pruned_matching_equals_dense_matching(matching, monkeypatch, top_candidates_count):
+    job = JobDescription(description='python flask developer', skills=['docker'])
+    matching.top_candidates_count = top_candidates_count
+
+    pruned = matching.match_candidates(job, make_candidates())
+
+    monkeypatch.setattr(ResumeMatchingService, '_use_pruned_retrieval', lambda self, count: False)
+    dense = matching.match_candidates(job, make_candidates())
+
+    assert ranking(pruned) == ranking(dense)
+    # Term-at-a-time accumulation may differ from the sparse product in the last bit
+    assert [candidate.score for candidate in pruned] == pytest.approx([candidate.score for candidate in dense])
+    assert len(pruned) == top_candidates_count
+
+def test_duplicate_resumes_keep_input_order(matching):
+    job = JobDescription(description='python developer flask sqlalchemy postgres')
+
+    shortlist = matching.match_candidates(job, make_candidates())
+
+    assert [candidate.id for candidate in shortlist[:3]] == ['candidate-0', 'candidate-3', 'candidate-7']
+    assert shortlist[0].score == shortlist[1].score == shortlist[2].score
+
+def test_full_ranking_scores_every_candidate(matching):
+    job = JobDescription(description='python flask developer')
+    candidates = make_candidates()
+
+    shortlist = matching.match_candidates(job, candidates)
+    full_ranking = shortlist.full_ranking()
+
+    assert sorted(candidate.id for candidate in full_ranking) == sorted(candidate.id for candidate in candidates)
+    assert [candidate.id for candidate in full_ranking[:len(shortlist)]] == [
+        candidate.id for candidate in shortlist
+    ]
+
+def test_candidate_lookup_sorted_once_per_pool(matching):
+    job = JobDescription(description='python flask developer')
+    candidates = make_candidates()
+
+    matching.match_candidates(job, candidates)
+    lookup = matching_service._candidate_lookups[matching.index_settings]
+    matching.match_candidates(job, candidates)
+    assert matching_service._candidate_lookups[matching.index_settings] is lookup
+
+    candidates.append(Candidate(id='candidate-new', resume_text='python flask developer', content_hash='f' * 64))
+    shortlist = matching.match_candidates(job, candidates)
+    assert matching_service._candidate_lookups[matching.index_settings] is not lookup
+    assert shortlist[0].id == 'candidate-new'
@@ -0,0 +1,39 @@
+import hashlib
+from app.models.candidate import Candidate
+from app.services.parse_cache import ParseCache, file_content_hash
+
+def write_resume(path, text):
+    path.write_text(text)
+    return path
+
+def test_hit_for_same_content_under_another_name(tmp_path):
+    cache = ParseCache(tmp_path / 'cache', parser_version='1-abc')
+    original = write_resume(tmp_path / 'alice.txt', 'Alice, python developer')
+    cache.put(original, Candidate(name='Alice', resume_text='Alice, python developer'))
+
+    copy = write_resume(tmp_path / 'alice_copy.txt', 'Alice, python developer')
+    cached = cache.get(copy)
+
+    assert cached.name == 'Alice'
+    assert cached.resume_text == 'Alice, python developer'
+    assert cached.resume_path == copy
+    assert cached.content_hash == hashlib.sha256(b'Alice, python developer').hexdigest()
+
+def test_miss_after_parser_version_change(tmp_path):
+    resume = write_resume(tmp_path / 'alice.txt', 'Alice, python developer')
+    ParseCache(tmp_path / 'cache', parser_version='1-abc').put(resume, Candidate(name='Alice'))
+
+    assert ParseCache(tmp_path / 'cache', parser_version='1-abc').contains(resume)
+    assert not ParseCache(tmp_path / 'cache', parser_version='2-abc').contains(resume)
+    assert ParseCache(tmp_path / 'cache', parser_version='1-def').get(resume) is None
+
+def test_miss_after_content_change(tmp_path):
+    cache = ParseCache(tmp_path / 'cache', parser_version='1-abc')
+    resume = write_resume(tmp_path / 'alice.txt', 'Alice, python developer')
+    cache.put(resume, Candidate(name='Alice'))
+
+    # The memoized digest of the old content must not be reused
+    write_resume(resume, 'Alice, senior python developer')
+
+    assert cache.get(resume) is None
+    assert file_content_hash(resume) == hashlib.sha256(b'Alice, senior python developer').hexdigest()
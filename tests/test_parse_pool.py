@@ -0,0 +1,108 @@
+import multiprocessing
+import os
+import time
+from pathlib import Path
+import pytest
+from app.models.candidate import Candidate
+from app.services import parse_pool
+from app.services.parse_pool import ParseOutcome, ResumeParsePool
+
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != 'fork',
+    reason="workers inherit the patched parser only when forked"
+)
+
+def fake_parse(file_path: Path) -> ParseOutcome:
+    """Behaves according to the file name; successful parses report the worker pid"""
+    if file_path.stem == 'slow':
+        time.sleep(30)
+    elif file_path.stem == 'crash':
+        os._exit(3)
+    elif file_path.stem == 'oom':
+        raise MemoryError
+    elif file_path.stem == 'huge':
+        bytearray(4 * 1024 ** 3)
+    elif file_path.stem == 'bad':
+        return ParseOutcome(file_path=file_path, error="Unreadable resume")
+    return ParseOutcome(file_path=file_path, candidate=Candidate(name=str(os.getpid())))
+
+@pytest.fixture
+def make_pool(monkeypatch):
+    monkeypatch.setattr(parse_pool, 'parse_resume_file', fake_parse)
+    pools = []
+
+    def make(**options):
+        pool = ResumeParsePool(**options)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+def worker_pid(outcome: ParseOutcome) -> int:
+    return int(outcome.candidate.name)
+
+def test_outcomes_keep_input_order(make_pool):
+    pool = make_pool(max_workers=3)
+    paths = [Path(f'resume{number}.txt') for number in range(10)]
+
+    outcomes = pool.parse_many(paths)
+
+    assert [outcome.file_path for outcome in outcomes] == paths
+    assert all(outcome.ok for outcome in outcomes)
+
+def test_pool_survives_timeout(make_pool):
+    pool = make_pool(max_workers=1, timeout=0.5)
+
+    slow, after = pool.parse_many([Path('slow.txt'), Path('after.txt')])
+
+    assert not slow.ok
+    assert 'timed out' in slow.error
+    assert after.ok
+
+def test_pool_survives_crash(make_pool):
+    pool = make_pool(max_workers=1)
+
+    before, crash, after = pool.parse_many([Path('before.txt'), Path('crash.txt'), Path('after.txt')])
+
+    assert before.ok and after.ok
+    assert 'crashed' in crash.error
+    assert worker_pid(after) != worker_pid(before)
+
+def test_failed_parse_keeps_worker(make_pool):
+    pool = make_pool(max_workers=1)
+
+    before, bad, after = pool.parse_many([Path('before.txt'), Path('bad.txt'), Path('after.txt')])
+
+    assert bad.error == "Unreadable resume"
+    assert worker_pid(after) == worker_pid(before)
+
+def test_memory_error_replaces_worker(make_pool):
+    pool = make_pool(max_workers=1)
+
+    before, oom, after = pool.parse_many([Path('before.txt'), Path('oom.txt'), Path('after.txt')])
+
+    assert oom.out_of_memory
+    assert after.ok
+    assert worker_pid(after) != worker_pid(before)
+
+def test_workers_recycled_after_max_tasks(make_pool):
+    pool = make_pool(max_workers=1, max_tasks_per_worker=2)
+
+    outcomes = pool.parse_many([Path(f'resume{number}.txt') for number in range(4)])
+
+    pids = [worker_pid(outcome) for outcome in outcomes]
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[0] != pids[2]
+
+def test_memory_limit_is_headroom_above_inherited_address_space(make_pool):
+    # Less than the address space the test process already maps
+    pool = make_pool(max_workers=1, memory_limit=256 * 1024 ** 2)
+
+    small, huge, after = pool.parse_many([Path('small.txt'), Path('huge.txt'), Path('after.txt')])
+
+    assert small.ok
+    assert huge.out_of_memory
+    assert after.ok
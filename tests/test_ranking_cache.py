@@ -0,0 +1,77 @@
+import io
+import pytest
+from app.models.candidate import Candidate
+from app.services.file_service import FileService
+from app.services.ranking_cache import RankingCache
+
+SETTINGS = {
+    'engine': 'tfidf',
+    'top_candidates_count': 10,
+    'similarity_threshold': 0.1,
+    'parser_version': '1-abc',
+    'preprocessor_version': '1',
+}
+
+@pytest.fixture
+def ranking_cache(app):
+    return RankingCache(max_entries=3)
+
+@pytest.fixture
+def job_file(tmp_path):
+    path = tmp_path / 'backend.txt'
+    path.write_text('Backend engineer: python, flask, postgres')
+    return path
+
+def test_key_depends_on_job_content_not_name(ranking_cache, job_file, tmp_path):
+    key = ranking_cache.key(job_file, 'v1', SETTINGS)
+
+    renamed = tmp_path / 'renamed.txt'
+    renamed.write_bytes(job_file.read_bytes())
+    assert ranking_cache.key(renamed, 'v1', SETTINGS) == key
+
+    job_file.write_text('Backend engineer: java, spring')
+    assert ranking_cache.key(job_file, 'v1', SETTINGS) != key
+
+def test_key_changes_with_corpus_version(ranking_cache, job_file):
+    assert ranking_cache.key(job_file, 'v1', SETTINGS) != ranking_cache.key(job_file, 'v2', SETTINGS)
+
+@pytest.mark.parametrize('setting, value', [
+    ('engine', 'hashing'),
+    ('top_candidates_count', 20),
+    ('similarity_threshold', 0.2),
+    ('parser_version', '2-abc'),
+    ('preprocessor_version', '2'),
+])
+def test_key_changes_with_settings(ranking_cache, job_file, setting, value):
+    changed = dict(SETTINGS, **{setting: value})
+    assert ranking_cache.key(job_file, 'v1', SETTINGS) != ranking_cache.key(job_file, 'v1', changed)
+
+def test_upload_invalidates_cached_ranking(app, ranking_cache, job_file, tmp_path):
+    app.config['UPLOAD_FOLDER'] = tmp_path / 'uploads'
+    file_service = FileService()
+    key = ranking_cache.key(job_file, file_service.corpus_version(), SETTINGS)
+    ranking_cache.set(key, [Candidate(name='Alice', score=0.5, rank=1)])
+
+    file_service.store_stream(io.BytesIO(b'Bob, python developer'), 'bob.txt')
+
+    new_key = ranking_cache.key(job_file, file_service.corpus_version(), SETTINGS)
+    assert new_key != key
+    assert ranking_cache.get(new_key) is None
+
+def test_round_trip(ranking_cache, job_file):
+    key = ranking_cache.key(job_file, 'v1', SETTINGS)
+    assert ranking_cache.get(key) is None
+
+    ranking_cache.set(key, [Candidate(name='Alice', score=0.5, rank=1), Candidate(name='Bob', score=0.3, rank=2)])
+
+    cached = ranking_cache.get(key)
+    assert [(candidate.name, candidate.score, candidate.rank) for candidate in cached] == [
+        ('Alice', 0.5, 1), ('Bob', 0.3, 2)
+    ]
+
+def test_oldest_entries_evicted_beyond_max_entries(ranking_cache, job_file):
+    keys = [ranking_cache.key(job_file, f'v{number}', SETTINGS) for number in range(5)]
+    for key in keys:
+        ranking_cache.set(key, [Candidate(name='Alice')])
+
+    assert [ranking_cache.get(key) is not None for key in keys] == [False, False, True, True, True]
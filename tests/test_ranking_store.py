@@ -0,0 +1,67 @@
+import pytest
+from app.extensions import cache
+from app.models.candidate import Candidate
+from app.services.ranking_store import RankingStore
+from app.utils.exceptions import ValidationError
+
+def make_ranking(count):
+    return [Candidate(id=f'candidate-{rank}', score=1.0 - rank / 1000, rank=rank) for rank in range(1, count + 1)]
+
+@pytest.fixture
+def store(app):
+    return RankingStore(chunk_size=7)
+
+def read_all(store, ranking_id, limit):
+    pages = []
+    cursor = None
+    while True:
+        page = store.page(ranking_id, cursor, limit)
+        pages.append(page)
+        cursor = page['next_cursor']
+        if cursor is None:
+            return pages
+
+@pytest.mark.parametrize('count', [0, 1, 7, 20, 21])
+@pytest.mark.parametrize('limit', [1, 5, 7, 50])
+def test_cursor_paging_covers_ranking_exactly_once(store, count, limit):
+    ranking = make_ranking(count)
+    ranking_id = store.save('Backend engineer', ranking)
+
+    pages = read_all(store, ranking_id, limit)
+
+    ids = [candidate['id'] for page in pages for candidate in page['candidates']]
+    assert ids == [candidate.id for candidate in ranking]
+    assert all(len(page['candidates']) <= limit for page in pages)
+    assert all(page['total'] == count for page in pages)
+    assert [candidate['rank'] for page in pages for candidate in page['candidates']] == list(range(1, count + 1))
+
+def test_resume_text_not_stored(store):
+    ranking = make_ranking(3)
+    ranking[0].resume_text = 'full resume text'
+    ranking_id = store.save('Backend engineer', ranking)
+
+    page = store.page(ranking_id)
+
+    assert 'resume_text' not in page['candidates'][0]
+    assert page['job_description'] == 'Backend engineer'
+
+def test_unknown_ranking(store):
+    assert store.get('missing') is None
+    assert store.page('missing') is None
+
+def test_cursor_bound_to_its_ranking(store):
+    first = store.save('Backend engineer', make_ranking(10))
+    second = store.save('Data scientist', make_ranking(10))
+    cursor = store.page(first, limit=5)['next_cursor']
+
+    with pytest.raises(ValidationError):
+        store.page(second, cursor)
+    with pytest.raises(ValidationError):
+        store.page(first, 'not-a-cursor')
+
+def test_evicted_chunk_expires_ranking(store):
+    ranking_id = store.save('Backend engineer', make_ranking(20))
+    cache.delete(store._chunk_key(ranking_id, 1))
+
+    assert store.page(ranking_id, limit=5) is not None
+    assert store.page(ranking_id, limit=10) is None
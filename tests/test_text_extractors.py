@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from app.services import text_extractors as app_text_extractors
+from core import text_extractors
+from core.text_extractors import TextExtractionError, TextExtractorChain, register_extractor
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+@pytest.fixture
+def fake_extractors(monkeypatch):
+    monkeypatch.setattr(text_extractors, '_registry', dict(text_extractors._registry))
+    register_extractor('failing', ['.txt'])(lambda path: 1 / 0)
+    register_extractor('empty', ['.txt'])(lambda path: '  \n')
+    register_extractor('upper', ['.txt'])(lambda path: path.read_text().upper())
+
+def test_importable_without_the_app():
+    # screen.py and core.functions use the registry without app settings
+    env = {key: value for key, value in os.environ.items() if key not in ('SECRET_KEY', 'DATABASE_URL')}
+    code = "import sys, core.text_extractors; assert 'app' not in sys.modules and 'flask' not in sys.modules"
+    subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, env=env, check=True)
+
+def test_app_module_shares_the_chain():
+    assert app_text_extractors.get_extractor_chain() is text_extractors.get_extractor_chain()
+    assert app_text_extractors.TextExtractorChain is TextExtractorChain
+
+def test_chain_falls_back_in_order(fake_extractors, tmp_path):
+    resume = tmp_path / 'resume.txt'
+    resume.write_text('python developer')
+
+    result = TextExtractorChain({'.txt': ['failing', 'empty', 'upper']}).extract(resume)
+
+    assert result.text == 'PYTHON DEVELOPER'
+    assert result.extractor == 'upper'
+
+def test_chain_reports_every_failure(fake_extractors, tmp_path):
+    resume = tmp_path / 'resume.txt'
+    resume.write_text('python developer')
+
+    with pytest.raises(TextExtractionError, match='failing.*empty'):
+        TextExtractorChain({'.txt': ['failing', 'empty']}).extract(resume)
+    with pytest.raises(TextExtractionError):
+        TextExtractorChain({'.txt': ['upper']}).extract(tmp_path / 'resume.pdf')
+
+def test_legacy_chains_start_with_the_original_backends():
+    assert text_extractors.LEGACY_EXTRACTOR_CHAINS['.pdf'][0] == 'pdfminer'
+    assert text_extractors.LEGACY_EXTRACTOR_CHAINS['.docx'][0] == 'docx2txt'
+    assert text_extractors.LEGACY_EXTRACTOR_CHAINS['.doc'][0] == 'docx2txt'
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('inflect')
+
+import text_process
+from text_process import Normalizer, normalize
+from app.services.tfidf_index import TfidfCorpusIndex
+
+DOCUMENTS = [
+    "Jane Doe , Senior Python Developer , jane.doe@example.com , 5 years".split(),
+    "Developed and deployed machine-learning services ; led a team of 12 engineers .".split(),
+    "Managed Kubernetes clusters , Docker images and CI/CD pipelines ; 25 % faster".split(),
+    "Café résumé : naïve Bayes classifiers , running experiments and writing reports".split(),
+    "Responsible for running tests , writing documentation and reviewing pull requests".split(),
+    "!!! ... ---".split(),
+    [],
+]
+
+JOB = "Python developer with machine learning , Kubernetes and 5 years experience".split()
+
+class FakeStopwords:
+    def words(self, language):
+        return ['the', 'and', 'for', 'with', 'a', 'of', 'on']
+
+class FakeLemmatizer:
+    """Deterministic stand-in for WordNet when its data is not installed"""
+
+    def lemmatize(self, word, pos='n'):
+        return word[:-1] if word.endswith('s') and not word.endswith('ss') else word
+
+@pytest.fixture(params=['nltk', 'fake'], autouse=True)
+def nltk_data(request, monkeypatch):
+    if request.param == 'nltk':
+        import nltk
+        try:
+            for resource in ('corpora/stopwords', 'corpora/wordnet'):
+                nltk.data.find(resource)
+        except LookupError:
+            pytest.skip("NLTK data is not installed")
+        return
+
+    monkeypatch.setattr(text_process, 'stopwords', FakeStopwords())
+    monkeypatch.setattr(text_process, 'WordNetLemmatizer', FakeLemmatizer)
+
+def test_normalizer_matches_normalize():
+    normalizer = Normalizer()
+
+    for words in DOCUMENTS + [JOB]:
+        assert normalizer.normalize(words) == normalize(words)
+    # Second pass served from the token cache
+    assert list(normalizer.normalize_documents(DOCUMENTS)) == [normalize(words) for words in DOCUMENTS]
+
+def test_ranking_matches_normalize():
+    normalizer = Normalizer()
+
+    def rank(normalized_documents, normalized_job):
+        index = TfidfCorpusIndex()
+        index.add_many([str(number) for number in range(len(DOCUMENTS))],
+                       [' '.join(words) for words in normalized_documents])
+        scores = index.similarities(' '.join(normalized_job))
+        return np.argsort(-scores, kind='stable'), scores
+
+    legacy_order, legacy_scores = rank([normalize(words) for words in DOCUMENTS], normalize(JOB))
+    order, scores = rank(normalizer.normalize_documents(DOCUMENTS), normalizer(JOB))
+
+    np.testing.assert_array_equal(order, legacy_order)
+    np.testing.assert_array_equal(scores, legacy_scores)
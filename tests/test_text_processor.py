@@ -0,0 +1,103 @@
+import hashlib
+import re
+from functools import partial
+import pytest
+from app.models.candidate import Candidate
+from app.models.job_description import JobDescription
+from app.services import matching_service
+from app.services.matching_service import ResumeMatchingService
+from app.utils import text_processor
+from app.utils.text_processor import TextProcessor
+
+DOCUMENTS = [
+    "Jane Doe - Senior Python Developer. E-mail: jane.doe@example.com, +1 (555) 010-2030",
+    "Developed and deployed machine-learning services on AWS; led a team of 5 engineers (2019-2023).",
+    "I cannot stress enough: we're gonna ship it. Wanna help? Gimme a call, lemme know, gotta go!",
+    "B.Sc. Computer Science, M.Sc. Data Science -- university projects in NLP & information retrieval",
+    "Managed Kubernetes clusters, Docker images and CI/CD pipelines; increased deployment frequency 25%",
+    "Frontend engineer: React, TypeScript, GraphQL. Built dashboards for customers' analytics teams.",
+    "Responsible for running tests, writing documentation and reviewing pull requests daily.",
+    "",
+]
+
+JOB = "Python developer with machine learning, AWS and Kubernetes experience; led engineering teams"
+
+FAKE_STOPWORDS = {'the', 'and', 'for', 'with', 'was', 'not', 'you', 'our', 'are', 'can'}
+
+class FakeLemmatizer:
+    """Deterministic stand-in for WordNet when its data is not installed"""
+
+    def lemmatize(self, word):
+        return word[:-1] if word.endswith('s') and not word.endswith('ss') else word
+
+@pytest.fixture(params=['nltk', 'fake'])
+def pipeline(request, monkeypatch):
+    """(processor, word tokenizer) backed by the NLTK data, or by fakes where it is missing"""
+    text_processor._lemmatize.cache_clear()
+    request.addfinalizer(text_processor._lemmatize.cache_clear)
+
+    if request.param == 'nltk':
+        from nltk.tokenize import word_tokenize
+        try:
+            import nltk
+            for resource in ('corpora/stopwords', 'corpora/wordnet'):
+                nltk.data.find(resource)
+            word_tokenize('probe text')
+        except LookupError:
+            pytest.skip("NLTK data is not installed")
+        return TextProcessor(), word_tokenize
+
+    from nltk.tokenize import word_tokenize
+    processor = TextProcessor.__new__(TextProcessor)
+    processor.stop_words = FAKE_STOPWORDS
+    processor.lemmatizer = FakeLemmatizer()
+    monkeypatch.setattr(text_processor, '_lemmatizer', processor.lemmatizer)
+    # The cleaned text has no sentence punctuation left, so skipping the punkt
+    # sentence split (which needs NLTK data) does not change the tokens
+    return processor, partial(word_tokenize, preserve_line=True)
+
+def legacy_preprocess(processor, tokenize, text):
+    """The pipeline TextProcessor.preprocess used before the fast path"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    tokens = tokenize(text)
+    return ' '.join(
+        processor.lemmatizer.lemmatize(token)
+        for token in tokens
+        if token not in processor.stop_words and len(token) > 2
+    )
+
+class LegacyTextProcessor:
+    def __init__(self, processor, tokenize):
+        self.preprocess = partial(legacy_preprocess, processor, tokenize)
+
+def test_preprocess_matches_legacy_pipeline(pipeline):
+    processor, tokenize = pipeline
+
+    for text in DOCUMENTS + [JOB]:
+        assert processor.preprocess(text) == legacy_preprocess(processor, tokenize, text)
+    assert processor.preprocess_batch(DOCUMENTS) == [
+        legacy_preprocess(processor, tokenize, text) for text in DOCUMENTS
+    ]
+
+@pytest.mark.parametrize('similarity_threshold', [0.0, 0.05])
+def test_ranking_matches_legacy_pipeline(app, pipeline, monkeypatch, similarity_threshold):
+    processor, tokenize = pipeline
+
+    def rank(text_processor_instance):
+        # A fresh corpus index, so no vectors are shared between the two runs
+        monkeypatch.setattr(matching_service, '_corpus_indexes', {})
+        monkeypatch.setattr(matching_service, 'TextProcessor', lambda: text_processor_instance)
+        service = ResumeMatchingService(top_candidates_count=4, similarity_threshold=similarity_threshold)
+        candidates = [
+            Candidate(id=f'candidate-{number}', resume_text=text,
+                      content_hash=hashlib.sha256(f'{number}:{text}'.encode('utf-8')).hexdigest())
+            for number, text in enumerate(DOCUMENTS)
+        ]
+        shortlist = service.match_candidates(JobDescription(description=JOB), candidates)
+        return [(candidate.id, candidate.rank, candidate.score) for candidate in shortlist]
+
+    assert rank(processor) == rank(LegacyTextProcessor(processor, tokenize))
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from app.services.tfidf_index import TfidfCorpusIndex
+
+DOCUMENTS = {
+    'a': 'python developer with flask and sqlalchemy experience',
+    'b': 'java developer building spring boot services',
+    'c': 'data scientist using python pandas and scikit learn',
+    'd': 'frontend engineer writing react and typescript',
+    'e': 'python flask developer deploying services on kubernetes',
+}
+
+def reference_matrix(index, texts, **options):
+    """TfidfVectorizer fitted on texts, with columns reordered to the index vocabulary"""
+    vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2), **options)
+    expected = vectorizer.fit_transform(texts).toarray()
+    columns = [index.vocabulary[term] for term in vectorizer.get_feature_names_out()]
+
+    reordered = np.zeros((len(texts), len(index.vocabulary)))
+    reordered[:, columns] = expected
+    return reordered, set(vectorizer.get_feature_names_out())
+
+def test_matches_vectorizer_after_add():
+    index = TfidfCorpusIndex(max_features=None)
+    index.add_many(list(DOCUMENTS), list(DOCUMENTS.values()))
+
+    expected, _ = reference_matrix(index, list(DOCUMENTS.values()))
+    np.testing.assert_allclose(index.matrix.toarray(), expected)
+
+def test_matches_vectorizer_after_remove():
+    index = TfidfCorpusIndex(max_features=None)
+    index.add_many(list(DOCUMENTS), list(DOCUMENTS.values()))
+    index.matrix
+    index.remove('b')
+    index.remove('d')
+    actual = index.matrix.toarray()
+
+    remaining = [DOCUMENTS[doc_id] for doc_id in index.doc_ids]
+    expected, features = reference_matrix(index, remaining)
+
+    # Terms only the removed documents contained are dropped from the vocabulary
+    assert set(index.vocabulary) == features
+    assert 'spring' not in index.vocabulary
+    np.testing.assert_allclose(actual, expected)
+
+def test_replacing_a_document_matches_vectorizer():
+    index = TfidfCorpusIndex(max_features=None)
+    index.add_many(list(DOCUMENTS), list(DOCUMENTS.values()))
+    index.add('c', 'golang developer building services')
+    actual = index.matrix.toarray()
+
+    texts = [DOCUMENTS[doc_id] for doc_id in index.doc_ids if doc_id != 'c'] + ['golang developer building services']
+    expected, _ = reference_matrix(index, texts)
+    np.testing.assert_allclose(actual, expected)
+
+def test_transform_matches_vectorizer():
+    index = TfidfCorpusIndex(max_features=None)
+    index.add_many(list(DOCUMENTS), list(DOCUMENTS.values()))
+    query = 'senior python developer with kubernetes experience'
+
+    vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
+    vectorizer.fit(list(DOCUMENTS.values()))
+    expected = np.zeros(len(index.vocabulary))
+    columns = [index.vocabulary[term] for term in vectorizer.get_feature_names_out()]
+    expected[columns] = vectorizer.transform([query]).toarray().ravel()
+
+    np.testing.assert_allclose(index.transform([query]).toarray().ravel(), expected)
+
+@pytest.mark.parametrize('max_features', [3, 8, 20])
+def test_max_features_selection_ignores_insertion_order(max_features):
+    forward = TfidfCorpusIndex(max_features=max_features)
+    forward.add_many(list(DOCUMENTS), list(DOCUMENTS.values()))
+    backward = TfidfCorpusIndex(max_features=max_features)
+    backward.add_many(list(DOCUMENTS)[::-1], list(DOCUMENTS.values())[::-1])
+
+    def selected_terms(index):
+        weights = index.matrix.toarray().any(axis=0)
+        return {term for term, column in index.vocabulary.items() if weights[column]}
+
+    assert len(selected_terms(forward)) == max_features
+    assert selected_terms(forward) == selected_terms(backward)
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+from core import text_extractors
+from app import create_app
+from app.config.settings import TestingConfig
+from app.services import matching_service
+from app.services.matching_service import (corpus_index_options, corpus_index_settings, get_corpus_index,
+                                           preload_corpus_index)
+from app.services.resume_parser import parser_fingerprint
+from app.services.tfidf_index import TfidfCorpusIndex
+from app.services.vector_store import VectorStore
+
+DOCUMENTS = {
+    'a': 'python developer with flask experience',
+    'b': 'java developer building spring services',
+    'c': 'data scientist using python and pandas',
+}
+
+def build_index():
+    index = TfidfCorpusIndex()
+    index.add_many(list(DOCUMENTS), list(DOCUMENTS.values()))
+    return index
+
+def test_settings_change_with_parser_and_preprocessor_versions():
+    settings = corpus_index_settings(parser_version='1-abc', preprocessor_version='1')
+
+    assert corpus_index_settings(parser_version='2-abc', preprocessor_version='1') != settings
+    assert corpus_index_settings(parser_version='1-abc', preprocessor_version='2') != settings
+    assert corpus_index_settings(parser_version='1-abc', preprocessor_version='1') == settings
+
+def test_parser_fingerprint_follows_extractor_chains(monkeypatch):
+    monkeypatch.setattr(text_extractors, '_extractor_chain', None)
+    default = parser_fingerprint()
+
+    text_extractors.configure_extractor_chain({'.pdf': ['pdfminer'], '.docx': ['docx2txt']})
+
+    assert parser_fingerprint() != default
+
+def test_round_trip_restores_index(tmp_path):
+    store = VectorStore(tmp_path)
+    settings = corpus_index_settings(parser_version='1-abc', preprocessor_version='1')
+    index = build_index()
+    version = store.save(settings, index)
+
+    restored = TfidfCorpusIndex()
+    assert store.load(settings, restored) == version
+
+    assert restored.doc_ids == index.doc_ids
+    np.testing.assert_allclose(restored.matrix.toarray(), index.matrix.toarray())
+    query = 'python flask developer'
+    np.testing.assert_allclose(restored.similarities(query), index.similarities(query))
+
+@pytest.mark.parametrize('changed', [
+    {'parser_version': '2-abc', 'preprocessor_version': '1'},
+    {'parser_version': '1-abc', 'preprocessor_version': '2'},
+])
+def test_snapshot_not_reused_across_versions(tmp_path, changed):
+    store = VectorStore(tmp_path)
+    store.save(corpus_index_settings(parser_version='1-abc', preprocessor_version='1'), build_index())
+
+    settings = corpus_index_settings(**changed)
+    assert store.current_version(settings) is None
+    assert store.load(settings, TfidfCorpusIndex()) is None
+
+def test_corpus_index_per_version():
+    first = get_corpus_index(parser_version='test-1', preprocessor_version='1')
+
+    assert get_corpus_index(parser_version='test-1', preprocessor_version='1') is first
+    assert get_corpus_index(parser_version='test-2', preprocessor_version='1') is not first
+    assert get_corpus_index(parser_version='test-1', preprocessor_version='2') is not first
+
+def test_prune_keeps_recent_versions(tmp_path):
+    store = VectorStore(tmp_path, keep_versions=2)
+    settings = corpus_index_settings(parser_version='1-abc', preprocessor_version='1')
+    index = build_index()
+
+    versions = [store.save(settings, index) for _ in range(4)]
+
+    settings_folder = store._settings_folder(settings)
+    remaining = sorted(path.name for path in settings_folder.iterdir() if path.is_dir())
+    assert remaining == versions[-2:]
+    assert store.current_version(settings) == versions[-1]
+
+@pytest.fixture
+def preload_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(TestingConfig, 'VECTOR_STORE_ENABLED', True)
+    monkeypatch.setattr(TestingConfig, 'VECTOR_STORE_PRELOAD', True)
+    monkeypatch.setattr(TestingConfig, 'VECTOR_STORE_FOLDER', tmp_path / 'vector_store')
+    monkeypatch.setattr(matching_service, '_corpus_indexes', {})
+    return {'VECTOR_STORE_ENABLED': True, 'VECTOR_STORE_FOLDER': tmp_path / 'vector_store'}
+
+def test_create_app_maps_current_snapshot(preload_config):
+    settings = corpus_index_settings(**corpus_index_options(preload_config))
+    VectorStore(preload_config['VECTOR_STORE_FOLDER']).save(settings, build_index())
+
+    create_app('testing')
+
+    index = matching_service._corpus_indexes[settings]
+    # Restored from the snapshot, with nothing left to rebuild on the first query
+    assert index.doc_ids == list(DOCUMENTS)
+    assert not index._dirty
+
+def test_preload_without_snapshot_builds_nothing(preload_config):
+    assert not preload_corpus_index(preload_config)
+    assert matching_service._corpus_indexes == {}
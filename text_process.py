@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 import unicodedata
 import inflect
 import nltk
@@ -77,6 +78,72 @@ def lemmatize_verbs(words):
     return lemmas
 
 
+class Normalizer(object):
+    '''
+    Reusable normalizer that runs the same stages as normalize() in one pass per
+    token. The stopword set, inflect engine, stemmer and lemmatizer are loaded
+    once, and the result for each distinct token is memoized, so repeated words
+    across a batch of documents are only normalized once.
+    :param cache_size: number of distinct tokens whose result is memoized
+    '''
+
+    _PUNCTUATION = re.compile(r'[^\w\s]')
+
+    def __init__(self, cache_size=100000):
+        self.stop_words = frozenset(stopwords.words('english'))
+        self.inflect_engine = inflect.engine()
+        self.stemmer = LancasterStemmer()
+        self.lemmatizer = WordNetLemmatizer()
+        self._normalize_word = lru_cache(maxsize=cache_size)(self._normalize_word_uncached)
+
+    def _normalize_word_uncached(self, word):
+        '''
+        Normalize a single token
+        :param word: raw token
+        :return: normalized token, or None when the token is dropped
+        '''
+        word = unicodedata.normalize('NFKD', word).encode('ascii', 'ignore').decode('utf-8', 'ignore')
+        word = self._PUNCTUATION.sub('', word.lower())
+        if word == '':
+            return None
+        if word.isdigit():
+            word = self.inflect_engine.number_to_words(word)
+        if word in self.stop_words:
+            return None
+        return self.lemmatizer.lemmatize(self.stemmer.stem(word), pos='v')
+
+    def iter_normalize(self, words):
+        '''
+        Lazily normalize a stream of tokens
+        :param words: iterable of tokenized words
+        :return: generator of normalized words
+        '''
+        normalize_word = self._normalize_word
+        for word in words:
+            word = normalize_word(word)
+            if word is not None:
+                yield word
+
+    def normalize(self, words):
+        '''
+        Normalize tokenized words, same output as normalize()
+        :param words: list of tokenized words
+        :return: list of normalized words
+        '''
+        return list(self.iter_normalize(words))
+
+    __call__ = normalize
+
+    def normalize_documents(self, documents):
+        '''
+        Normalize a stream of tokenized documents, sharing resources and the token cache
+        :param documents: iterable of token lists
+        :return: generator of normalized token lists, in input order
+        '''
+        for words in documents:
+            yield self.normalize(words)
+
+
 def normalize(words):
     words = remove_non_ascii(words)
     words = to_lowercase(words)
@@ -88,9 +155,10 @@ def normalize(words):
     return words
 
 
-words = str("jabscjbjb ")
-words = nltk.word_tokenize(words)
-words = normalize(words)
-print(words)
-words = ' '.join(map(str, words))
-print(words)
+if __name__ == '__main__':
+    words = str("jabscjbjb ")
+    words = nltk.word_tokenize(words)
+    words = Normalizer().normalize(words)
+    print(words)
+    words = ' '.join(map(str, words))
+    print(words)